@@ -1,7 +1,23 @@
-import requests
+import argparse
+import os
 import re
+import sys
 from bs4 import BeautifulSoup
-import time
+
+# Shared raw HTML cache lives with the IDWeek 2025 crawler modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'IDWEEK2025', 'py'))
+from html_cache import HTMLCache
+from adaptive_throttle import AdaptiveThrottle
+
+arg_parser = argparse.ArgumentParser(description='Crawl ECCMID 2024 programme session codes')
+arg_parser.add_argument('--offline', action='store_true', help='Replay pages from the raw HTML cache without network access')
+args = arg_parser.parse_args()
+
+cache = HTMLCache(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'html_cache'))
+
+# Start at the old fixed pace of one page every 12s; speed up while key4 answers quickly,
+# back off on 429/5xx and honor Retry-After
+throttle = AdaptiveThrottle(initial_rate=1 / 12, max_rate=1.0, increase_step=0.05)
 
 # List of URLs
 urls = [
@@ -16,8 +32,8 @@ urls = [
 with open('eccmid_sessions.txt', 'w', encoding='utf-8') as file:
     # Loop through the URLs
     for url in urls:
-        html = requests.get(url)
-        soup = BeautifulSoup(html.text, 'html.parser')
+        html = cache.get(url, offline=args.offline, throttle=throttle)
+        soup = BeautifulSoup(html, 'html.parser')
 
         # ... (existing code for data extraction)
         program_session_card_references = soup.find_all('span', class_='program-session-card-reference')
@@ -26,7 +42,4 @@ with open('eccmid_sessions.txt', 'w', encoding='utf-8') as file:
             output_line = f"Code: {program_session_code}\n"
             file.write(output_line)  # Write the output to the file
         
-            # print(f"Code: {program_session_code}")
-
-        # Delay between requests (e.g., 5 seconds)
-        time.sleep(12)
\ No newline at end of file
+            # print(f"Code: {program_session_code}")
\ No newline at end of file
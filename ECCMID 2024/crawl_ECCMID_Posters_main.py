@@ -1,7 +1,19 @@
-import requests
+import argparse
+import os
 import re
+import sys
 from bs4 import BeautifulSoup
 
+# Shared raw HTML cache lives with the IDWeek 2025 crawler modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'IDWEEK2025', 'py'))
+from html_cache import HTMLCache
+
+arg_parser = argparse.ArgumentParser(description='Crawl ECCMID 2024 poster listings')
+arg_parser.add_argument('--offline', action='store_true', help='Replay pages from the raw HTML cache without network access')
+args = arg_parser.parse_args()
+
+cache = HTMLCache(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'html_cache'))
+
 # List of URLs
 urls = [
     'https://online.eccmid.org/programme-live-1?programType=listing&embed=1&typeHideAllBut=55&page=1&orderBy=1'
@@ -11,8 +23,8 @@ urls = [
 with open('eccmid_posters_2023_03_28.txt', 'w', encoding='iso-8859-15') as file:
     # Loop through the URLs
     for url in urls:
-        html = requests.get(url)
-        soup = BeautifulSoup(html.text, 'html.parser')
+        html = cache.get(url, offline=args.offline)
+        soup = BeautifulSoup(html, 'html.parser')
 
         # Find all divs with class 'session-row'
         session_rows = soup.find_all('div', class_='session-row')
@@ -3,6 +3,12 @@ from bs4 import BeautifulSoup
 import re
 from datetime import datetime
 import logging
+import os
+import sys
+
+# Shared date/time patterns live with the IDWeek 2025 parser modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'IDWEEK2025', 'py'))
+from datetime_normalizer import DAY_MONTH_RE, TIME_RANGE_24H_RE, normalize_schedule
 
 # Set up logging
 logging.basicConfig(
@@ -11,6 +17,10 @@ logging.basicConfig(
     filename='eccmid_extraction.log'
 )
 
+# Session headers print day/month only, in the congress's local time
+CONFERENCE_YEAR = 2025
+CONFERENCE_TIMEZONE = 'CET'
+
 # Database connection configuration
 DB_CONFIG = {
     'host': 'localhost',
@@ -59,6 +69,8 @@ def extract_session_data(html_content):
             'session_time_start': None,
             'session_time_end': None,
             'session_timezone': None,
+            'start_datetime': '',
+            'end_datetime': '',
             'session_category': None,
             'session_description': None,
             'session_organized_by': None,
@@ -97,11 +109,11 @@ def extract_session_data(html_content):
                     data['session_hall'] = f"Hall {hall_match.group(1)}"
                 
                 # Extract date and time
-                date_match = re.search(r'(\d{2}/\d{2})', location_text)
+                date_match = DAY_MONTH_RE.search(location_text)
                 if date_match:
-                    data['session_date'] = date_match.group(1)
+                    data['session_date'] = date_match.group(0)
                 
-                time_match = re.search(r'(\d{2}:\d{2})\s*-\s*(\d{2}:\d{2})', location_text)
+                time_match = TIME_RANGE_24H_RE.search(location_text)
                 if time_match:
                     data['session_time_start'] = time_match.group(1)
                     data['session_time_end'] = time_match.group(2)
@@ -110,6 +122,15 @@ def extract_session_data(html_content):
             timezone_elem = header_div.select_one('.modal-session-abbr-timezone')
             if timezone_elem:
                 data['session_timezone'] = timezone_elem.text.strip()
+            
+            # ISO start/end datetimes from the day/month, times and timezone
+            if data['session_date'] and data['session_time_start']:
+                data.update(normalize_schedule(
+                    data['session_date'],
+                    f"{data['session_time_start']} - {data['session_time_end']}",
+                    data['session_timezone'] or CONFERENCE_TIMEZONE,
+                    default_year=CONFERENCE_YEAR
+                ))
         
         # Get category
         category_elem = soup.select_one('.modal-cat-name')
@@ -188,6 +209,8 @@ def format_extracted_data(data):
         'session_time_start': data.get('session_time_start'),
         'session_time_end': data.get('session_time_end'),
         'session_timezone': data.get('session_timezone'),
+        'start_datetime': data.get('start_datetime'),
+        'end_datetime': data.get('end_datetime'),
         'session_category': data.get('session_category'),
         'session_description': data.get('session_description'),
         'session_organized_by': data.get('session_organized_by'),
@@ -273,6 +296,8 @@ def process_all_records():
                 session_time_start VARCHAR(50),
                 session_time_end VARCHAR(50),
                 session_timezone VARCHAR(50),
+                start_datetime VARCHAR(32),
+                end_datetime VARCHAR(32),
                 session_category VARCHAR(255),
                 session_description TEXT,
                 session_organized_by VARCHAR(255),
@@ -324,9 +349,10 @@ def process_all_records():
                 INSERT INTO ECC_Extracted (
                     id, session_id, session_type, session_title, session_hall, 
                     session_date, session_time_start, session_time_end, session_timezone,
+                    start_datetime, end_datetime,
                     session_category, session_description, session_organized_by,
                     session_chairs, session_presentations
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """
                 insert_params = (
                     record_id, 
@@ -338,6 +364,8 @@ def process_all_records():
                     formatted_data.get('session_time_start'),
                     formatted_data.get('session_time_end'),
                     formatted_data.get('session_timezone'),
+                    formatted_data.get('start_datetime'),
+                    formatted_data.get('end_datetime'),
                     formatted_data.get('session_category'),
                     formatted_data.get('session_description'),
                     formatted_data.get('session_organized_by'),
@@ -379,6 +407,8 @@ def process_all_records():
                 ADD COLUMN IF NOT EXISTS sessionTimeStart VARCHAR(50),
                 ADD COLUMN IF NOT EXISTS sessionTimeEnd VARCHAR(50),
                 ADD COLUMN IF NOT EXISTS sessionTimezone VARCHAR(50),
+                ADD COLUMN IF NOT EXISTS sessionStartDatetime VARCHAR(32),
+                ADD COLUMN IF NOT EXISTS sessionEndDatetime VARCHAR(32),
                 ADD COLUMN IF NOT EXISTS sessionCategory VARCHAR(255),
                 ADD COLUMN IF NOT EXISTS sessionDescription TEXT,
                 ADD COLUMN IF NOT EXISTS sessionOrganizedBy VARCHAR(255),
@@ -397,6 +427,8 @@ def process_all_records():
                     e.sessionLocalStart = ex.session_time_start,
                     e.sessionLocalEnd = ex.session_time_end,
                     e.sessionTimezone = ex.session_timezone,
+                    e.sessionStartDatetime = ex.start_datetime,
+                    e.sessionEndDatetime = ex.end_datetime,
                     e.sessionCategory = ex.session_category,
                     e.sessionDescription = ex.session_description,
                     e.sessionOrganizedBy = ex.session_organized_by,
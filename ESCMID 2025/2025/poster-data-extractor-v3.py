@@ -5,6 +5,7 @@
 import os
 import re
 import json
+import sys
 import argparse
 from bs4 import BeautifulSoup
 import mysql.connector
@@ -130,6 +131,22 @@ def save_to_json(posters, output_file='posters.json'):
     
     print(f"Saved {len(posters)} posters to {output_file}")
 
+def save_to_store(posters, store_dir, year=2025):
+    """
+    Save extracted poster data to the partitioned Parquet conference store.
+    
+    Args:
+        posters (list): List of dictionaries containing poster data
+        store_dir (str): Store directory (conference=ESCMID/year=.../entity=... partitions)
+        year (int): Conference year
+    """
+    # The store module lives with the IDWeek 2025 parser modules
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'IDWEEK2025', 'py'))
+    from conference_store import escmid_poster_tables, write_store
+    
+    paths = write_store(escmid_poster_tables(posters, year), 'ESCMID', year, store_dir)
+    print(f"Saved {len(posters)} posters to {len(paths)} store partitions in {store_dir}")
+
 def save_to_mysql(posters, config):
     """
     Save extracted poster data to a MySQL database.
@@ -241,6 +258,8 @@ def main():
     parser.add_argument('--user', default='root', help='MySQL username (default: root)')
     parser.add_argument('--password', default='', help='MySQL password')
     parser.add_argument('--database', default='posters_db', help='MySQL database name (default: posters_db)')
+    parser.add_argument('--store', help='Also save to the partitioned Parquet conference store in this directory')
+    parser.add_argument('--year', type=int, default=2025, help='Conference year for the store (default: 2025)')
     
     args = parser.parse_args()
     
@@ -271,6 +290,9 @@ def main():
     else:
         # Save to JSON
         save_to_json(posters, args.output)
+    
+    if args.store:
+        save_to_store(posters, args.store, args.year)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
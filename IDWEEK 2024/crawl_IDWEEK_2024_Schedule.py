@@ -1,6 +1,11 @@
+import os
+import sys
 import requests
 from bs4 import BeautifulSoup
-import re
+
+# Shared date/time patterns live with the IDWeek 2025 parser modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'IDWEEK2025', 'py'))
+from datetime_normalizer import CLOCK_12H_RE, normalize_schedule
 
 def extract_schedule_info(html_file, output_file):
     with open(html_file, 'r', encoding='utf-8') as file:
@@ -12,11 +17,16 @@ def extract_schedule_info(html_file, output_file):
         for item in items:
             # Extract prestime
             prestime = item.find('div', class_='prestime').text.strip()
-            time_parts = re.findall(r'\d+:\d+ [AP]M', prestime)
+            time_parts = CLOCK_12H_RE.findall(prestime)
             start_time = time_parts[0] if time_parts else "N/A"
             end_time = time_parts[1] if len(time_parts) > 1 else "N/A"
             time_zone = "US PT"  # Fixed time zone as per your instruction
 
+            # Date from the day heading above the item ("Tuesday, October 15, 2024")
+            dayrow = item.find_previous('li', class_='dayrow')
+            date = dayrow.text.strip() if dayrow else ""
+            schedule = normalize_schedule(date, prestime, time_zone)
+
             # Extract meeting number and title
             number_title = item.find('div', class_='number-title')
             meeting_number = number_title.text.split('-')[0].strip() if number_title else "N/A"
@@ -41,6 +51,9 @@ def extract_schedule_info(html_file, output_file):
             outfile.write(f"Start Time: {start_time}\n")
             outfile.write(f"End Time: {end_time}\n")
             outfile.write(f"Time Zone: {time_zone}\n")
+            outfile.write(f"Date: {date or 'N/A'}\n")
+            outfile.write(f"Start Datetime: {schedule['start_datetime'] or 'N/A'}\n")
+            outfile.write(f"End Datetime: {schedule['end_datetime'] or 'N/A'}\n")
             outfile.write(f"Meeting Number: {meeting_number}\n")
             outfile.write(f"Meeting Title: {meeting_title}\n")
             outfile.write(f"{location_str}\n")
@@ -1,11 +1,23 @@
-import requests
+import argparse
+import os
 import re
+import sys
 from bs4 import BeautifulSoup
 
+# Shared raw HTML cache lives with the IDWeek 2025 crawler modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'IDWEEK2025', 'py'))
+from html_cache import HTMLCache
+
+arg_parser = argparse.ArgumentParser(description='Extract IDWeek 2024 session data')
+arg_parser.add_argument('--offline', action='store_true', help='Replay pages from the raw HTML cache without network access')
+args = arg_parser.parse_args()
+
+cache = HTMLCache(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'html_cache'))
+
 url = 'http://local.dev.meetings.com/index.cfm?page=sessions&thisID=24&thisPageAction=view&thisSessionType=ePoster%20Flash%20Session'
-html = requests.get(url)
+html = cache.get(url, offline=args.offline)
 
-soup = BeautifulSoup(html.text, 'html.parser')
+soup = BeautifulSoup(html, 'html.parser')
 
 session_header_div = soup.find('div', class_='session-header')
 
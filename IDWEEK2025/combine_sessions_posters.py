@@ -1,73 +1,219 @@
 #!/usr/bin/env python3
 """
-Combine IDWeek 2025 sessions and posters into a single JSON file
+Combine IDWeek 2025 sessions and posters into one newline-delimited JSON file
+plus an offset index, so a reader can seek straight to a record, a day, a
+session type or a track instead of downloading and parsing everything.
+
+Records are streamed from the inputs into per-day/per-kind spill files and
+concatenated in day order, so memory holds only the index, never the
+records. Each day (and each kind within a day) is then one contiguous byte
+range. The index (idweek2025_combined.index.json) maps:
+
+    ids:    {"session": {"123": [start, end]}, "poster": {...}}
+    days:   {"2025-10-21": [start, end], ...}   ("undated" for records without a date)
+    kinds:  {"session": [[start, end], ...], "poster": [...]}
+    types:  {"Symposium": [[start, end], ...], "Poster": [...]}
+    tracks: {"HIV": [[start, end], ...], ...}
+
+Byte ranges are half-open and adjacent ranges are merged, so a day is one
+HTTP Range request (bytes=start-(end-1)) and a track is a few.
 """
 
+import argparse
 import json
+import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
-def combine_data():
-    """Combine sessions and posters data"""
-
-    # Load sessions data
-    sessions_file = Path('idweek2025_sessions.json')
-    if not sessions_file.exists():
-        print(f"Error: {sessions_file} not found")
-        sys.exit(1)
-
-    with open(sessions_file, 'r', encoding='utf-8') as f:
-        sessions = json.load(f)
-
-    # Load posters data
-    posters_file = Path('original_data/idweek2025_posters.json')
-    if not posters_file.exists():
-        print(f"Error: {posters_file} not found")
-        sys.exit(1)
-
-    with open(posters_file, 'r', encoding='utf-8') as f:
-        posters = json.load(f)
-
-    print(f"Loaded {len(sessions)} sessions and {len(posters)} posters")
-
-    # Add data_type field to distinguish sessions from posters
-    for session in sessions:
-        session['data_type'] = 'session'
-        # Normalize session_info.type for sessions
-        if 'session_info' in session and session['session_info'].get('type'):
-            session['session_info']['type'] = session['session_info']['type']
-        else:
-            session['session_info'] = session.get('session_info', {})
-            session['session_info']['type'] = 'Session'
-
-    for poster in posters:
-        poster['data_type'] = 'poster'
-        # Set poster type consistently
-        if 'session_info' not in poster:
-            poster['session_info'] = {}
-        poster['session_info']['type'] = 'Poster'
-
-    # Combine both arrays
-    combined_data = sessions + posters
-
-    print(f"Combined total: {len(combined_data)} items")
-
-    # Write combined data
-    output_file = Path('idweek2025_combined.json')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(combined_data, f, indent=2, ensure_ascii=False)
-
-    print(f"Combined data written to {output_file}")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'py'))
+from datetime_normalizer import normalize_date
+
+INDEX_VERSION = 1
+READ_CHUNK_SIZE = 1 << 16
+UNDATED = 'undated'
+
+
+def iter_json_records(path):
+    """
+    Records of a .jsonl file, or of a JSON array decoded incrementally
+
+    Only one record (plus a read chunk) is in memory at a time, however
+    large the array file is.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if str(path).endswith('.jsonl'):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        decoder = json.JSONDecoder()
+        buffer = f.read(READ_CHUNK_SIZE).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError(f"{path} is not a JSON array")
+        buffer = buffer[1:]
+        while True:
+            buffer = buffer.lstrip().lstrip(',').lstrip()
+            if buffer.startswith(']'):
+                return
+            try:
+                record, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                chunk = f.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    raise
+                buffer += chunk
+                continue
+            yield record
+            buffer = buffer[end:]
+            if len(buffer) < READ_CHUNK_SIZE:
+                buffer += f.read(READ_CHUNK_SIZE)
+
+
+def prepare_session(session):
+    """Tag a session record (data_type, session_info.type defaulting to 'Session')"""
+    session['data_type'] = 'session'
+    session_info = session.setdefault('session_info', {})
+    if not session_info.get('type'):
+        session_info['type'] = 'Session'
+    return session
+
+
+def prepare_poster(poster):
+    """Tag a poster record (data_type, session_info.type 'Poster')"""
+    poster['data_type'] = 'poster'
+    poster.setdefault('session_info', {})['type'] = 'Poster'
+    return poster
+
+
+def record_id(record):
+    return str(record.get('session_id' if record['data_type'] == 'session' else 'poster_id', ''))
+
+
+def record_day(record):
+    """ISO date of a record, from its start datetime or printed date"""
+    schedule = record.get('schedule') or {}
+    if schedule.get('start_datetime'):
+        return schedule['start_datetime'][:10]
+    return normalize_date(schedule.get('date') or '') or UNDATED
+
+
+def record_track(record):
+    if record['data_type'] == 'session':
+        return (record.get('tracks') or {}).get('primary_track') or ''
+    return (record.get('track_info') or {}).get('full_name') or ''
+
+
+def add_span(spans, start, end):
+    """Append [start, end) to a span list, merging it into the last span when adjacent"""
+    if spans and spans[-1][1] == start:
+        spans[-1][1] = end
+    else:
+        spans.append([start, end])
+
+
+def combine_data(sessions_path, posters_path, output_path, index_path):
+    """
+    Stream the session and poster records into output_path (NDJSON) and index_path
+
+    Returns:
+        The index
+    """
+    buckets = {}
+    entries = {}
+    records = 0
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(output_path))) as spill_dir:
+        try:
+            for kind, path, prepare in (('session', sessions_path, prepare_session),
+                                        ('poster', posters_path, prepare_poster)):
+                for record in iter_json_records(path):
+                    record = prepare(record)
+                    line = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+                    key = (record_day(record), kind)
+                    if key not in buckets:
+                        buckets[key] = open(os.path.join(spill_dir, f"{len(buckets)}.ndjson"), 'wb')
+                        entries[key] = []
+                    buckets[key].write(line)
+                    entries[key].append((len(line), record_id(record), record['session_info']['type'],
+                                         record_track(record)))
+                    records += 1
+        finally:
+            for bucket in buckets.values():
+                bucket.close()
+
+        index = {
+            'version': INDEX_VERSION,
+            'data_file': os.path.basename(output_path),
+            'records': records,
+            'bytes': 0,
+            'ids': {'session': {}, 'poster': {}},
+            'days': {},
+            'kinds': {'session': [], 'poster': []},
+            'types': {},
+            'tracks': {},
+        }
+        # Dated days in order, undated records last; sessions before posters within a day
+        order = sorted(buckets, key=lambda key: (key[0] == UNDATED, key[0], key[1] != 'session'))
+        offset = 0
+        with open(output_path, 'wb') as output:
+            for key in order:
+                day, kind = key
+                with open(buckets[key].name, 'rb') as bucket:
+                    shutil.copyfileobj(bucket, output)
+                day_start = offset
+                for length, item_id, session_type, track in entries[key]:
+                    start, offset = offset, offset + length
+                    index['ids'][kind][item_id] = [start, offset]
+                    add_span(index['types'].setdefault(session_type, []), start, offset)
+                    if track:
+                        add_span(index['tracks'].setdefault(track, []), start, offset)
+                add_span(index['kinds'][kind], day_start, offset)
+                index['days'][day] = [index['days'].get(day, [day_start])[0], offset]
+        index['bytes'] = offset
+
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    return index
+
+
+def read_span(data_path, span):
+    """Records in one [start, end) byte range of the NDJSON file"""
+    start, end = span
+    with open(data_path, 'rb') as f:
+        f.seek(start)
+        return [json.loads(line) for line in f.read(end - start).splitlines()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Combine IDWeek 2025 sessions and posters into indexed NDJSON')
+    parser.add_argument('--sessions', default='idweek2025_sessions.json', help='Session crawler output (.json or .jsonl)')
+    parser.add_argument('--posters', default='original_data/idweek2025_posters.json',
+                        help='Poster crawler output (.json or .jsonl)')
+    parser.add_argument('--output', default='idweek2025_combined.ndjson', help='Combined NDJSON file')
+    parser.add_argument('--index', default='idweek2025_combined.index.json', help='Offset index file')
+    args = parser.parse_args()
+
+    for path in (args.sessions, args.posters):
+        if not Path(path).exists():
+            print(f"Error: {path} not found")
+            sys.exit(1)
+
+    index = combine_data(args.sessions, args.posters, args.output, args.index)
+
+    print(f"Combined total: {index['records']} items")
+    print(f"Combined data written to {args.output} ({index['bytes']:,} bytes), index to {args.index}")
 
     # Print summary statistics
-    session_types = {}
-    for item in combined_data:
-        item_type = item.get('session_info', {}).get('type', 'Unknown')
-        session_types[item_type] = session_types.get(item_type, 0) + 1
-
     print("\nData type breakdown:")
-    for session_type, count in sorted(session_types.items()):
-        print(f"  {session_type}: {count}")
+    for kind, ids in index['ids'].items():
+        print(f"  {kind}: {len(ids)}")
+    print("\nDays:")
+    for day, (start, end) in index['days'].items():
+        print(f"  {day}: bytes {start}-{end - 1}")
+
 
 if __name__ == '__main__':
-    combine_data()
\ No newline at end of file
+    main()
@@ -3,10 +3,19 @@
  * Manages the overall application state, routing, and user interactions
  */
 
+// The session list pages through /api/sessions/catalog asking only for what the cards show;
+// the full /api/sessions download is kept for offline use, stats and the other views
+const CATALOG_FIELDS = ['session_id', 'title', 'date', 'start_time', 'end_time', 'location',
+                        'views', 'session_type', 'cme_credits', 'tags'];
+const CATALOG_PAGE_SIZE = 50;
+
 class IDWeekApp {
     constructor() {
         this.sessions = [];
         this.filteredSessions = [];
+        this.matchingTotal = 0;
+        this.nextCursor = null;
+        this.listRequest = 0;
         this.bookmarkedSessions = new Set();
         this.currentView = 'sessions';
         this.filterState = {
@@ -22,9 +31,6 @@ class IDWeekApp {
     async init() {
         console.log('🚀 Initializing IDWeek 2025 PWA...');
         
-        // Load data
-        await this.loadSessionData();
-        
         // Initialize UI components
         this.initializeUI();
         
@@ -34,8 +40,11 @@ class IDWeekApp {
         // Load user preferences
         this.loadUserPreferences();
         
-        // Render initial view
-        this.renderSessions();
+        // Render initial view (first page from the catalog)
+        await this.applyFilters();
+        
+        // Load the full data for offline use, stats and the other views
+        await this.loadSessionData();
         
         console.log('✅ Application initialized successfully');
     }
@@ -52,7 +61,7 @@ class IDWeekApp {
             // Try to fetch fresh data
             if (navigator.onLine) {
                 try {
-                    const response = await fetch('../batch1_firecrawl_validated.json');
+                    const response = await fetch('/api/sessions');
                     if (response.ok) {
                         const freshData = await response.json();
                         this.sessions = freshData;
@@ -64,7 +73,6 @@ class IDWeekApp {
                 }
             }
             
-            this.filteredSessions = [...this.sessions];
             this.updateStats();
             this.populateTagFilters();
             
@@ -123,6 +131,13 @@ class IDWeekApp {
             this.applyFilters();
         });
         
+        // Next page of the session list
+        document.addEventListener('click', (e) => {
+            if (e.target.closest('#loadMoreSessions')) {
+                this.loadMoreSessions();
+            }
+        });
+        
         // Filter dropdowns
         const dateFilter = document.getElementById('dateFilter');
         const priorityFilter = document.getElementById('priorityFilter');
@@ -239,8 +254,78 @@ class IDWeekApp {
         }
     }
     
-    applyFilters() {
-        this.filteredSessions = this.sessions.filter(session => {
+    async applyFilters() {
+        const request = ++this.listRequest;
+        let page = null;
+        if (navigator.onLine) {
+            try {
+                page = await this.fetchCatalogPage();
+            } catch (error) {
+                console.warn('⚠️ Catalog unavailable, filtering cached data:', error);
+            }
+        }
+        
+        // A newer filter change has already replaced this list
+        if (request !== this.listRequest) return;
+        
+        if (page) {
+            this.filteredSessions = this.filterByPriority(page.sessions);
+            this.matchingTotal = page.total;
+            this.nextCursor = page.next_cursor;
+        } else {
+            if (this.sessions.length === 0) {
+                this.sessions = this.getCachedData() || [];
+            }
+            this.filteredSessions = this.filterLocally();
+            this.matchingTotal = this.filteredSessions.length;
+            this.nextCursor = null;
+        }
+        
+        this.renderSessions();
+        this.updateStats();
+    }
+    
+    async fetchCatalogPage(cursor = null) {
+        // Search, date and tags are filtered by the server; priority is computed here
+        const params = new URLSearchParams({ fields: CATALOG_FIELDS.join(','), limit: CATALOG_PAGE_SIZE });
+        if (this.filterState.search) params.set('q', this.filterState.search);
+        if (this.filterState.date) params.set('day', this.filterState.date);
+        this.filterState.tags.forEach(tag => params.append('tag', tag));
+        if (cursor) params.set('cursor', cursor);
+        
+        const response = await fetch(`/api/sessions/catalog?${params}`);
+        if (!response.ok) {
+            throw new Error(`Catalog request failed: ${response.status}`);
+        }
+        return response.json();
+    }
+    
+    async loadMoreSessions() {
+        if (!this.nextCursor) return;
+        
+        const request = this.listRequest;
+        try {
+            const page = await this.fetchCatalogPage(this.nextCursor);
+            if (request !== this.listRequest) return;
+            this.filteredSessions.push(...this.filterByPriority(page.sessions));
+            this.matchingTotal = page.total;
+            this.nextCursor = page.next_cursor;
+            this.renderSessions();
+        } catch (error) {
+            // e.g. the data changed and the cursor is stale: start the list again
+            console.warn('⚠️ Failed to load more sessions:', error);
+            await this.applyFilters();
+        }
+    }
+    
+    filterByPriority(sessions) {
+        if (!this.filterState.priority) return sessions;
+        return sessions.filter(session => this.calculatePriority(session) === this.filterState.priority);
+    }
+    
+    filterLocally() {
+        // Offline: the same filters over the cached full data
+        return this.sessions.filter(session => {
             // Search filter
             if (this.filterState.search) {
                 const searchTerm = this.filterState.search.toLowerCase();
@@ -270,9 +355,6 @@ class IDWeekApp {
             
             return true;
         });
-        
-        this.renderSessions();
-        this.updateStats();
     }
     
     calculatePriority(session) {
@@ -319,13 +401,22 @@ class IDWeekApp {
         container.innerHTML = '';
         
         setTimeout(() => {
-            if (this.filteredSessions.length === 0) {
+            if (this.filteredSessions.length === 0 && !this.nextCursor) {
                 loadingIndicator?.classList.add('d-none');
                 noResultsMessage?.classList.remove('d-none');
                 return;
             }
             
-            const sessionsHTML = this.filteredSessions.map(session => this.createSessionCard(session)).join('');
+            let sessionsHTML = this.filteredSessions.map(session => this.createSessionCard(session)).join('');
+            if (this.nextCursor) {
+                sessionsHTML += `
+                    <div class="text-center my-3">
+                        <button id="loadMoreSessions" class="btn btn-outline-primary">
+                            Load more (${this.filteredSessions.length} of ${this.matchingTotal})
+                        </button>
+                    </div>
+                `;
+            }
             container.innerHTML = sessionsHTML;
             
             loadingIndicator?.classList.add('d-none');
@@ -532,8 +623,14 @@ class IDWeekApp {
         `;
     }
     
+    findSession(sessionId) {
+        // Full record when the full data has loaded, else the list's projected one
+        return this.sessions.find(s => s.session_id === sessionId) ||
+               this.filteredSessions.find(s => s.session_id === sessionId);
+    }
+    
     showSessionDetails(sessionId) {
-        const session = this.sessions.find(s => s.session_id === sessionId);
+        const session = this.findSession(sessionId);
         if (!session) return;
         
         const modal = document.getElementById('sessionModal');
@@ -755,14 +852,15 @@ class IDWeekApp {
         const totalViews = document.getElementById('totalViews');
         const highPriority = document.getElementById('highPriority');
         
-        if (totalSessions) totalSessions.textContent = this.filteredSessions.length;
+        // Matches come from the catalog; views and priority need the full data
+        if (totalSessions) totalSessions.textContent = this.matchingTotal;
         if (bookmarkedSessions) bookmarkedSessions.textContent = this.bookmarkedSessions.size;
         if (totalViews) {
-            const views = this.filteredSessions.reduce((sum, s) => sum + (s.views || 0), 0);
+            const views = this.sessions.reduce((sum, s) => sum + (s.views || 0), 0);
             totalViews.textContent = this.formatNumber(views);
         }
         if (highPriority) {
-            const highPriorityCount = this.filteredSessions.filter(s => this.calculatePriority(s) === 'High').length;
+            const highPriorityCount = this.sessions.filter(s => this.calculatePriority(s) === 'High').length;
             highPriority.textContent = highPriorityCount;
         }
     }
@@ -809,12 +907,16 @@ class IDWeekApp {
         const offlineBanner = document.getElementById('offlineBanner');
         
         if (navigator.onLine) {
-            statusElement?.innerHTML = '<i class="fas fa-wifi"></i> Online';
-            statusElement?.className = 'badge bg-success';
+            if (statusElement) {
+                statusElement.innerHTML = '<i class="fas fa-wifi"></i> Online';
+                statusElement.className = 'badge bg-success';
+            }
             offlineBanner?.classList.add('d-none');
         } else {
-            statusElement?.innerHTML = '<i class="fas fa-wifi-slash"></i> Offline';
-            statusElement?.className = 'badge bg-warning';
+            if (statusElement) {
+                statusElement.innerHTML = '<i class="fas fa-wifi-slash"></i> Offline';
+                statusElement.className = 'badge bg-warning';
+            }
             offlineBanner?.classList.remove('d-none');
         }
     }
@@ -842,7 +944,7 @@ class IDWeekApp {
     async exportData() {
         try {
             const data = {
-                sessions: this.filteredSessions,
+                sessions: this.filteredSessions.map(session => this.findSession(session.session_id)),
                 bookmarks: [...this.bookmarkedSessions],
                 exportedAt: new Date().toISOString()
             };
@@ -868,6 +970,7 @@ class IDWeekApp {
         
         try {
             await this.loadSessionData();
+            await this.applyFilters();
             this.showSuccessMessage('Data synchronized successfully');
         } catch (error) {
             console.error('❌ Sync error:', error);
@@ -901,7 +1004,7 @@ class IDWeekApp {
     }
     
     shareSession(sessionId) {
-        const session = this.sessions.find(s => s.session_id === sessionId);
+        const session = this.findSession(sessionId);
         if (!session) return;
         
         const shareData = {
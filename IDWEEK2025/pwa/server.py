@@ -2,24 +2,86 @@
 """
 IDWeek 2025 PWA - Simple Development Server
 Serves the PWA for local testing and development
+
+With --production it serves many clients at once instead: one thread per
+request, static files from memory with content-hashed immutable caching and
+gzip/brotli variants, and compressed API responses.
 """
 
+import argparse
+import gzip
 import http.server
 import socketserver
 import os
 import json
+import threading
 import urllib.parse
 from datetime import datetime
+from session_catalog import SessionCatalog, file_version
+from static_cache import MIN_COMPRESS_SIZE, StaticFileCache, precompress_directory
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'batch1_firecrawl_validated.json')
+
+class SessionStore:
+    """Session data loaded once, and again only when the data file changes"""
+    
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file_version = None
+        self.catalog = SessionCatalog([])
+        self.raw = b'[]'
+        self.raw_gzip = gzip.compress(self.raw)
+    
+    def get(self):
+        """Current (catalog, raw file bytes); one stat() per call to notice new data"""
+        current = file_version(self.path)
+        if current != self._file_version:
+            with self._lock:
+                if current != self._file_version:
+                    self._load(current)
+        return self.catalog, self.raw
+    
+    def _load(self, current):
+        if current is None:
+            self.catalog, self.raw = SessionCatalog([]), b'[]'
+            self.raw_gzip = gzip.compress(self.raw)
+        else:
+            catalog = SessionCatalog.from_file(self.path)
+            with open(self.path, 'rb') as f:
+                self.raw = f.read()
+            self.raw_gzip = gzip.compress(self.raw, compresslevel=6, mtime=0)
+            self.catalog = catalog
+            print(f"📚 Loaded {len(catalog.sessions)} sessions into the catalog")
+        self._file_version = current
+
+session_store = SessionStore(DATA_FILE)
 
 class PWAHandler(http.server.SimpleHTTPRequestHandler):
+    production = False
+    _cache_control_set = False
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=os.path.dirname(os.path.abspath(__file__)), **kwargs)
     
+    def send_response(self, code, message=None):
+        self._cache_control_set = False
+        super().send_response(code, message)
+    
+    def send_header(self, keyword, value):
+        if keyword.lower() == 'cache-control':
+            self._cache_control_set = True
+        super().send_header(keyword, value)
+    
     def end_headers(self):
-        # Add PWA-friendly headers
-        self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-        self.send_header('Pragma', 'no-cache')
-        self.send_header('Expires', '0')
+        if not self.production:
+            # Add PWA-friendly headers
+            self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
+            self.send_header('Pragma', 'no-cache')
+            self.send_header('Expires', '0')
+        elif not self._cache_control_set:
+            # Cacheable, but revalidated on every use
+            self.send_header('Cache-Control', 'no-cache')
         
         # CORS headers for development
         self.send_header('Access-Control-Allow-Origin', '*')
@@ -29,7 +91,8 @@ class PWAHandler(http.server.SimpleHTTPRequestHandler):
         # Service Worker headers
         if self.path.endswith('sw.js'):
             self.send_header('Service-Worker-Allowed', '/')
-            self.send_header('Content-Type', 'application/javascript')
+            if not self.production:
+                self.send_header('Content-Type', 'application/javascript')
         
         super().end_headers()
     
@@ -44,14 +107,66 @@ class PWAHandler(http.server.SimpleHTTPRequestHandler):
             return
         
         # Serve static files
+        if self.production and self.serve_cached_file():
+            return
         super().do_GET()
     
+    def accepted_encodings(self):
+        return {part.split(';')[0].strip().lower() for part in self.headers.get('Accept-Encoding', '').split(',')}
+    
+    def serve_cached_file(self):
+        """Serve a static file from the in-memory cache; False if it isn't a cacheable file"""
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            return False
+        entry = self.static_cache.get(path, self.guess_type(path))
+        if entry is None:
+            return False
+        
+        accepted = self.accepted_encodings()
+        encoding = next((e for e in ('br', 'gzip') if e in entry['variants'] and e in accepted), 'identity')
+        etag = f'"{entry["hash"]}-{encoding}"'
+        
+        # Hash-stamped URLs never change content; anything else is revalidated
+        version = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query).get('v', [None])[0]
+        if version == entry['hash']:
+            cache_control = 'public, max-age=31536000, immutable'
+        else:
+            cache_control = 'no-cache'
+        
+        if etag in self.headers.get('If-None-Match', ''):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', cache_control)
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return True
+        
+        body = entry['variants'].get(encoding, entry['body'])
+        self.send_response(200)
+        self.send_header('Content-Type', entry['content_type'])
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', cache_control)
+        self.send_header('Vary', 'Accept-Encoding')
+        if encoding != 'identity':
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+        self.wfile.write(body)
+        return True
+    
     def handle_api_request(self):
         """Handle API requests for PWA functionality"""
         try:
-            if self.path == '/api/sessions':
+            url = urllib.parse.urlsplit(self.path)
+            params = urllib.parse.parse_qs(url.query)
+            if url.path == '/api/sessions':
                 self.serve_sessions_data()
-            elif self.path == '/api/health':
+            elif url.path == '/api/sessions/catalog':
+                self.serve_session_catalog(params)
+            elif url.path == '/api/sessions/facets':
+                self.send_json(session_store.get()[0].facets())
+            elif url.path == '/api/health':
                 self.serve_health_check()
             else:
                 self.send_error(404, "API endpoint not found")
@@ -59,63 +174,132 @@ class PWAHandler(http.server.SimpleHTTPRequestHandler):
             print(f"API Error: {e}")
             self.send_error(500, "Internal server error")
     
+    def send_body(self, body, content_type, status=200, gzipped=None):
+        """Send a response body; in production, gzipped when the client accepts it"""
+        encoding = None
+        if self.production and len(body) >= MIN_COMPRESS_SIZE and 'gzip' in self.accepted_encodings():
+            body = gzipped or gzip.compress(body, compresslevel=5, mtime=0)
+            encoding = 'gzip'
+        
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if self.production:
+            self.send_header('Vary', 'Accept-Encoding')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def send_json(self, payload, status=200):
+        """Send a compact JSON response"""
+        self.send_body(json.dumps(payload, separators=(',', ':')).encode('utf-8'), 'application/json', status)
+    
     def serve_sessions_data(self):
-        """Serve session data from the validated Firecrawl results"""
+        """Serve the full session data (kept in memory; reloaded when the file changes)"""
         try:
-            data_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'batch1_firecrawl_validated.json')
-            if os.path.exists(data_file):
-                with open(data_file, 'r', encoding='utf-8') as f:
-                    data = f.read()
-                
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(data.encode('utf-8'))
-            else:
-                # Return empty array if no data file
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(b'[]')
+            _, data = session_store.get()
+            self.send_body(data, 'application/json', gzipped=session_store.raw_gzip)
         except Exception as e:
             print(f"Error serving sessions data: {e}")
             self.send_error(500, "Failed to load session data")
     
+    def serve_session_catalog(self, params):
+        """
+        Filtered, paged, projected sessions from the catalog index
+        
+        Query: day, track, type, tag (repeatable; any of them), speaker, q,
+        fields (comma-separated), limit, cursor (next_cursor of the previous page)
+        """
+        def param(name):
+            values = params.get(name)
+            return values[0] if values else None
+        
+        catalog, _ = session_store.get()
+        fields = [field.strip() for field in (param('fields') or '').split(',') if field.strip()]
+        try:
+            result = catalog.query(
+                day=param('day'),
+                track=param('track'),
+                session_type=param('type'),
+                tag=params.get('tag'),
+                speaker=param('speaker'),
+                text=param('q'),
+                fields=fields or None,
+                limit=param('limit') or 50,
+                cursor=param('cursor')
+            )
+        except ValueError as e:
+            self.send_json({'error': str(e)}, status=400)
+            return
+        
+        self.send_json(result)
+    
     def serve_health_check(self):
         """Serve health check for PWA status"""
+        catalog, _ = session_store.get()
         health_data = {
             "status": "ok",
             "timestamp": datetime.now().isoformat(),
             "version": "1.0.0",
             "services": {
                 "pwa": "running",
-                "data": "available" if os.path.exists(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'batch1_firecrawl_validated.json')) else "missing"
-            }
+                "data": "available" if os.path.exists(DATA_FILE) else "missing"
+            },
+            "catalog": catalog.get_stats()
         }
+        if self.production:
+            health_data["static_cache"] = self.static_cache.get_stats()
         
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(health_data).encode('utf-8'))
+        self.send_json(health_data)
     
     def log_message(self, format, *args):
         # Custom logging for PWA requests
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         print(f"[{timestamp}] {format % args}")
 
+class ProductionPWAHandler(PWAHandler):
+    """Handler for --production: HTTP/1.1 keep-alive, cached static files, compression"""
+    production = True
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+    static_cache = StaticFileCache()
+    
+    def log_message(self, format, *args):
+        # Per-request logging is too slow and noisy with the whole team connected
+        pass
+
 def main():
-    PORT = 8080
+    parser = argparse.ArgumentParser(description='Serve the IDWeek 2025 PWA')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on')
+    parser.add_argument('--production', action='store_true',
+                        help='Threaded server with in-memory, hash-cached, compressed static files')
+    parser.add_argument('--precompress', action='store_true',
+                        help='Write .gz/.br files next to the static files, then exit')
+    args = parser.parse_args()
+    PORT = args.port
     
-    print(f"🚀 IDWeek 2025 PWA Development Server")
+    if args.precompress:
+        written = precompress_directory(os.path.dirname(os.path.abspath(__file__)))
+        print(f"🗜️  Wrote {written} precompressed files")
+        return
+    
+    mode = "Production" if args.production else "Development"
+    print(f"🚀 IDWeek 2025 PWA {mode} Server")
     print(f"=" * 50)
     print(f"📱 PWA URL: http://localhost:{PORT}")
     print(f"🔧 API Health: http://localhost:{PORT}/api/health")
     print(f"📊 API Sessions: http://localhost:{PORT}/api/sessions")
+    print(f"🔎 API Catalog: http://localhost:{PORT}/api/sessions/catalog?day=Sunday&q=fungal&fields=title,start_time")
     print(f"⚠️  Press Ctrl+C to stop server")
     print(f"=" * 50)
     
     try:
-        with socketserver.TCPServer(("", PORT), PWAHandler) as httpd:
+        if args.production:
+            server = http.server.ThreadingHTTPServer(("", PORT), ProductionPWAHandler)
+        else:
+            server = socketserver.TCPServer(("", PORT), PWAHandler)
+        with server as httpd:
             httpd.serve_forever()
     except KeyboardInterrupt:
         print(f"\n🛑 Server stopped")
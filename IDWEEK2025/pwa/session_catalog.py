@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+IDWeek 2025 PWA - Session Catalog
+In-memory index of the session data, built once when the data file is
+loaded, so /api/sessions/catalog can filter by day, track, session type,
+tag, speaker and free text, page with a cursor and return only the fields a
+view needs, instead of every client downloading and filtering the whole file
+"""
+
+import base64
+import bisect
+import hashlib
+import json
+import os
+import re
+from collections import defaultdict
+from datetime import datetime
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+DATE_FORMATS = ['%Y-%m-%d', '%A, %B %d, %Y', '%B %d, %Y', '%a, %b %d, %Y', '%m/%d/%Y']
+WORD_RE = re.compile(r'\w+')
+
+
+def words(text):
+    """Lowercased word tokens of a text"""
+    return WORD_RE.findall(str(text or '').casefold())
+
+
+def parse_date(value):
+    """ISO date for the date formats seen in the session data, or None"""
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), date_format).date()
+        except (AttributeError, ValueError):
+            continue
+    return None
+
+
+def parse_time(value):
+    """Minutes after midnight for '1:30 PM' style times (sorts unknown times last)"""
+    for time_format in ('%I:%M %p', '%H:%M'):
+        try:
+            parsed = datetime.strptime(str(value or '').strip().upper(), time_format)
+            return parsed.hour * 60 + parsed.minute
+        except ValueError:
+            continue
+    return 24 * 60
+
+
+def names(people):
+    """Names from a list of speaker dicts or plain strings"""
+    result = []
+    for person in people or []:
+        name = person.get('name') if isinstance(person, dict) else person
+        if name:
+            result.append(str(name))
+    return result
+
+
+def session_tracks(session):
+    """Tracks of a session, from a 'track' string, a 'tracks' list or the parser's tracks dict"""
+    tracks = session.get('tracks')
+    if isinstance(tracks, dict):
+        tracks = tracks.get('all_tracks') or [tracks.get('primary_track')]
+    elif isinstance(tracks, str):
+        tracks = [tracks]
+    tracks = [track for track in (tracks or []) if track]
+    if session.get('track'):
+        tracks.append(session['track'])
+    return tracks
+
+
+def session_speakers(session):
+    """Speaker names of a session: moderators, speakers and presenters"""
+    speakers = []
+    for key in ('moderators', 'speakers', 'presenters'):
+        value = session.get(key)
+        if isinstance(value, dict):
+            # {'role': [people]} as written by the HTML parsers
+            for people in value.values():
+                speakers.extend(names(people))
+        else:
+            speakers.extend(names(value))
+    return speakers
+
+
+class SessionCatalog:
+    """
+    Sessions in a fixed (date, start time, title) order, with inverted indexes
+
+    Day, track, type and tag filters are exact (case-insensitive) lookups;
+    speaker and text filters match every query word as a word prefix, so
+    partially typed searches work like the client-side filter did.
+    """
+
+    def __init__(self, sessions, version=''):
+        """
+        Args:
+            sessions: Session dicts in the PWA's JSON format
+            version: Identifies this data; cursors from other versions are rejected
+        """
+        self.version = version
+        self.sessions = sorted(
+            (session for session in sessions if isinstance(session, dict)),
+            key=lambda s: (parse_date(s.get('date')) or datetime.max.date(), parse_time(s.get('start_time')),
+                           str(s.get('title') or ''), str(s.get('session_id') or ''))
+        )
+
+        self.by_day = defaultdict(set)
+        self.by_track = defaultdict(set)
+        self.by_type = defaultdict(set)
+        self.by_tag = defaultdict(set)
+        self.by_speaker_word = defaultdict(set)
+        self.by_word = defaultdict(set)
+
+        for position, session in enumerate(self.sessions):
+            self._index(position, session)
+
+        self.speaker_words = sorted(self.by_speaker_word)
+        self.text_words = sorted(self.by_word)
+        self.all_positions = set(range(len(self.sessions)))
+        self.stats = {'sessions': len(self.sessions), 'queries': 0}
+
+    @classmethod
+    def from_file(cls, path):
+        """Load a catalog from a JSON file (a list of sessions, or {'sessions': [...]})"""
+        with open(path, 'rb') as f:
+            raw = f.read()
+        data = json.loads(raw)
+        if isinstance(data, dict):
+            data = data.get('sessions', [])
+        return cls(data, version=hashlib.sha1(raw).hexdigest()[:12])
+
+    def _index(self, position, session):
+        date = session.get('date')
+        if date:
+            self.by_day[str(date).casefold()].add(position)
+            parsed = parse_date(date)
+            if parsed:
+                self.by_day[parsed.isoformat()].add(position)
+                self.by_day[parsed.strftime('%A').casefold()].add(position)
+
+        for track in session_tracks(session):
+            self.by_track[str(track).casefold()].add(position)
+        if session.get('session_type'):
+            self.by_type[str(session['session_type']).casefold()].add(position)
+        for tag in session.get('tags') or []:
+            self.by_tag[str(tag).casefold()].add(position)
+
+        speakers = session_speakers(session)
+        for speaker in speakers:
+            for word in words(speaker):
+                self.by_speaker_word[word].add(position)
+
+        searchable = [session.get('title'), session.get('session_type'), session.get('location')]
+        searchable += list(session.get('tags') or []) + session_tracks(session) + speakers
+        for text in searchable:
+            for word in words(text):
+                self.by_word[word].add(position)
+
+    @staticmethod
+    def _prefix_match(query, sorted_words, index):
+        """Positions matching every query word as a prefix of some indexed word"""
+        matched = None
+        for query_word in words(query):
+            positions = set()
+            start = bisect.bisect_left(sorted_words, query_word)
+            for word in sorted_words[start:]:
+                if not word.startswith(query_word):
+                    break
+                positions |= index[word]
+            matched = positions if matched is None else matched & positions
+        return matched
+
+    def encode_cursor(self, position):
+        return base64.urlsafe_b64encode(f'{self.version}:{position}'.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """Position after which the next page starts; raises ValueError for bad or stale cursors"""
+        try:
+            decoded = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+            version, position = decoded.rsplit(':', 1)
+            position = int(position)
+        except (ValueError, UnicodeDecodeError):
+            raise ValueError('Invalid cursor')
+        if version != self.version:
+            raise ValueError('Cursor is from an older catalog; start again without it')
+        return position
+
+    def query(self, day=None, track=None, session_type=None, tag=None, speaker=None, text=None,
+              fields=None, limit=DEFAULT_PAGE_SIZE, cursor=None):
+        """
+        One page of matching sessions
+
+        Args:
+            day, track, session_type, tag: Exact values (case-insensitive); day
+                also accepts a weekday name or an ISO date, and tag a list
+                (sessions with any of the tags)
+            speaker, text: Words matched as prefixes (all must match)
+            fields: Session keys to return (session_id is always included); None for all
+            limit: Page size, capped at MAX_PAGE_SIZE
+            cursor: next_cursor from the previous page
+
+        Returns:
+            {'sessions': [...], 'total': matches across all pages, 'next_cursor': str or None,
+             'version': catalog version}
+        """
+        self.stats['queries'] += 1
+        matched = self.all_positions
+
+        for value, index in ((day, self.by_day), (track, self.by_track), (session_type, self.by_type)):
+            if value:
+                matched = matched & index.get(value.strip().casefold(), set())
+        if tag:
+            tags = [tag] if isinstance(tag, str) else tag
+            matched = matched & set().union(*(self.by_tag.get(t.strip().casefold(), set()) for t in tags))
+        if speaker:
+            matched = matched & (self._prefix_match(speaker, self.speaker_words, self.by_speaker_word) or set())
+        if text:
+            matched = matched & (self._prefix_match(text, self.text_words, self.by_word) or set())
+
+        ordered = sorted(matched)
+        start = bisect.bisect_right(ordered, self.decode_cursor(cursor)) if cursor else 0
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        page = ordered[start:start + limit]
+
+        sessions = [self.sessions[position] for position in page]
+        if fields:
+            keep = set(fields) | {'session_id'}
+            sessions = [{key: value for key, value in session.items() if key in keep} for session in sessions]
+
+        has_more = start + limit < len(ordered)
+        return {
+            'sessions': sessions,
+            'total': len(ordered),
+            'next_cursor': self.encode_cursor(page[-1]) if has_more else None,
+            'version': self.version
+        }
+
+    def facets(self):
+        """Available filter values with session counts, for building the filter menus"""
+        def counts(index, keys):
+            # Keys are strings, as in _index, so mixed-type values still sort
+            return {key: len(index[key.casefold()]) for key in sorted(keys)}
+
+        return {
+            'days': counts(self.by_day, {str(s['date']) for s in self.sessions if s.get('date')}),
+            'tracks': counts(self.by_track, {str(t) for s in self.sessions for t in session_tracks(s)}),
+            'types': counts(self.by_type, {str(s['session_type']) for s in self.sessions if s.get('session_type')}),
+        }
+
+    def get_stats(self):
+        return dict(self.stats)
+
+
+def file_version(path):
+    """(mtime, size) of a file, or None if it is missing; used to notice changed data"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+IDWeek 2025 PWA - Static File Cache
+In-memory copies of the PWA's static files with their content hash and
+gzip/brotli variants, invalidated by mtime, for the production server.
+HTML pages have their local asset URLs stamped with ?v=<content hash> so
+those assets can be cached as immutable.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+
+from session_catalog import file_version
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'application/manifest+json',
+                      'image/svg+xml')
+MIN_COMPRESS_SIZE = 1024
+# Files --precompress writes variants for (the served web assets, not sources or docs)
+PRECOMPRESS_EXTENSIONS = ('.html', '.css', '.js', '.json', '.svg', '.webmanifest', '.txt')
+MAX_CACHED_FILE_SIZE = 8 * 1024 * 1024
+
+# src="..." / href="..." pointing at a relative local file (no scheme, query or fragment)
+ASSET_URL_RE = re.compile(r'\b(src|href)="([^":?#]+)"')
+
+
+def is_compressible(content_type, size):
+    return size >= MIN_COMPRESS_SIZE and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def compress_variants(body):
+    """{'gzip': bytes, 'br': bytes} for a body (br only when brotli is installed)"""
+    variants = {'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['br'] = brotli.compress(body, quality=11)
+    return variants
+
+
+def precompress_directory(directory):
+    """
+    Write .gz (and .br) files next to every compressible static file
+
+    Returns:
+        Number of variant files written (up-to-date ones are skipped)
+    """
+    written = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith(PRECOMPRESS_EXTENSIONS):
+                continue
+            path = os.path.join(root, name)
+            content_type = mimetypes.guess_type(path)[0] or ''
+            if not is_compressible(content_type, os.path.getsize(path)):
+                continue
+
+            with open(path, 'rb') as f:
+                body = f.read()
+            for encoding, data in compress_variants(body).items():
+                target = path + ('.gz' if encoding == 'gzip' else '.br')
+                if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(path):
+                    continue
+                with open(target, 'wb') as f:
+                    f.write(data)
+                written += 1
+    return written
+
+
+class StaticFileCache:
+    """
+    Static files held in memory until their mtime or size changes
+
+    Entries are dicts with body, variants ({'gzip': ..., 'br': ...}),
+    content hash and content type. Precompressed .gz/.br files on disk are
+    used when they are at least as new as the file; otherwise the variants
+    are compressed once, when the file is loaded.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'loads': 0}
+
+    def get(self, path, content_type):
+        """Cache entry for a file, or None if it is missing or too large to cache"""
+        version = file_version(path)
+        if version is None or version[1] > MAX_CACHED_FILE_SIZE:
+            return None
+
+        entry = self._entries.get(path)
+        if entry and entry['version'] == version and self._dependencies_current(entry):
+            self.stats['hits'] += 1
+            return entry
+
+        entry = self._load(path, version, content_type)
+        with self._lock:
+            self._entries[path] = entry
+            self.stats['loads'] += 1
+        return entry
+
+    def _dependencies_current(self, entry):
+        for dependency, dependency_hash in entry['dependencies'].items():
+            current = self.get(dependency, mimetypes.guess_type(dependency)[0] or 'application/octet-stream')
+            if current is None or current['hash'] != dependency_hash:
+                return False
+        return True
+
+    def _load(self, path, version, content_type):
+        with open(path, 'rb') as f:
+            body = f.read()
+
+        dependencies = {}
+        if content_type == 'text/html':
+            body, dependencies = self._stamp_asset_urls(path, body)
+
+        variants = {}
+        if is_compressible(content_type, len(body)):
+            if not dependencies:
+                variants = self._precompressed(path, version)
+            if not variants:
+                variants = compress_variants(body)
+
+        return {
+            'version': version,
+            'body': body,
+            'variants': variants,
+            'hash': hashlib.sha256(body).hexdigest()[:16],
+            'content_type': content_type,
+            'dependencies': dependencies,
+        }
+
+    @staticmethod
+    def _precompressed(path, version):
+        """Variants from fresh .gz/.br files beside the file, if any"""
+        variants = {}
+        for encoding, suffix in (('gzip', '.gz'), ('br', '.br')):
+            variant_path = path + suffix
+            try:
+                if os.stat(variant_path).st_mtime_ns >= version[0]:
+                    with open(variant_path, 'rb') as f:
+                        variants[encoding] = f.read()
+            except OSError:
+                continue
+        return variants
+
+    def _stamp_asset_urls(self, path, body):
+        """Add ?v=<content hash> to the page's local asset URLs; returns (body, {asset path: hash})"""
+        directory = os.path.dirname(path)
+        dependencies = {}
+
+        def stamp(match):
+            asset_path = os.path.normpath(os.path.join(directory, match.group(2)))
+            content_type = mimetypes.guess_type(asset_path)[0] or 'application/octet-stream'
+            if asset_path == path or not os.path.isfile(asset_path):
+                return match.group(0)
+            asset = self.get(asset_path, content_type)
+            if asset is None:
+                return match.group(0)
+            dependencies[asset_path] = asset['hash']
+            return f'{match.group(1)}="{match.group(2)}?v={asset["hash"]}"'
+
+        html = ASSET_URL_RE.sub(stamp, body.decode('utf-8'))
+        return html.encode('utf-8'), dependencies
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats, files=len(self._entries),
+                        bytes=sum(len(e['body']) + sum(map(len, e['variants'].values()))
+                                  for e in self._entries.values()))
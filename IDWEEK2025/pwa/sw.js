@@ -4,7 +4,7 @@
  */
 
 const CACHE_NAME = 'idweek2025-v1.0.0';
-const STATIC_CACHE = 'idweek2025-static-v1.0.0';
+const STATIC_CACHE = 'idweek2025-static-v1.0.1';
 const DYNAMIC_CACHE = 'idweek2025-dynamic-v1.0.0';
 
 // Static assets to cache immediately
@@ -101,6 +101,8 @@ self.addEventListener('fetch', event => {
 });
 
 // Handle static assets (cache first strategy)
+// Pages link assets as app.js?v=<hash> while STATIC_ASSETS precaches /app.js,
+// so offline the query string is ignored and any cached copy of the path is served
 function handleStaticAsset(request) {
     return caches.match(request).then(cachedResponse => {
         if (cachedResponse) {
@@ -118,6 +120,11 @@ function handleStaticAsset(request) {
             return networkResponse;
         }).catch(error => {
             console.warn('[SW] Failed to fetch static asset:', request.url, error);
+            return caches.match(request, { ignoreSearch: true });
+        }).then(response => {
+            if (response) {
+                return response;
+            }
             // Return a basic fallback for CSS/JS files
             if (request.url.includes('.css')) {
                 return new Response('/* Offline - CSS unavailable */', {
@@ -129,7 +136,7 @@ function handleStaticAsset(request) {
                     headers: { 'Content-Type': 'application/javascript' }
                 });
             }
-            throw error;
+            throw new Error(`Offline - ${request.url} unavailable`);
         });
     });
 }
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Adaptive Request Throttle
+Per-host rate controller shared by the conference crawlers. The request
+rate climbs while responses come back fast and 200, and backs off
+exponentially on 429/5xx, connection errors or rising latency.
+Retry-After is honored, and the current rate is exposed as a metric.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Responses that mean "slow down and try again"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds"""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveThrottle:
+    """
+    AIMD rate controller, tracked separately for each host
+
+    Until a host first pushes back, each healthy response grows its rate by
+    slow_start_factor (a quick ramp to the host's real capacity); after that,
+    healthy responses add increase_step requests/second. Throttling responses
+    multiply the rate by decrease_factor and block the host for an
+    exponential backoff (or Retry-After, if longer).
+    """
+
+    def __init__(self, initial_rate: float = 2.0, min_rate: float = 0.05, max_rate: float = 20.0,
+                 increase_step: float = 0.25, decrease_factor: float = 0.7, slow_start_factor: float = 1.1,
+                 latency_factor: float = 3.0, base_backoff: float = 1.0, max_backoff: float = 300.0):
+        """
+        Args:
+            initial_rate: Starting requests per second for a new host
+            min_rate: Floor the rate never drops below
+            max_rate: Ceiling the rate never climbs above
+            increase_step: Requests/second added after each healthy response
+            decrease_factor: Rate multiplier applied on 429/5xx/errors
+            slow_start_factor: Rate multiplier per healthy response before the
+                host's first throttling event
+            latency_factor: Latency above this multiple of the host's best seen
+                latency counts as "rising" and slows the rate
+            base_backoff: First backoff pause in seconds, doubled per consecutive failure
+            max_backoff: Longest backoff pause in seconds
+        """
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.slow_start_factor = slow_start_factor
+        self.latency_factor = latency_factor
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.hosts = {}
+
+    def _host_state(self, host: str) -> Dict[str, Any]:
+        state = self.hosts.get(host)
+        if state is None:
+            state = self.hosts[host] = {
+                'rate': min(max(self.initial_rate, self.min_rate), self.max_rate),
+                'next_slot': 0.0,
+                'blocked_until': 0.0,
+                'latency_ewma': None,
+                'latency_floor': None,
+                'slow_start': True,
+                'consecutive_failures': 0,
+                'backoffs': 0,
+                'responses': 0,
+            }
+        return state
+
+    def _claim(self, host: str) -> float:
+        """
+        Claim the host's next request slot if it is due
+
+        Slots are claimed only when due (never reserved ahead), so rate
+        changes and backoffs apply to every waiting request immediately.
+
+        Returns:
+            0 if the slot was claimed, otherwise seconds until it is due
+        """
+        state = self._host_state(host)
+        now = time.monotonic()
+        due = max(state['next_slot'], state['blocked_until'])
+        if due > now:
+            return due - now
+        state['next_slot'] = now + 1.0 / state['rate']
+        return 0.0
+
+    async def acquire(self, host: str):
+        """Wait for a request slot (asyncio)"""
+        while True:
+            delay = self._claim(host)
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def acquire_sync(self, host: str):
+        """Wait for a request slot (blocking, for requests-based scripts)"""
+        while True:
+            delay = self._claim(host)
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def record(self, host: str, status: Optional[int], latency: float, retry_after: Optional[float] = None):
+        """
+        Feed one response back into the controller
+
+        Args:
+            host: Host the request went to
+            status: HTTP status, or None for a connection error / timeout
+            latency: Request time in seconds
+            retry_after: Parsed Retry-After seconds, if the server sent one
+        """
+        state = self._host_state(host)
+        state['responses'] += 1
+
+        if status is None or status in RETRY_STATUSES:
+            now = time.monotonic()
+            if now < state['blocked_until']:
+                # Requests already in flight when the host pushed back: one
+                # decrease per throttling event, but still honor Retry-After
+                if retry_after is not None:
+                    state['blocked_until'] = max(state['blocked_until'], now + min(retry_after, self.max_backoff))
+                return
+
+            state['slow_start'] = False
+            state['consecutive_failures'] += 1
+            state['backoffs'] += 1
+            state['rate'] = max(self.min_rate, state['rate'] * self.decrease_factor)
+
+            backoff = min(self.max_backoff, self.base_backoff * 2 ** (state['consecutive_failures'] - 1))
+            if retry_after is not None:
+                backoff = max(backoff, min(retry_after, self.max_backoff))
+            state['blocked_until'] = max(state['blocked_until'], now + backoff)
+
+            logger.warning(f"Throttling {host}: status {status}, backing off {backoff:.1f}s, "
+                           f"rate now {state['rate']:.2f}/s")
+            return
+
+        state['consecutive_failures'] = 0
+
+        # Track latency: a smoothed average and the best smoothed value seen
+        if state['latency_ewma'] is None:
+            state['latency_ewma'] = latency
+        else:
+            state['latency_ewma'] = 0.8 * state['latency_ewma'] + 0.2 * latency
+        if state['latency_floor'] is None or state['latency_ewma'] < state['latency_floor']:
+            state['latency_floor'] = state['latency_ewma']
+
+        latency_rising = state['latency_ewma'] > self.latency_factor * max(state['latency_floor'], 0.01)
+
+        if latency_rising:
+            state['slow_start'] = False
+            state['rate'] = max(self.min_rate, state['rate'] * 0.9)
+        elif status < 400:
+            if state['slow_start']:
+                rate = state['rate'] * self.slow_start_factor
+            else:
+                rate = state['rate'] + self.increase_step
+            state['rate'] = min(self.max_rate, rate)
+
+    def current_rate(self, host: str) -> float:
+        """Current requests/second allowed for a host"""
+        return self._host_state(host)['rate']
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host rate, latency and backoff counts"""
+        return {
+            host: {
+                'rate': round(state['rate'], 3),
+                'latency_ewma': round(state['latency_ewma'], 4) if state['latency_ewma'] is not None else None,
+                'backoffs': state['backoffs'],
+                'responses': state['responses'],
+            }
+            for host, state in self.hosts.items()
+        }
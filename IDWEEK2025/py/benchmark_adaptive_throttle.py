@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Adaptive Throttle Benchmark
+Compares fixed request rates against AdaptiveThrottle using a local stand-in
+server with a limited capacity: requests above the capacity get a 429 with
+Retry-After, the way a conference site's rate limiter would answer
+"""
+
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from adaptive_throttle import AdaptiveThrottle
+from benchmark_fetch_engine import SAMPLE_PAGE
+from fetch_engine import AsyncFetchEngine
+
+
+def start_limited_server(capacity: float, latency: float, retry_after: int):
+    """
+    Start a local server that accepts `capacity` requests/second and answers the rest with 429
+
+    Returns:
+        (server, counters) where counters holds 'ok' and 'throttled' totals
+    """
+    with open(SAMPLE_PAGE, 'rb') as f:
+        body = f.read()
+
+    lock = threading.Lock()
+    counters = {'ok': 0, 'throttled': 0}
+    bucket = {'tokens': 1.0, 'updated': time.monotonic()}
+
+    def take_token() -> bool:
+        with lock:
+            now = time.monotonic()
+            bucket['tokens'] = min(1.0, bucket['tokens'] + (now - bucket['updated']) * capacity)
+            bucket['updated'] = now
+            if bucket['tokens'] >= 1.0:
+                bucket['tokens'] -= 1.0
+                counters['ok'] += 1
+                return True
+            counters['throttled'] += 1
+            return False
+
+    class LimitedHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if not take_token():
+                self.send_response(429)
+                self.send_header('Retry-After', str(retry_after))
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), LimitedHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, counters
+
+
+def run(label: str, engine: AsyncFetchEngine, urls, counters):
+    """Crawl the URLs and print time, throughput, 429s and final per-host rate"""
+    counters['ok'] = counters['throttled'] = 0
+    started = time.perf_counter()
+    results = engine.crawl(enumerate(urls))
+    elapsed = time.perf_counter() - started
+
+    failed = sum(1 for r in results if r['error'])
+    rates = engine.get_stats()['host_rates']
+    final_rate = next(iter(rates.values()), 0.0)
+    print(f"  {label:<34} {elapsed:8.2f}s  {len(urls) / elapsed:6.1f} pages/s  "
+          f"429s={counters['throttled']:<4} failed={failed:<3} final rate={final_rate:.2f}/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark fixed rates vs AdaptiveThrottle against a rate-limited server')
+    parser.add_argument('--pages', type=int, default=100, help='Number of pages to fetch')
+    parser.add_argument('--capacity', type=float, default=10.0, help='Requests/second the stand-in server accepts')
+    parser.add_argument('--latency', type=float, default=0.02, help='Simulated server latency per page (seconds)')
+    parser.add_argument('--retry-after', type=int, default=1, help='Retry-After seconds sent with each 429')
+    parser.add_argument('--concurrency', type=int, default=8, help='Engine concurrency limit')
+    args = parser.parse_args()
+
+    server, counters = start_limited_server(args.capacity, args.latency, args.retry_after)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/sessions.cfm"
+    urls = [f"{base_url}?thisID={page_id}" for page_id in range(1, args.pages + 1)]
+
+    print(f"Fetching {args.pages} pages from a server accepting {args.capacity}/s")
+
+    # Conservative fixed rate: never throttled, but leaves most of the capacity unused
+    conservative = max(args.capacity / 5, 0.5)
+    run(f"fixed {conservative:.1f}/s", AsyncFetchEngine(args.concurrency, conservative, max_retries=5), urls, counters)
+
+    # Aggressive fixed rate: keeps hammering the server through its 429s
+    aggressive = args.capacity * 3
+    run(f"fixed {aggressive:.1f}/s", AsyncFetchEngine(args.concurrency, aggressive, max_retries=5), urls, counters)
+
+    throttle = AdaptiveThrottle(initial_rate=conservative, max_rate=aggressive)
+    run("adaptive", AsyncFetchEngine(args.concurrency, throttle=throttle, max_retries=5), urls, counters)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
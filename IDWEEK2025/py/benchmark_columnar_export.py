@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Columnar Export Benchmark
+Times the row-by-row csv.DictWriter exports (save_to_csv,
+save_presentations_csv and the poster save_to_csv) against building the
+Arrow tables once and writing CSV, then Parquet and XLSX from them, on saved
+crawler output (best of --rounds, so pyarrow's one-time kernel setup is
+not counted). Reports whether the CSV cells match, column by column.
+Without input files, the saved test_session pages and the poster sample are
+parsed and repeated up to conference size (1013 sessions, 2169 posters).
+"""
+
+import argparse
+import copy
+import csv
+import glob
+import inspect
+import logging
+import os
+import re
+import tempfile
+import time
+
+import poster_html_parser
+from columnar_export import poster_tables, read_records, session_tables, write_tables
+from parse_idweek2025_posters import IDWeek2025PosterCrawler
+from parse_idweek2025_sessions import IDWeek2025SessionCrawler, sanitize_csv_field
+from poster_html_parser import PosterHTMLParser
+from session_parser_fixed import SessionHTMLParserFixed
+
+SAMPLE_PAGES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'test_session_*.html')
+
+
+def sample_corpus(session_count: int, poster_count: int):
+    """Sessions and posters parsed from the saved samples, repeated with distinct IDs"""
+    session_parser = SessionHTMLParserFixed()
+    pages = []
+    for path in sorted(glob.glob(SAMPLE_PAGES)):
+        with open(path, 'r', encoding='utf-8') as f:
+            pages.append(session_parser.parse_session_html(f.read()))
+    sample_html = re.search(r"sample_html = '''(.*?)'''", inspect.getsource(poster_html_parser), re.DOTALL).group(1)
+    poster = PosterHTMLParser().parse_poster_html(sample_html)
+
+    sessions = []
+    for session_id in range(1, session_count + 1):
+        session = copy.deepcopy(pages[session_id % len(pages)])
+        session['session_id'] = session_id
+        sessions.append(session)
+    posters = []
+    for poster_id in range(1, poster_count + 1):
+        record = copy.deepcopy(poster)
+        record['poster_id'] = poster_id
+        posters.append(record)
+    return sessions, posters
+
+
+def best_time(run, rounds: int) -> float:
+    """Fastest of rounds calls of run(), in seconds"""
+    times = []
+    for _ in range(max(1, rounds)):
+        started = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def csv_differences(legacy_path: str, columnar_path: str):
+    """
+    (rows compared, differing cells, cells that still differ after the legacy
+    value gets the newline cleanup the columnar export applies to every column)
+    """
+    with open(legacy_path, newline='', encoding='utf-8') as f:
+        legacy = list(csv.DictReader(f))
+    with open(columnar_path, newline='', encoding='utf-8') as f:
+        columnar = list(csv.DictReader(f))
+    if len(legacy) != len(columnar):
+        mismatch = abs(len(legacy) - len(columnar))
+        return len(legacy), mismatch, mismatch
+    differing = [(old[key], new.get(key)) for old, new in zip(legacy, columnar) for key in old
+                 if old[key] != new.get(key)]
+    unexplained = sum(1 for old, new in differing if sanitize_csv_field(old) != new)
+    return len(legacy), len(differing), unexplained
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark csv.DictWriter exports vs the Arrow columnar export')
+    parser.add_argument('--sessions', help='Session crawler output (.json or .jsonl)')
+    parser.add_argument('--posters', help='Poster crawler output (.json or .jsonl)')
+    parser.add_argument('--rounds', type=int, default=3, help='Runs per variant; the fastest is reported')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    if args.sessions and args.posters:
+        sessions, posters = list(read_records(args.sessions)), list(read_records(args.posters))
+    else:
+        sessions, posters = sample_corpus(1013, 2169)
+    print(f"{len(sessions)} sessions, {len(posters)} posters")
+
+    with tempfile.TemporaryDirectory() as legacy_dir, tempfile.TemporaryDirectory() as columnar_dir:
+        session_crawler = IDWeek2025SessionCrawler(cache_dir=None, frontier_path=None)
+        poster_crawler = IDWeek2025PosterCrawler(cache_dir=None, frontier_path=None)
+        session_crawler.crawled_data = sessions
+        poster_crawler.crawled_data = posters
+
+        def legacy_export():
+            session_crawler.save_to_csv(os.path.join(legacy_dir, 'idweek2025_sessions.csv'))
+            session_crawler.save_presentations_csv(os.path.join(legacy_dir, 'idweek2025_presentations.csv'))
+            poster_crawler.save_to_csv(os.path.join(legacy_dir, 'idweek2025_posters.csv'))
+
+        def build_tables():
+            tables = session_tables(sessions)
+            tables.update(poster_tables(posters))
+            return tables
+
+        print(f"  csv.DictWriter (3 CSVs):      {best_time(legacy_export, args.rounds):7.3f}s")
+        print(f"  Arrow tables (5, one pass):   {best_time(build_tables, args.rounds):7.3f}s")
+        tables = build_tables()
+        for file_format in ('csv', 'parquet', 'xlsx'):
+            elapsed = best_time(lambda: write_tables(tables, columnar_dir, formats=[file_format]), args.rounds)
+            print(f"  write {file_format:8s} (5 tables):    {elapsed:7.3f}s")
+
+        for name in ('sessions', 'presentations', 'posters'):
+            rows, differing, unexplained = csv_differences(os.path.join(legacy_dir, f"idweek2025_{name}.csv"),
+                                                           os.path.join(columnar_dir, f"idweek2025_{name}.csv"))
+            print(f"  {name}: {rows} rows, {differing} cells differ, {unexplained} other than by newline cleanup")
+
+
+if __name__ == "__main__":
+    main()
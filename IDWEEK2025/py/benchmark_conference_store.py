@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Conference Store Benchmark
+Times the same question ("poster IDs, titles and start times for one
+conference") answered three ways: json.load of the crawler output,
+csv.DictReader over the exported CSV, and load_table() from the Parquet
+store with column projection and a conference filter. The store is
+built in a temporary directory from the given crawler output (plus the
+ESCMID posters, so the filter has another partition to skip), and the
+three answers are checked to be the same rows. Without --posters the
+input is the 2169-poster sample corpus used by benchmark_columnar_export.
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import tempfile
+import time
+
+from benchmark_columnar_export import sample_corpus
+from columnar_export import poster_tables, read_records, write_tables
+from conference_store import escmid_poster_tables, load_table, write_store
+
+ESCMID_POSTERS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'ESCMID 2025', '2025',
+                              'ESCMID-2025-Posters.json')
+COLUMNS = ['poster_id', 'title', 'start_datetime']
+
+
+def from_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        posters = json.load(f)
+    return [(str(p['poster_id']), p.get('presentation_details', {}).get('title', '').strip(),
+             p.get('schedule', {}).get('start_datetime', '')) for p in posters if 'error' not in p]
+
+
+def from_csv(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return [(row['poster_id'], row['title'], row['start_datetime']) for row in csv.DictReader(f)]
+
+
+def from_store(root):
+    table = load_table('posters', columns=COLUMNS, conference='IDWEEK', root=root)
+    # The store keeps unknown datetimes as nulls; the JSON and CSV have ''
+    return list(zip(*(table[name].fill_null('').to_pylist() for name in COLUMNS)))
+
+
+def best_of(function, argument, rounds):
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        result = function(argument)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark re-parsing JSON/CSV vs the Parquet conference store')
+    parser.add_argument('--posters', help='Poster crawler output (.json); default: the sample corpus')
+    parser.add_argument('--escmid-posters', default=ESCMID_POSTERS, help='ESCMID poster extractor JSON')
+    parser.add_argument('--rounds', type=int, default=5, help='Timed runs per variant (best is reported)')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    posters = list(read_records(args.posters)) if args.posters else sample_corpus(0, 2169)[1]
+    tables = poster_tables(posters)
+    with tempfile.TemporaryDirectory() as work_dir:
+        posters_path = args.posters
+        if not posters_path:
+            posters_path = os.path.join(work_dir, 'bench_posters.json')
+            with open(posters_path, 'w', encoding='utf-8') as f:
+                json.dump(posters, f)
+        write_tables(tables, work_dir, 'bench', ['csv'])
+        store = os.path.join(work_dir, 'store')
+        write_store(tables, 'IDWEEK', 2025, store)
+        if os.path.exists(args.escmid_posters):
+            with open(args.escmid_posters, 'r', encoding='utf-8') as f:
+                write_store(escmid_poster_tables(json.load(f), 2025), 'ESCMID', 2025, store)
+
+        print(f"{tables['posters'].num_rows} IDWeek posters, columns {', '.join(COLUMNS)}")
+        json_time, json_rows = best_of(from_json, posters_path, args.rounds)
+        print(f"  json.load:      {json_time * 1000:8.1f} ms")
+        csv_time, csv_rows = best_of(from_csv, os.path.join(work_dir, 'bench_posters.csv'), args.rounds)
+        print(f"  csv.DictReader: {csv_time * 1000:8.1f} ms")
+        store_time, store_rows = best_of(from_store, store, args.rounds)
+        print(f"  store:          {store_time * 1000:8.1f} ms  "
+              f"({json_time / store_time:.0f}x json, {csv_time / store_time:.0f}x csv)")
+        print(f"  same rows: {sorted(json_rows) == sorted(csv_rows) == sorted(store_rows)}")
+
+
+if __name__ == "__main__":
+    main()
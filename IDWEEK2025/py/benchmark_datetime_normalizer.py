@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Date/Time Normalizer Benchmark
+Normalizes the day and time strings of the saved IDWeek listings with the
+per-call date/time parsing FacultyHTMLParser used before datetime_normalizer
+(patterns compiled from strings and the month table rebuilt on every call),
+with the shared precompiled patterns uncached, and with the memoized
+normalizers, checking all three agree on the ISO dates and 24-hour times.
+"""
+
+import argparse
+import glob
+import logging
+import os
+import re
+import time
+
+import datetime_normalizer
+from datetime_normalizer import normalize_date, normalize_time_range
+from listing_stream_parser import ListingStreamParser
+
+LISTING_FILES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'source_html_from_meeting_URLs',
+                             '*.html')
+
+LEGACY_DATE_PATTERNS = [
+    r'(\w+),\s+(\w+)\s+(\d+),\s+(\d+)',  # Tuesday, October 21, 2025
+    r'(\w+)\s+(\d+),\s+(\d+)',           # October 21, 2025
+    r'(\d+)/(\d+)/(\d+)',                # 10/21/2025
+]
+LEGACY_TIME_PATTERN = r'(\d+):(\d+)\s+(AM|PM)\s*(?:-\s*(\d+):(\d+)\s+(AM|PM))?\s*(?:<small>(.+?)</small>)?'
+
+
+def legacy_parse_date(date_text):
+    """FacultyHTMLParser._parse_date before the shared module"""
+    date_text = re.sub(r'^.*?(\w+day,?\s+)', r'\1', date_text, flags=re.IGNORECASE)
+    for pattern in LEGACY_DATE_PATTERNS:
+        match = re.search(pattern, date_text, re.IGNORECASE)
+        if match:
+            if len(match.groups()) == 4:
+                month_name, day, year = match.group(2), int(match.group(3)), int(match.group(4))
+            elif match.group(1).isdigit():
+                return f"{int(match.group(3)):04d}-{int(match.group(1)):02d}-{int(match.group(2)):02d}"
+            else:
+                month_name, day, year = match.group(1), int(match.group(2)), int(match.group(3))
+            month_map = {
+                'january': 1, 'february': 2, 'march': 3, 'april': 4,
+                'may': 5, 'june': 6, 'july': 7, 'august': 8,
+                'september': 9, 'october': 10, 'november': 11, 'december': 12
+            }
+            month = month_map.get(month_name.lower())
+            if month:
+                return f"{year:04d}-{month:02d}-{day:02d}"
+    return None
+
+
+def legacy_parse_time(time_text):
+    """FacultyHTMLParser._parse_time before the shared module: 'HH:MM - HH:MM' or None"""
+    match = re.search(LEGACY_TIME_PATTERN, time_text)
+    if not match:
+        return None
+
+    def clock(hour, minute, meridiem):
+        hour = int(hour)
+        if meridiem.upper() == 'PM' and hour != 12:
+            hour += 12
+        elif meridiem.upper() == 'AM' and hour == 12:
+            hour = 0
+        return f"{hour:02d}:{int(minute):02d}"
+
+    start = clock(match.group(1), match.group(2), match.group(3))
+    if match.group(4):
+        return f"{start} - {clock(match.group(4), match.group(5), match.group(6))}"
+    return start
+
+
+def shared_parse_time(time_text, normalize=normalize_time_range):
+    start, end, _ = normalize(time_text)
+    if not start:
+        return None
+    return f"{start} - {end}" if end else start
+
+
+def load_corpus(pattern: str):
+    """(date, time) strings of every listing record, times as get_text() joins them ("1:30 PMUS ET")"""
+    corpus = []
+    listing_parser = ListingStreamParser()
+    for path in sorted(glob.glob(pattern)):
+        for record in listing_parser.iter_file(path):
+            if record.get('date') and record.get('time'):
+                corpus.append((record['date'], f"{record['time']}{record.get('timezone', '')}"))
+    return corpus
+
+
+def time_variant(parse_date, parse_time, corpus, rounds: int):
+    """(seconds per date+time pair, results of the first round)"""
+    results = [(parse_date(date), parse_time(time_text)) for date, time_text in corpus]
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for date, time_text in corpus:
+            parse_date(date)
+            parse_time(time_text)
+    return (time.perf_counter() - started) / (rounds * len(corpus)), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark per-call date/time parsing vs datetime_normalizer')
+    parser.add_argument('--listings', default=LISTING_FILES, help='Glob of saved listing pages')
+    parser.add_argument('--rounds', type=int, default=50, help='Passes over the corpus per variant')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    corpus = load_corpus(args.listings)
+    if not corpus:
+        raise SystemExit(f"No dated records in {args.listings}")
+    distinct = len(set(corpus))
+    print(f"{len(corpus)} date/time pairs ({distinct} distinct) x {args.rounds} rounds")
+
+    legacy_time, expected = time_variant(legacy_parse_date, legacy_parse_time, corpus, args.rounds)
+    print(f"  per-call patterns:   {legacy_time * 1e6:8.2f} us/pair  {1 / legacy_time:12,.0f} pairs/s")
+
+    uncached_date = normalize_date.__wrapped__
+    uncached_time = normalize_time_range.__wrapped__
+    uncached, uncached_results = time_variant(
+        uncached_date, lambda text: shared_parse_time(text, uncached_time), corpus, args.rounds)
+    print(f"  precompiled:         {uncached * 1e6:8.2f} us/pair  {1 / uncached:12,.0f} pairs/s")
+
+    normalize_date.cache_clear()
+    normalize_time_range.cache_clear()
+    cached, cached_results = time_variant(normalize_date, shared_parse_time, corpus, args.rounds)
+    print(f"  precompiled + cache: {cached * 1e6:8.2f} us/pair  {1 / cached:12,.0f} pairs/s")
+
+    print(f"  speedup: {legacy_time / uncached:.1f}x precompiled, {legacy_time / cached:.1f}x cached")
+    for name, info in datetime_normalizer.cache_info().items():
+        if info.hits or info.misses:
+            print(f"  {name}: {info.hits} hits, {info.misses} misses")
+    print(f"  results identical: {expected == uncached_results == cached_results}")
+
+
+if __name__ == "__main__":
+    main()
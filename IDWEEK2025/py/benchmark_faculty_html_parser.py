@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Faculty HTML Parser Benchmark
+Parses a corpus of faculty popup blobs with both FacultyHTMLParser backends
+(BeautifulSoup html.parser and lxml), reporting time per record and any
+record whose output differs. The corpus is the raw_data column of
+IDWEEK_Faculty_2025 when database options are given, else saved HTML files,
+else the embedded test_parser sample.
+
+    python benchmark_faculty_html_parser.py --user root --password secret --database idweek --limit 2000
+"""
+
+import argparse
+import glob
+import json
+import logging
+import time
+
+from faculty_html_parser import SAMPLE_FACULTY_HTML, FacultyHTMLParser
+
+
+def load_database_corpus(args):
+    """(id, raw_data) rows from IDWEEK_Faculty_2025"""
+    import mysql.connector
+
+    connection = mysql.connector.connect(host=args.host, user=args.user, password=args.password,
+                                         database=args.database, port=args.port)
+    try:
+        cursor = connection.cursor()
+        query = "SELECT id, raw_data FROM IDWEEK_Faculty_2025 WHERE raw_data IS NOT NULL ORDER BY id"
+        if args.limit:
+            query += f" LIMIT {int(args.limit)}"
+        cursor.execute(query)
+        rows = cursor.fetchall()
+        cursor.close()
+    finally:
+        connection.close()
+    return rows
+
+
+def load_file_corpus(pattern: str):
+    """(path, contents) for every file matching the glob"""
+    rows = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, 'r', encoding='utf-8') as f:
+            rows.append((path, f.read()))
+    return rows
+
+
+def time_backend(backend: str, corpus, rounds: int):
+    """(seconds per record, outputs) for every record parsed rounds times"""
+    parser = FacultyHTMLParser(backend=backend)
+    outputs = [parser.parse_faculty_data(raw_html, record_id) for record_id, raw_html in corpus]
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for record_id, raw_html in corpus:
+            parser.parse_faculty_data(raw_html, record_id)
+    return (time.perf_counter() - started) / (rounds * len(corpus)), outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the bs4 and lxml FacultyHTMLParser backends')
+    parser.add_argument('--host', default='localhost', help='Database host')
+    parser.add_argument('--user', help='Database user (reads raw_data from IDWEEK_Faculty_2025)')
+    parser.add_argument('--password', help='Database password')
+    parser.add_argument('--database', help='Database name')
+    parser.add_argument('--port', type=int, default=3306, help='Database port')
+    parser.add_argument('--limit', type=int, help='Limit number of database records')
+    parser.add_argument('--corpus', help='Glob of saved faculty popup HTML files, used without a database')
+    parser.add_argument('--rounds', type=int, default=None,
+                        help='Times each record is parsed per backend (default: 1, or 500 for the embedded sample)')
+    parser.add_argument('--show', type=int, default=3, help='Differing records to print')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    if args.user and args.database:
+        corpus, source = load_database_corpus(args), 'IDWEEK_Faculty_2025.raw_data'
+    elif args.corpus:
+        corpus, source = load_file_corpus(args.corpus), args.corpus
+    else:
+        corpus, source = [(999, SAMPLE_FACULTY_HTML)], 'embedded test_parser sample'
+    if not corpus:
+        raise SystemExit(f"No records in {source}")
+    rounds = args.rounds or (500 if len(corpus) == 1 else 1)
+    size_mb = sum(len(raw_html or '') for _, raw_html in corpus) / 1024 / 1024
+
+    print(f"{len(corpus)} records ({size_mb:.2f} MB) from {source}, {rounds} rounds")
+    bs4_time, expected = time_backend('bs4', corpus, rounds)
+    print(f"  bs4:  {bs4_time * 1000:8.3f} ms/record")
+    lxml_time, actual = time_backend('lxml', corpus, rounds)
+    print(f"  lxml: {lxml_time * 1000:8.3f} ms/record")
+    print(f"  speedup: {bs4_time / lxml_time:.2f}x")
+
+    differing = [(record_id, bs4_out, lxml_out) for (record_id, _), bs4_out, lxml_out
+                 in zip(corpus, expected, actual) if bs4_out != lxml_out]
+    print(f"  output identical: {len(corpus) - len(differing)}/{len(corpus)} records")
+    for record_id, bs4_out, lxml_out in differing[:args.show]:
+        print(f"  {record_id}:")
+        print(f"    bs4:  {json.dumps(bs4_out, default=str, sort_keys=True)}")
+        print(f"    lxml: {json.dumps(lxml_out, default=str, sort_keys=True)}")
+
+
+if __name__ == "__main__":
+    main()
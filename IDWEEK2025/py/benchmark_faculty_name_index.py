@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Faculty Name Index Benchmark
+Compares the original full-table fuzzy scan of find_matching_faculty against
+FacultyNameIndex on synthetic faculty names (with middle-name, typo and
+email variants), reporting any lookups where the index's approximate
+candidate blocking returns a different match (--exhaustive disables the
+blocking)
+"""
+
+import argparse
+import random
+import string
+import time
+from difflib import SequenceMatcher
+
+from faculty_name_index import FacultyNameIndex
+
+FIRST_NAMES = ['james', 'mary', 'robert', 'patricia', 'john', 'jennifer', 'michael', 'linda', 'david', 'elizabeth',
+               'william', 'barbara', 'richard', 'susan', 'joseph', 'jessica', 'thomas', 'sarah', 'wei', 'priya',
+               'ahmed', 'fatima', 'carlos', 'maria', 'hiroshi', 'yuki', 'olu', 'ngozi', 'ivan', 'olga']
+LAST_NAMES = ['smith', 'johnson', 'williams', 'brown', 'jones', 'garcia', 'miller', 'davis', 'rodriguez', 'martinez',
+              'hernandez', 'lopez', 'gonzalez', 'wilson', 'anderson', 'thomas', 'taylor', 'moore', 'jackson', 'martin',
+              'lee', 'perez', 'thompson', 'white', 'harris', 'sanchez', 'clark', 'ramirez', 'lewis', 'robinson',
+              'chen', 'wang', 'patel', 'singh', 'kim', 'nguyen', 'okafor', 'tanaka', 'petrov', 'schmidt']
+
+
+def original_names_similar(name1: str, name2: str, threshold: float = 0.9) -> bool:
+    """The pre-index _names_similar, verbatim"""
+    if not name1 or not name2:
+        return False
+
+    similarity = SequenceMatcher(None, name1, name2).ratio()
+
+    name1_words = set(name1.split())
+    name2_words = set(name2.split())
+
+    if len(name1_words) <= len(name2_words):
+        word_match = name1_words.issubset(name2_words)
+    else:
+        word_match = name2_words.issubset(name1_words)
+
+    return similarity >= threshold or (word_match and similarity >= 0.8)
+
+
+def original_find(rows, normalized_name: str, email: str = None):
+    """The pre-index find_matching_faculty, with the three SELECTs as list scans"""
+    if normalized_name:
+        for faculty_id, existing_name, _ in rows:
+            if existing_name == normalized_name:
+                return faculty_id
+    if email:
+        for faculty_id, _, existing_email in rows:
+            if existing_email and existing_email.lower() == email.lower():
+                return faculty_id
+    if normalized_name:
+        for faculty_id, existing_name, _ in rows:
+            if existing_name and original_names_similar(normalized_name, existing_name):
+                return faculty_id
+    return None
+
+
+def make_rows(count: int, rng: random.Random):
+    """Synthetic Faculty_Master rows: (faculty_id, normalized_name, email)"""
+    rows = []
+    seen = set()
+    while len(rows) < count:
+        middle = f" {rng.choice(string.ascii_lowercase)}" if rng.random() < 0.3 else ""
+        name = f"{rng.choice(FIRST_NAMES)}{middle} {rng.choice(LAST_NAMES)}{rng.choice(['', '', 'son', 'er', 'ova'])}"
+        name += ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(0, 3)))
+        if name in seen:
+            continue
+        seen.add(name)
+        email = f"{name.replace(' ', '.')}@example.org" if rng.random() < 0.5 else None
+        rows.append((len(rows) + 1, name, email))
+    return rows
+
+
+def make_queries(rows, count: int, rng: random.Random):
+    """Lookups: exact names, emails, typos, added/dropped middle names and strangers"""
+    queries = []
+    for _ in range(count):
+        _, name, email = rng.choice(rows)
+        kind = rng.random()
+        if kind < 0.2:
+            queries.append((name, None))
+        elif kind < 0.35 and email:
+            queries.append(("unknown person", email))
+        elif kind < 0.6:
+            position = rng.randrange(len(name))
+            queries.append((name[:position] + rng.choice(string.ascii_lowercase) + name[position + 1:], None))
+        elif kind < 0.8:
+            words = name.split()
+            queries.append((f"{words[0]} {rng.choice(string.ascii_lowercase)} {words[-1]}", None))
+        else:
+            queries.append((f"{rng.choice(FIRST_NAMES)}x {rng.choice(LAST_NAMES)}q", None))
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark full-scan faculty matching vs FacultyNameIndex')
+    parser.add_argument('--faculty', type=int, default=5000, help='Faculty_Master rows')
+    parser.add_argument('--queries', type=int, default=500, help='Lookups to run')
+    parser.add_argument('--seed', type=int, default=2025, help='Random seed')
+    parser.add_argument('--exhaustive', action='store_true', help='Index without candidate blocking')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    rows = make_rows(args.faculty, rng)
+    queries = make_queries(rows, args.queries, rng)
+
+    print(f"{args.queries} lookups against {args.faculty} faculty")
+
+    started = time.perf_counter()
+    expected = [original_find(rows, name, email) for name, email in queries]
+    scan_time = time.perf_counter() - started
+    print(f"  full scan:  {scan_time:8.2f}s  {args.queries / scan_time:9.1f} lookups/s")
+
+    started = time.perf_counter()
+    index = FacultyNameIndex(exhaustive=args.exhaustive)
+    index.add_many(rows)
+    build_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    actual = [index.find(name, email) for name, email in queries]
+    index_time = time.perf_counter() - started
+    print(f"  name index: {index_time:8.2f}s  {args.queries / index_time:9.1f} lookups/s  (build {build_time:.2f}s)")
+
+    mismatches = [(query, e, a) for query, e, a in zip(queries, expected, actual) if e != a]
+    print(f"  speedup: {scan_time / index_time:.1f}x, "
+          f"{index.stats['fuzzy_comparisons'] / max(1, args.queries):.1f} fuzzy comparisons per lookup")
+    print(f"  matches identical: {not mismatches} ({len(mismatches)} differences)")
+    for query, e, a in mismatches[:5]:
+        print(f"    {query}: scan={e} index={a}")
+
+
+if __name__ == "__main__":
+    main()
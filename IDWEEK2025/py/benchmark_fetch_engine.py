@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Fetch Engine Benchmark
+Compares the legacy serial crawl loop against AsyncFetchEngine using a
+local stand-in server that serves a saved session page with simulated latency
+"""
+
+import argparse
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from fetch_engine import AsyncFetchEngine
+
+SAMPLE_PAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'test_session_workshop.html')
+
+
+def start_standin_server(latency: float) -> ThreadingHTTPServer:
+    """Start a threaded local server that answers every GET with the sample page after `latency` seconds"""
+    with open(SAMPLE_PAGE, 'rb') as f:
+        body = f.read()
+
+    class StandInHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_serial(urls, delay: float) -> float:
+    """The original crawl loop: one blocking request at a time, fixed sleep after each"""
+    session = requests.Session()
+    started = time.perf_counter()
+    for url in urls:
+        response = session.get(url, timeout=30)
+        response.raise_for_status()
+        if delay > 0:
+            time.sleep(delay)
+    return time.perf_counter() - started
+
+
+def run_engine(urls, concurrency: int, rate_limit: float) -> float:
+    """The async engine over the same URLs"""
+    engine = AsyncFetchEngine(concurrency=concurrency, rate_per_host=rate_limit)
+    started = time.perf_counter()
+    results = engine.crawl(enumerate(urls))
+    elapsed = time.perf_counter() - started
+
+    failed = [r for r in results if r['error']]
+    if failed:
+        print(f"  warning: {len(failed)} engine requests failed, e.g. {failed[0]['error']}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark serial crawl loop vs AsyncFetchEngine')
+    parser.add_argument('--pages', type=int, default=100, help='Number of pages to fetch')
+    parser.add_argument('--latency', type=float, default=0.05, help='Simulated server latency per page (seconds)')
+    parser.add_argument('--delay', type=float, default=0.5, help='Fixed sleep of the serial loop (seconds)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Engine concurrency limit')
+    parser.add_argument('--rate-limit', type=float, default=10.0, help='Engine per-host requests per second')
+    args = parser.parse_args()
+
+    server = start_standin_server(args.latency)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/sessions.cfm"
+    urls = [f"{base_url}?thisID={page_id}" for page_id in range(1, args.pages + 1)]
+
+    print(f"Fetching {args.pages} pages, simulated latency {args.latency}s")
+
+    serial_time = run_serial(urls, args.delay)
+    print(f"  serial loop (delay={args.delay}s):              {serial_time:8.2f}s  {args.pages / serial_time:7.1f} pages/s")
+
+    engine_time = run_engine(urls, args.concurrency, args.rate_limit)
+    print(f"  async engine (concurrency={args.concurrency}, rate={args.rate_limit}/s): {engine_time:8.2f}s  {args.pages / engine_time:7.1f} pages/s")
+
+    print(f"  speedup: {serial_time / engine_time:.1f}x")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
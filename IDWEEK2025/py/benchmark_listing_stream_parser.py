@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Listing Stream Parser Benchmark
+Compares building a full BeautifulSoup (html.parser) tree and calling
+find_all on it against ListingStreamParser on the saved IDWeek listing and
+the ESCMID programme, reporting throughput, peak memory growth and whether
+both ways extract the same records (for the programme, the same p.sessionid
+markers in order). Each run happens in a fresh process so the memory
+figures are not shared.
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import time
+
+LISTING_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'source_html_from_meeting_URLs')
+DEFAULT_FILES = [
+    os.path.join(LISTING_DIR, 'IDWeek2025 symposia_website_source_0909.html'),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'ESCMID 2025', '2025',
+                 'FinalProgramme_Full_v2.html'),
+]
+
+
+def soup_idweek_listing(soup):
+    """ListingStreamParser.iter_idweek_listing's record fields, read with find/find_all"""
+    from listing_stream_parser import POSTER_NUMBER_RE, PRESENTER_ID_RE, SESSION_CODE_RE, clean_text
+
+    date = ''
+    for li in soup.find_all('li'):
+        if 'dayrow' in (li.get('class') or []):
+            date = clean_text(li.get_text())
+            continue
+        if not li.get('data-presid'):
+            continue
+
+        prestime = li.find('div', class_='prestime')
+        time_span = prestime.find('span') if prestime else None
+        small = prestime.find('small') if prestime else None
+        primary = li.find('div', class_='list-row-primary')
+        title_span = primary.find('span', recursive=False) if primary else None
+        title = clean_text(title_span.get_text()) if title_span else ''
+        location = next((clean_text(div.get_text().replace('Location:', ''))
+                         for div in li.find_all('div', class_='text-12') if 'Location:' in div.get_text()), '')
+
+        presenters = []
+        for div in li.find_all('div', class_='mar-btm-xs'):
+            link = div.find('a')
+            role = (div.contents[0] if div.contents and isinstance(div.contents[0], str) else '').split(':', 1)[0].strip()
+            presenter_id = PRESENTER_ID_RE.search(link.get('data-url', '')) if link else None
+            presenters.append({
+                'role': role,
+                'name': clean_text(link.get_text()) if link else clean_text(div.get_text().split(':', 1)[-1]),
+                'affiliation': clean_text(str(link.next_sibling or '')).lstrip('–- ').strip() if link else '',
+                'presenter_id': presenter_id.group(1) if presenter_id else '',
+            })
+
+        record = {
+            'kind': 'session',
+            'presentation_id': li.get('data-presid'),
+            'code': '',
+            'title': title,
+            'date': date,
+            'time': clean_text(time_span.find(string=True, recursive=False) or '') if time_span else '',
+            'timezone': clean_text(small.get_text()) if small else '',
+            'location': location,
+            'presenters': presenters,
+            'tracks': [clean_text(span.get_text()) for span in li.find_all('span', class_='text-bubble')],
+        }
+        poster_match = POSTER_NUMBER_RE.match(title)
+        code_match = SESSION_CODE_RE.match(title)
+        if poster_match:
+            record.update(kind='poster', code=poster_match.group(1), title=poster_match.group(2))
+        elif code_match:
+            record.update(code=code_match.group(1), title=code_match.group(2))
+        yield record
+
+
+def soup_escmid_programme(soup):
+    """The ESCMID programme's p.sessionid markers, one record each"""
+    from listing_stream_parser import clean_text
+
+    for marker in soup.find_all('p', class_='sessionid'):
+        yield {'code': clean_text(marker.get_text())}
+
+
+def run_variant(variant, path, queue):
+    """Child process: parse one file one way; report seconds, records and peak RSS growth (KB)"""
+    import logging
+    logging.disable(logging.CRITICAL)
+    from bs4 import BeautifulSoup
+    from listing_stream_parser import ListingStreamParser
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    if variant == 'soup':
+        with open(path, 'r', encoding='utf-8') as f:
+            soup = BeautifulSoup(f.read(), 'html.parser')
+        if soup.find('p', class_='sessionid'):
+            records = list(soup_escmid_programme(soup))
+        else:
+            records = list(soup_idweek_listing(soup))
+    else:
+        records = list(ListingStreamParser().iter_file(path))
+    elapsed = time.perf_counter() - started
+    growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    queue.put((elapsed, records, growth))
+
+
+def measure(variant, path):
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=run_variant, args=(variant, path, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark BeautifulSoup find_all vs ListingStreamParser')
+    parser.add_argument('files', nargs='*', default=DEFAULT_FILES, help='Saved listing files')
+    args = parser.parse_args()
+
+    for path in args.files:
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        print(f"{os.path.basename(path)} ({size_mb:.2f} MB)")
+
+        soup_time, soup_records, soup_memory = measure('soup', path)
+        print(f"  BeautifulSoup: {soup_time:7.3f}s  {size_mb / soup_time:6.1f} MB/s  "
+              f"+{soup_memory / 1024:6.1f} MB peak  {len(soup_records)} records")
+        stream_time, stream_records, stream_memory = measure('stream', path)
+        print(f"  stream parser: {stream_time:7.3f}s  {size_mb / stream_time:6.1f} MB/s  "
+              f"+{stream_memory / 1024:6.1f} MB peak  {len(stream_records)} records")
+
+        if soup_records and set(soup_records[0]) == {'code'}:
+            same = [r['code'] for r in soup_records] == [r['code'] for r in stream_records]
+            print(f"  speedup: {soup_time / stream_time:.1f}x, same session codes in order: {same}")
+        else:
+            print(f"  speedup: {soup_time / stream_time:.1f}x, records identical: {soup_records == stream_records}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+XPath Registry Benchmark
+Times SessionHTMLParserFixed per page on the saved sample pages with the
+precompiled xpath_registry expressions, and with every registry entry
+swapped back to the original tree.xpath('...') string call (compiled on
+each use), checking both produce the same output
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import time
+
+from lxml import etree
+
+import session_parser_fixed
+from session_parser_fixed import SessionHTMLParserFixed
+
+SAMPLE_PAGES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'test_session_*.html')
+
+
+def string_xpath_calls(module):
+    """Replace the module's compiled XPath globals with per-call tree.xpath(path); returns the originals"""
+    originals = {name: value for name, value in vars(module).items() if isinstance(value, etree.XPath)}
+    for name, compiled in originals.items():
+        setattr(module, name, lambda node, path=compiled.path: node.xpath(path))
+    return originals
+
+
+def time_parses(pages, rounds: int):
+    """(seconds per page parse, outputs) for every page parsed rounds times"""
+    parser = SessionHTMLParserFixed()
+    outputs = [parser.parse_session_html(page) for page in pages]
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for page in pages:
+            parser.parse_session_html(page)
+    return (time.perf_counter() - started) / (rounds * len(pages)), outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark string XPath calls vs the precompiled xpath_registry')
+    parser.add_argument('--pages', default=SAMPLE_PAGES, help='Glob of saved session pages')
+    parser.add_argument('--rounds', type=int, default=200, help='Times each page is parsed per variant')
+    args = parser.parse_args()
+
+    # The parser logs every page it parses
+    logging.getLogger(session_parser_fixed.__name__).setLevel(logging.WARNING)
+
+    paths = sorted(glob.glob(args.pages))
+    if not paths:
+        raise SystemExit(f"No pages match {args.pages}")
+    pages = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            pages.append(f.read())
+
+    print(f"{len(pages)} pages x {args.rounds} rounds ({', '.join(os.path.basename(p) for p in paths)})")
+
+    originals = string_xpath_calls(session_parser_fixed)
+    try:
+        string_time, expected = time_parses(pages, args.rounds)
+    finally:
+        for name, compiled in originals.items():
+            setattr(session_parser_fixed, name, compiled)
+    print(f"  tree.xpath('...'): {string_time * 1000:8.3f} ms/page")
+
+    compiled_time, actual = time_parses(pages, args.rounds)
+    print(f"  xpath_registry:    {compiled_time * 1000:8.3f} ms/page")
+
+    print(f"  speedup: {string_time / compiled_time:.2f}x "
+          f"({len(originals)} expressions, {(string_time - compiled_time) * 1e6:.0f} us saved per page)")
+    identical = json.dumps(expected, sort_keys=True) == json.dumps(actual, sort_keys=True)
+    print(f"  output identical: {identical}")
+
+
+if __name__ == "__main__":
+    main()
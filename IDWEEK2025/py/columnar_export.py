@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+IDWeek 2025 Columnar Export
+Normalizes parsed session and poster records into Arrow tables in one pass
+(sessions, presentations and speakers; posters and authors) and writes CSV,
+Parquet and XLSX from those same tables. Multi-valued fields such as
+all_tracks stay list columns in Parquet and are joined column-wise for the
+flat formats, and text cleanup runs once per column instead of once per
+cell. Also regenerates the CSVs from saved crawler JSON/JSONL:
+
+    python columnar_export.py --sessions original_data/idweek2025_sessions.json --posters original_data/idweek2025_posters.json --output-dir original_data --formats csv parquet xlsx
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from parse_idweek2025_sessions import PRESENTATION_CSV_FIELDS, SESSION_CSV_FIELDS, _presentation_speaker
+from parse_idweek2025_posters import POSTER_CSV_FIELDS
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+FORMATS = ('csv', 'parquet', 'xlsx')
+
+TEXT = pa.string()
+TEXT_LIST = pa.list_(pa.string())
+COUNT = pa.int64()
+
+# Columns that hold lists, and the separator the flat formats join them with
+# (the same separators the csv.DictWriter exports use)
+LIST_SEPARATORS = {
+    'all_tracks': '; ',
+    'all_speakers': '; ',
+    'disclosures': ' | ',
+    'presentation_titles': ' | ',
+    'presentation_times': ' | ',
+    'presentation_speakers': ' | ',
+    'all_presenting_authors': '; ',
+    'all_co_authors': '; ',
+}
+COLUMN_TYPES = {
+    'session_id': COUNT, 'poster_id': COUNT,
+    'track_count': COUNT, 'total_speakers': COUNT, 'disclosure_count': COUNT, 'presentation_count': COUNT,
+    'speaker_count': COUNT, 'total_presenting_authors': COUNT, 'total_co_authors': COUNT, 'position': COUNT,
+}
+
+SPEAKER_FIELDS = [
+    'session_id', 'presentation_id', 'role', 'position', 'name', 'presenter_id',
+    'title', 'department', 'institution', 'location', 'affiliation',
+]
+AUTHOR_FIELDS = [
+    'poster_id', 'author_type', 'position', 'name', 'presenter_id', 'title', 'institution', 'location', 'affiliation',
+]
+DATETIME_FIELDS = ['start_datetime', 'end_datetime']
+
+
+def table_schema(fields: List[str]) -> pa.Schema:
+    return pa.schema([(name, TEXT_LIST if name in LIST_SEPARATORS else COLUMN_TYPES.get(name, TEXT))
+                      for name in fields])
+
+
+SESSION_SCHEMA = table_schema(SESSION_CSV_FIELDS + DATETIME_FIELDS)
+PRESENTATION_SCHEMA = table_schema(PRESENTATION_CSV_FIELDS + ['speaker_count'] + DATETIME_FIELDS)
+SPEAKER_SCHEMA = table_schema(SPEAKER_FIELDS)
+POSTER_SCHEMA = table_schema(POSTER_CSV_FIELDS + DATETIME_FIELDS)
+AUTHOR_SCHEMA = table_schema(AUTHOR_FIELDS)
+
+
+class TableBuilder:
+    """Column lists for one table, appended to a row at a time and turned into an Arrow table once"""
+
+    def __init__(self, schema: pa.Schema):
+        self.schema = schema
+        self.columns = {field.name: [] for field in schema}
+
+    def append(self, values: Dict[str, Any]):
+        for name, column in self.columns.items():
+            column.append(values.get(name))
+
+    def to_table(self) -> pa.Table:
+        return pa.table([clean_column(column_array(self.columns[field.name], field.type)) for field in self.schema],
+                        schema=self.schema)
+
+
+def column_array(values: List[Any], column_type: pa.DataType) -> pa.Array:
+    """Arrow array for one collected column; missing text is '', missing lists are []"""
+    try:
+        array = pa.array(values, type=column_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # A few fields arrive as numbers in some records (e.g. presenter_id)
+        array = pa.array([value if value is None or isinstance(value, (str, list)) else str(value)
+                          for value in values], type=column_type)
+    if column_type == TEXT:
+        return pc.fill_null(array, '')
+    if column_type == TEXT_LIST:
+        return pc.fill_null(array, pa.scalar([], type=TEXT_LIST))
+    return array
+
+
+def _count(value) -> Optional[int]:
+    """Integer column value (IDs arrive as int or digit strings)"""
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def clean_column(column):
+    """Text cleanup for a whole column: newlines become '; ', carriage returns go, ends are trimmed"""
+    if column.type not in (TEXT, TEXT_LIST):
+        return column
+    column = column.combine_chunks() if isinstance(column, pa.ChunkedArray) else column
+    if column.type == TEXT_LIST:
+        return pa.ListArray.from_arrays(column.offsets, clean_column(column.values))
+    column = pc.replace_substring(column, '\n', '; ')
+    column = pc.replace_substring(column, '\r', '')
+    return pc.utf8_trim_whitespace(column)
+
+
+def session_tables(sessions: Iterable[Dict[str, Any]]) -> Dict[str, pa.Table]:
+    """
+    Sessions, presentations and speakers tables from parsed session records, in one pass
+
+    Error records (parser failures) are skipped. Session speakers have an
+    empty presentation_id; presentation speakers carry theirs.
+    """
+    session_rows = TableBuilder(SESSION_SCHEMA)
+    presentation_rows = TableBuilder(PRESENTATION_SCHEMA)
+    speaker_rows = TableBuilder(SPEAKER_SCHEMA)
+
+    for session in sessions:
+        if 'error' in session:
+            continue
+        session_id = _count(session.get('session_id'))
+        tracks = session.get('tracks', {})
+        info = session.get('session_info', {})
+        schedule = session.get('schedule', {})
+        speakers = session.get('speakers', [])
+        if isinstance(speakers, dict):
+            speakers = [speaker for role_speakers in speakers.values() for speaker in role_speakers]
+        presentations = session.get('presentations', [])
+        disclosures = session.get('disclosures', [])
+
+        row = {
+            'session_id': session_id,
+            'source_url': session.get('source_url'),
+            'primary_track': tracks.get('primary_track'),
+            'all_tracks': tracks.get('all_tracks'),
+            'track_count': _count(tracks.get('track_count', 0)),
+            'session_type': info.get('type'),
+            'session_number': info.get('number'),
+            'session_title': info.get('title'),
+            'full_title': info.get('full_title'),
+            'total_speakers': len(speakers),
+            'all_speakers': [speaker.get('name', '') for speaker in speakers],
+            'disclosure_count': len(disclosures),
+            'disclosures': [f"{d.get('speaker', '')}: {d.get('disclosure', '')}" for d in disclosures],
+            'presentation_count': len(presentations),
+            'presentation_titles': [p.get('title', '') for p in presentations],
+            'presentation_times': [p.get('time', '') for p in presentations],
+            'presentation_speakers': [_presentation_speaker(p).get('name', '') for p in presentations],
+        }
+        row.update(schedule)
+        row.update(session.get('credits', {}))
+        if speakers:
+            row.update({f"primary_speaker_{key}": speakers[0].get(key)
+                        for key in ('name', 'title', 'department', 'institution', 'location')})
+        session_rows.append(row)
+
+        for position, speaker in enumerate(speakers, 1):
+            speaker_rows.append(dict(speaker, session_id=session_id, presentation_id='', position=position,
+                                     affiliation=speaker.get('full_affiliation')))
+
+        for pres in presentations:
+            speaker = _presentation_speaker(pres)
+            presentation_rows.append({
+                'session_id': session_id,
+                'session_type': info.get('type'),
+                'session_title': info.get('title'),
+                'session_date': schedule.get('date'),
+                'session_location': schedule.get('location'),
+                'presentation_id': pres.get('presentation_id'),
+                'presentation_time': pres.get('time'),
+                'presentation_title': pres.get('title'),
+                'speaker_name': speaker.get('name'),
+                'speaker_affiliation': speaker.get('affiliation'),
+                'speaker_count': len(pres.get('speakers') or []),
+                'start_datetime': pres.get('start_datetime'),
+                'end_datetime': pres.get('end_datetime'),
+            })
+            for position, pres_speaker in enumerate(pres.get('speakers') or [], 1):
+                speaker_rows.append(dict(pres_speaker, session_id=session_id,
+                                         presentation_id=pres.get('presentation_id'), position=position))
+
+    return {
+        'sessions': session_rows.to_table(),
+        'presentations': presentation_rows.to_table(),
+        'speakers': speaker_rows.to_table(),
+    }
+
+
+def poster_tables(posters: Iterable[Dict[str, Any]]) -> Dict[str, pa.Table]:
+    """Posters and authors tables from parsed poster records, in one pass (error records skipped)"""
+    poster_rows = TableBuilder(POSTER_SCHEMA)
+    author_rows = TableBuilder(AUTHOR_SCHEMA)
+
+    for poster in posters:
+        if 'error' in poster:
+            continue
+        poster_id = _count(poster.get('poster_id'))
+        track = poster.get('track_info', {})
+        details = poster.get('presentation_details', {})
+        authors = poster.get('authors', {})
+        presenting = authors.get('presenting', [])
+        co_authors = authors.get('co_authors', [])
+
+        row = {
+            'poster_id': poster_id,
+            'source_url': poster.get('source_url'),
+            'track_code': track.get('code'),
+            'track_name': track.get('full_name'),
+            'session_type': poster.get('session_info', {}).get('type'),
+            'presentation_id': details.get('id'),
+            'title': details.get('title'),
+            'total_presenting_authors': len(presenting),
+            'total_co_authors': len(co_authors),
+            'all_presenting_authors': [author.get('name', '') for author in presenting],
+            'all_co_authors': [author.get('name', '') for author in co_authors],
+        }
+        row.update(poster.get('schedule', {}))
+        if presenting:
+            row.update({f"presenting_author_{key}": presenting[0].get(key)
+                        for key in ('name', 'title', 'institution', 'location')})
+        poster_rows.append(row)
+
+        for author_type, people in (('presenting', presenting), ('co_author', co_authors)):
+            for position, author in enumerate(people, 1):
+                author_rows.append(dict(author, poster_id=poster_id, author_type=author_type, position=position,
+                                        affiliation=author.get('affiliation_full')))
+
+    return {
+        'posters': poster_rows.to_table(),
+        'authors': author_rows.to_table(),
+    }
+
+
+def flat_table(table: pa.Table) -> pa.Table:
+    """The table with every list column joined into text, for CSV and XLSX"""
+    columns = []
+    for field, column in zip(table.schema, table.columns):
+        if field.type == TEXT_LIST:
+            column = pc.binary_join(column, LIST_SEPARATORS.get(field.name, '; '))
+        columns.append(column)
+    return pa.table(columns, names=table.column_names)
+
+
+def write_csv(table: pa.Table, path: str):
+    pa_csv.write_csv(flat_table(table), path, write_options=pa_csv.WriteOptions(quoting_style='needed'))
+
+
+def write_parquet(table: pa.Table, path: str):
+    pq.write_table(table, path, compression='zstd')
+
+
+def write_xlsx(table: pa.Table, path: str, sheet_name: str):
+    # openpyxl is only needed for XLSX output
+    from openpyxl import Workbook
+
+    flat = flat_table(table)
+    # Control characters other than tab/newline are not allowed in worksheet cells
+    columns = [pc.replace_substring_regex(column, r'[\x00-\x08\x0b\x0c\x0e-\x1f]', '').to_pylist()
+               if column.type == TEXT else column.to_pylist() for column in flat.columns]
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name[:31])
+    sheet.append(flat.column_names)
+    for row in zip(*columns):
+        sheet.append(row)
+    workbook.save(path)
+
+
+def write_tables(tables: Dict[str, pa.Table], output_dir: str = '.', prefix: str = 'idweek2025',
+                 formats: Iterable[str] = ('csv',)) -> List[str]:
+    """
+    Write each table as {prefix}_{name}.{format} in output_dir
+
+    Args:
+        tables: Table name -> Arrow table, from session_tables / poster_tables
+        output_dir: Directory the files go in
+        prefix: File name prefix
+        formats: Any of 'csv', 'parquet', 'xlsx'
+
+    Returns:
+        Paths written
+    """
+    paths = []
+    for file_format in formats:
+        if file_format not in FORMATS:
+            raise ValueError(f"Unknown export format '{file_format}' (expected one of {', '.join(FORMATS)})")
+        for name, table in tables.items():
+            path = os.path.join(output_dir, f"{prefix}_{name}.{file_format}")
+            if file_format == 'csv':
+                write_csv(table, path)
+            elif file_format == 'parquet':
+                write_parquet(table, path)
+            else:
+                write_xlsx(table, path, name)
+            logger.info(f"Saved {table.num_rows} {name} rows to {path}")
+            paths.append(path)
+    return paths
+
+
+def read_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Records from a crawler .json (array) or .jsonl output file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export parsed IDWeek sessions and posters as CSV/Parquet/XLSX tables')
+    parser.add_argument('--sessions', nargs='*', default=[], help='Session crawler output (.json or .jsonl)')
+    parser.add_argument('--posters', nargs='*', default=[], help='Poster crawler output (.json or .jsonl)')
+    parser.add_argument('--output-dir', default='.', help='Directory for the exported files')
+    parser.add_argument('--prefix', default='idweek2025', help='Output file name prefix')
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=['csv'], help='Formats to write')
+    args = parser.parse_args()
+
+    if not args.sessions and not args.posters:
+        parser.error('give --sessions and/or --posters')
+
+    started = time.time()
+    tables = {}
+    if args.sessions:
+        tables.update(session_tables(record for path in args.sessions for record in read_records(path)))
+    if args.posters:
+        tables.update(poster_tables(record for path in args.posters for record in read_records(path)))
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    paths = write_tables(tables, args.output_dir, args.prefix, args.formats)
+    logger.info(f"Wrote {len(paths)} files in {time.time() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
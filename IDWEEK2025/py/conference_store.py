@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Conference Data Store
+One partitioned Parquet dataset for every conference's extracted data,
+laid out as conference=IDWEEK/year=2025/entity=sessions/part-0.parquet,
+with a fixed schema per entity (sessions, presentations, speakers, posters,
+authors) so the IDWeek crawlers and the ESCMID extractors write the same
+columns. Readers go through load_table(), which opens only the entity's
+files (memory-mapped), reads only the requested columns and skips
+partitions and row groups the filters rule out:
+
+    load_table('posters', columns=['poster_id', 'title'], filters=[('conference', '=', 'ESCMID')])
+
+The CLI ingests saved extractor output and lists what the store holds:
+
+    python conference_store.py ingest-idweek --sessions original_data/idweek2025_sessions.json --posters original_data/idweek2025_posters.json
+    python conference_store.py ingest-escmid-posters "ESCMID 2025/2025/ESCMID-2025-Posters.json" --year 2025
+    python conference_store.py ingest-escmid-programme "ESCMID 2025/2025/FinalProgramme_Full_v2.html" --year 2025
+    python conference_store.py list
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pa_fs
+import pyarrow.parquet as pq
+
+from columnar_export import (AUTHOR_SCHEMA, DATETIME_FIELDS, POSTER_SCHEMA, PRESENTATION_SCHEMA, SESSION_SCHEMA,
+                             SPEAKER_SCHEMA, TEXT, TableBuilder, poster_tables, read_records, session_tables)
+from datetime_normalizer import normalize_date, normalize_schedule, to_iso_datetime
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'conference_store')
+PART_FILE = 'part-0.parquet'
+ROW_GROUP_SIZE = 16384
+
+# IDs are text in the store: IDWeek's are numbers, ESCMID's are codes like "P0001" and "EW001"
+ID_COLUMNS = ('session_id', 'poster_id')
+
+
+def canonical_schema(schema: pa.Schema, extra: Iterable[str] = ()) -> pa.Schema:
+    return pa.schema([(field.name, TEXT if field.name in ID_COLUMNS else field.type) for field in schema] +
+                     [(name, TEXT) for name in extra])
+
+
+ENTITY_SCHEMAS = {
+    'sessions': canonical_schema(SESSION_SCHEMA),
+    'presentations': canonical_schema(PRESENTATION_SCHEMA),
+    'speakers': canonical_schema(SPEAKER_SCHEMA),
+    'posters': canonical_schema(POSTER_SCHEMA, ['abstract_number']),
+    'authors': canonical_schema(AUTHOR_SCHEMA),
+}
+# Row order within a partition, so row-group statistics on these columns can skip data;
+# unknown datetimes are null and sort last
+SORT_KEYS = {
+    'sessions': ['start_datetime', 'session_id'],
+    'presentations': ['start_datetime', 'session_id'],
+    'speakers': ['session_id', 'presentation_id'],
+    'posters': ['start_datetime', 'poster_id'],
+    'authors': ['poster_id'],
+}
+# ESCMID programmes print venue-local times without a zone; the congress is in Central Europe
+ESCMID_TIMEZONE = 'CET'
+PARTITION_SCHEMA = pa.schema([('conference', TEXT), ('year', pa.int32())])
+
+
+def conform_table(table: pa.Table, entity: str) -> pa.Table:
+    """
+    The table in the entity's store schema
+
+    Columns are put in schema order and cast to the schema types, missing
+    columns are filled with nulls, and columns the schema does not have
+    are dropped (with a warning). Empty start/end datetimes become nulls, so
+    undated rows neither sort first nor compare as '' in range filters.
+    """
+    if entity not in ENTITY_SCHEMAS:
+        raise ValueError(f"Unknown entity '{entity}' (expected one of {', '.join(ENTITY_SCHEMAS)})")
+    schema = ENTITY_SCHEMAS[entity]
+    unknown = [name for name in table.column_names if name not in schema.names]
+    if unknown:
+        logger.warning(f"Dropping columns not in the {entity} schema: {', '.join(unknown)}")
+
+    columns = []
+    for field in schema:
+        if field.name in table.column_names:
+            column = table[field.name].cast(field.type)
+            if field.name in DATETIME_FIELDS:
+                column = pc.if_else(pc.equal(column, ''), pa.scalar(None, field.type), column)
+            columns.append(column)
+        else:
+            columns.append(pa.nulls(table.num_rows, field.type))
+    return pa.table(columns, schema=schema)
+
+
+def partition_dir(root: str, conference: str, year: int, entity: str) -> str:
+    if not conference or '/' in conference or '=' in conference:
+        raise ValueError(f"Invalid conference name '{conference}'")
+    return os.path.join(root, f"conference={conference}", f"year={int(year)}", f"entity={entity}")
+
+
+def write_entity(table: pa.Table, entity: str, conference: str, year: int, root: str = DEFAULT_STORE_DIR) -> str:
+    """
+    Replace one conference/year/entity partition with the table
+
+    The file is written next to its final name and renamed into place, so
+    readers never see a half-written partition.
+
+    Returns:
+        Path of the partition file
+    """
+    table = conform_table(table, entity)
+    table = table.sort_by([(key, 'ascending') for key in SORT_KEYS[entity]])
+    directory = partition_dir(root, conference, year, entity)
+    os.makedirs(directory, exist_ok=True)
+
+    path = os.path.join(directory, PART_FILE)
+    temp_path = f"{path}.tmp"
+    pq.write_table(table, temp_path, compression='zstd', row_group_size=ROW_GROUP_SIZE)
+    os.replace(temp_path, path)
+    logger.info(f"Stored {table.num_rows} {entity} rows for {conference} {year} in {path}")
+    return path
+
+
+def write_store(tables: Dict[str, pa.Table], conference: str, year: int, root: str = DEFAULT_STORE_DIR) -> List[str]:
+    """
+    Write each entity table (from session_tables / poster_tables or the ESCMID converters) to the store
+
+    Returns:
+        Partition files written
+    """
+    return [write_entity(table, entity, conference, year, root) for entity, table in tables.items()]
+
+
+def entity_files(entity: str, root: str = DEFAULT_STORE_DIR) -> List[str]:
+    return sorted(glob.glob(os.path.join(root, 'conference=*', 'year=*', f"entity={entity}", '*.parquet')))
+
+
+def entity_dataset(entity: str, root: str = DEFAULT_STORE_DIR) -> ds.Dataset:
+    """
+    Dataset over every conference and year of one entity
+
+    Has the entity's store columns plus conference and year, which come from
+    the directory names, so filtering on them opens only matching files.
+    """
+    if entity not in ENTITY_SCHEMAS:
+        raise ValueError(f"Unknown entity '{entity}' (expected one of {', '.join(ENTITY_SCHEMAS)})")
+    schema = pa.unify_schemas([ENTITY_SCHEMAS[entity], PARTITION_SCHEMA])
+    return ds.dataset(entity_files(entity, root), schema=schema, format='parquet',
+                      filesystem=pa_fs.LocalFileSystem(use_mmap=True),
+                      partitioning=ds.partitioning(PARTITION_SCHEMA, flavor='hive'),
+                      partition_base_dir=os.path.abspath(root))
+
+
+def load_table(entity: str, columns: Optional[List[str]] = None, filters=None, conference: Optional[str] = None,
+               year: Optional[int] = None, root: str = DEFAULT_STORE_DIR) -> pa.Table:
+    """
+    Read one entity from the store
+
+    Args:
+        entity: sessions, presentations, speakers, posters or authors
+        columns: Columns to read (default: all, plus conference and year)
+        filters: A pyarrow.dataset expression, or (column, op, value) tuples
+            in pyarrow.parquet's filters form, e.g. [('date', '=', 'Tuesday, October 21, 2025')]
+        conference: Only this conference
+        year: Only this year
+        root: Store directory
+
+    Returns:
+        Arrow table (call .to_pandas() for a DataFrame)
+    """
+    expression = filters
+    if isinstance(filters, list):
+        expression = pq.filters_to_expression(filters) if filters else None
+    if conference:
+        expression = _and(expression, pc.field('conference') == conference)
+    if year:
+        expression = _and(expression, pc.field('year') == int(year))
+    return entity_dataset(entity, root).to_table(columns=columns, filter=expression)
+
+
+def _and(expression, condition):
+    return condition if expression is None else expression & condition
+
+
+def list_partitions(root: str = DEFAULT_STORE_DIR) -> List[Dict[str, Any]]:
+    """conference, year, entity, rows and path of every partition (row counts from the Parquet footers)"""
+    partitions = []
+    for entity in ENTITY_SCHEMAS:
+        for path in entity_files(entity, root):
+            parts = dict(part.split('=', 1) for part in os.path.relpath(path, root).split(os.sep)[:-1])
+            partitions.append({
+                'conference': parts['conference'],
+                'year': int(parts['year']),
+                'entity': entity,
+                'rows': pq.read_metadata(path).num_rows,
+                'path': path,
+            })
+    return sorted(partitions, key=lambda p: (p['conference'], p['year'], p['entity']))
+
+
+def escmid_poster_tables(posters: Iterable[Dict[str, Any]], year: int,
+                         timezone: str = ESCMID_TIMEZONE) -> Dict[str, pa.Table]:
+    """
+    Posters and authors tables from ESCMID poster extractor records
+
+    Records are poster-data-extractor-v3.py's: poster_id, abstract_number,
+    sector/row/position, title, date ("12/04 12:00"), session, presenter
+    and co_authors. The printed times are local to the venue; timezone (a
+    datetime_normalizer.TIMEZONES label) gives start_datetime its offset.
+    """
+    poster_rows = TableBuilder(ENTITY_SCHEMAS['posters'])
+    author_rows = TableBuilder(ENTITY_SCHEMAS['authors'])
+
+    for poster in posters:
+        day, _, clock = (poster.get('date') or '').partition(' ')
+        presenter = poster.get('presenter') or ''
+        co_authors = poster.get('co_authors') or []
+        board = [f"{label} {poster[key]}" for label, key in (('Sector', 'sector'), ('Row', 'row'),
+                                                              ('Position', 'position')) if poster.get(key)]
+        poster_rows.append({
+            'poster_id': poster.get('poster_id'),
+            'abstract_number': poster.get('abstract_number'),
+            'track_name': poster.get('session'),
+            'session_type': 'Poster',
+            'title': poster.get('title'),
+            'date': day,
+            'time': clock,
+            'location': ', '.join(board),
+            'presenting_author_name': presenter,
+            'total_presenting_authors': 1 if presenter else 0,
+            'total_co_authors': len(co_authors),
+            'all_presenting_authors': [presenter] if presenter else [],
+            'all_co_authors': co_authors,
+            'start_datetime': to_iso_datetime(normalize_date(day, year), clock, timezone) if day else '',
+        })
+
+        people = [('presenting', presenter)] if presenter else []
+        people += [('co_author', name) for name in co_authors]
+        positions = {}
+        for author_type, name in people:
+            positions[author_type] = positions.get(author_type, 0) + 1
+            author_rows.append({'poster_id': poster.get('poster_id'), 'author_type': author_type,
+                                'position': positions[author_type], 'name': name})
+
+    return {
+        'posters': poster_rows.to_table(),
+        'authors': author_rows.to_table(),
+    }
+
+
+def escmid_programme_tables(records: Iterable[Dict[str, Any]],
+                            timezone: str = ESCMID_TIMEZONE) -> Dict[str, pa.Table]:
+    """
+    Sessions, presentations and speakers tables from the ESCMID programme records
+    of ListingStreamParser (kind session / presentation, in programme order),
+    with start/end datetimes in the venue's timezone
+    """
+    sessions = {}
+    presentations = []
+    speaker_rows = TableBuilder(ENTITY_SCHEMAS['speakers'])
+
+    for record in records:
+        time_text = f"{record['start']} - {record['end']}" if record.get('end') else record.get('start', '')
+        schedule = normalize_schedule(record.get('date', ''), time_text, timezone)
+        names = [presenter['name'] for presenter in record.get('presenters', [])]
+        if record['kind'] == 'session':
+            session_id = record['code']
+            presenters = record.get('presenters', [])
+            sessions[session_id] = {
+                'session_id': session_id,
+                'session_type': record.get('session_type'),
+                'session_number': session_id,
+                'session_title': record.get('title'),
+                'full_title': f"{session_id} {record.get('title', '')}".strip(),
+                'date': record.get('date'),
+                'time': time_text,
+                'location': record.get('location'),
+                'primary_speaker_name': presenters[0]['name'] if presenters else None,
+                'primary_speaker_location': presenters[0]['location'] if presenters else None,
+                'total_speakers': len(presenters),
+                'all_speakers': names,
+                'presentation_titles': [],
+                'presentation_times': [],
+                'presentation_speakers': [],
+                **schedule,
+            }
+            presentation_id = ''
+        else:
+            session_id = record.get('parent_code', '')
+            presentation_id = record['code']
+            session = sessions.get(session_id, {})
+            presentations.append({
+                'session_id': session_id,
+                'session_type': session.get('session_type'),
+                'session_title': session.get('session_title'),
+                'session_date': record.get('date'),
+                'session_location': session.get('location'),
+                'presentation_id': presentation_id,
+                'presentation_time': record.get('start'),
+                'presentation_title': record.get('title'),
+                'speaker_name': names[0] if names else None,
+                'speaker_affiliation': record['presenters'][0]['location'] if names else None,
+                'speaker_count': len(names),
+                **schedule,
+            })
+            if session:
+                session['presentation_titles'].append(record.get('title', ''))
+                session['presentation_times'].append(record.get('start', ''))
+                session['presentation_speakers'].append(names[0] if names else '')
+
+        for position, presenter in enumerate(record.get('presenters', []), 1):
+            speaker_rows.append({'session_id': session_id, 'presentation_id': presentation_id, 'position': position,
+                                 'name': presenter['name'], 'location': presenter['location'],
+                                 'affiliation': presenter['location']})
+
+    session_rows = TableBuilder(ENTITY_SCHEMAS['sessions'])
+    for session in sessions.values():
+        session['presentation_count'] = len(session['presentation_titles'])
+        session_rows.append(session)
+    presentation_rows = TableBuilder(ENTITY_SCHEMAS['presentations'])
+    for presentation in presentations:
+        presentation_rows.append(presentation)
+
+    return {
+        'sessions': session_rows.to_table(),
+        'presentations': presentation_rows.to_table(),
+        'speakers': speaker_rows.to_table(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Partitioned Parquet store of extracted conference data')
+    parser.add_argument('--store', default=DEFAULT_STORE_DIR, help='Store directory')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    idweek = commands.add_parser('ingest-idweek', help='Store IDWeek crawler output (.json or .jsonl)')
+    idweek.add_argument('--sessions', nargs='*', default=[], help='Session crawler output')
+    idweek.add_argument('--posters', nargs='*', default=[], help='Poster crawler output')
+    idweek.add_argument('--conference', default='IDWEEK', help='Conference partition name')
+    idweek.add_argument('--year', type=int, default=2025, help='Conference year')
+
+    escmid_posters = commands.add_parser('ingest-escmid-posters', help='Store ESCMID poster extractor JSON')
+    escmid_posters.add_argument('file', help='JSON written by poster-data-extractor-v3.py')
+    escmid_posters.add_argument('--conference', default='ESCMID', help='Conference partition name')
+    escmid_posters.add_argument('--year', type=int, required=True, help='Conference year')
+    escmid_posters.add_argument('--timezone', default=ESCMID_TIMEZONE, help='Time zone label of the printed times')
+
+    escmid_programme = commands.add_parser('ingest-escmid-programme', help='Store the sessions of a saved ESCMID programme')
+    escmid_programme.add_argument('file', help='Saved programme HTML')
+    escmid_programme.add_argument('--conference', default='ESCMID', help='Conference partition name')
+    escmid_programme.add_argument('--year', type=int, required=True, help='Conference year')
+    escmid_programme.add_argument('--timezone', default=ESCMID_TIMEZONE, help='Time zone label of the printed times')
+
+    commands.add_parser('list', help='List the stored partitions')
+    args = parser.parse_args()
+
+    started = time.time()
+    if args.command == 'list':
+        for partition in list_partitions(args.store):
+            print(f"{partition['conference']:<10} {partition['year']}  {partition['entity']:<14} "
+                  f"{partition['rows']:>8} rows  {partition['path']}")
+        return
+
+    tables = {}
+    if args.command == 'ingest-idweek':
+        if not args.sessions and not args.posters:
+            parser.error('give --sessions and/or --posters')
+        if args.sessions:
+            tables.update(session_tables(record for path in args.sessions for record in read_records(path)))
+        if args.posters:
+            tables.update(poster_tables(record for path in args.posters for record in read_records(path)))
+    elif args.command == 'ingest-escmid-posters':
+        with open(args.file, 'r', encoding='utf-8') as f:
+            tables.update(escmid_poster_tables(json.load(f), args.year, args.timezone))
+    else:
+        from listing_stream_parser import ListingStreamParser
+        tables.update(escmid_programme_tables(ListingStreamParser().iter_file(args.file), args.timezone))
+
+    paths = write_store(tables, args.conference, args.year, args.store)
+    logger.info(f"Wrote {len(paths)} partitions in {time.time() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
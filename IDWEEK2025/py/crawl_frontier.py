@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Persistent Crawl Frontier
+SQLite journal of per-ID crawl outcomes: status, HTTP code, content hash,
+parse outcome and the parsed record. Every ID is committed as soon as it
+finishes, so a crashed crawl can be resumed without refetching the IDs
+that already completed.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_FRONTIER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'crawl_frontier.db')
+
+# status: 'done' (fetched and parsed) or 'failed' (fetch or parse failed)
+# parse_status: 'parsed', 'error', or NULL when the page never arrived
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS frontier (
+        kind TEXT NOT NULL,
+        item_id INTEGER NOT NULL,
+        url TEXT,
+        status TEXT NOT NULL,
+        http_status INTEGER,
+        content_hash TEXT,
+        parse_status TEXT,
+        error TEXT,
+        record TEXT,
+        attempts INTEGER NOT NULL DEFAULT 1,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (kind, item_id)
+    )
+"""
+
+
+class CrawlFrontier:
+    """Per-kind crawl journal backed by SQLite"""
+
+    def __init__(self, db_path: str = DEFAULT_FRONTIER_PATH, kind: str = 'session'):
+        """
+        Args:
+            db_path: SQLite database file (':memory:' for a throwaway frontier)
+            kind: Record kind sharing the database, e.g. 'session' or 'poster'
+        """
+        self.db_path = db_path
+        self.kind = kind
+        self.connection = sqlite3.connect(db_path)
+        if db_path != ':memory:':
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute(SCHEMA)
+        self.connection.commit()
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+
+    def reset(self, start_id: int, end_id: int):
+        """Forget every outcome in an ID range, for a fresh (non-resumed) crawl"""
+        self.connection.execute(
+            "DELETE FROM frontier WHERE kind = ? AND item_id BETWEEN ? AND ?",
+            (self.kind, start_id, end_id)
+        )
+        self.connection.commit()
+
+    def completed_ids(self, start_id: int, end_id: int) -> Set[int]:
+        """IDs in the range that were fetched and parsed successfully"""
+        rows = self.connection.execute(
+            "SELECT item_id FROM frontier WHERE kind = ? AND status = 'done' AND item_id BETWEEN ? AND ?",
+            (self.kind, start_id, end_id)
+        )
+        return {row[0] for row in rows}
+
+    def failed_ids(self, start_id: int, end_id: int) -> List[int]:
+        """IDs in the range whose last attempt failed"""
+        rows = self.connection.execute(
+            "SELECT item_id FROM frontier WHERE kind = ? AND status = 'failed' AND item_id BETWEEN ? AND ? ORDER BY item_id",
+            (self.kind, start_id, end_id)
+        )
+        return [row[0] for row in rows]
+
+    def record_outcome(self, item_id: int, url: str, http_status: Optional[int] = None,
+                       content_hash: Optional[str] = None, record: Optional[Dict[str, Any]] = None,
+                       error: Optional[str] = None):
+        """
+        Journal the outcome of one ID and commit immediately
+
+        A record without an 'error' key marks the ID done; a fetch error, or a
+        record carrying the parser's 'error' key, marks it failed.
+        """
+        if record is None:
+            parse_status = None
+        elif 'error' in record:
+            parse_status = 'error'
+            error = error or record['error']
+        else:
+            parse_status = 'parsed'
+
+        status = 'done' if parse_status == 'parsed' and not error else 'failed'
+
+        self.connection.execute("""
+            INSERT INTO frontier
+                (kind, item_id, url, status, http_status, content_hash, parse_status, error, record, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (kind, item_id) DO UPDATE SET
+                url = excluded.url,
+                status = excluded.status,
+                http_status = excluded.http_status,
+                content_hash = excluded.content_hash,
+                parse_status = excluded.parse_status,
+                error = excluded.error,
+                record = excluded.record,
+                attempts = frontier.attempts + 1,
+                updated_at = excluded.updated_at
+        """, (
+            self.kind, item_id, url, status, http_status, content_hash, parse_status, error,
+            json.dumps(record, ensure_ascii=False) if record is not None else None,
+            datetime.now().isoformat()
+        ))
+        self.connection.commit()
+
+    def records(self, start_id: int, end_id: int) -> Iterator[Dict[str, Any]]:
+        """Parsed records in the range, ordered by ID (includes parser error records)"""
+        rows = self.connection.execute(
+            "SELECT record FROM frontier WHERE kind = ? AND record IS NOT NULL AND item_id BETWEEN ? AND ? ORDER BY item_id",
+            (self.kind, start_id, end_id)
+        )
+        for row in rows:
+            yield json.loads(row[0])
+
+    def summary(self, start_id: int, end_id: int) -> Dict[str, int]:
+        """Count of IDs per status in the range"""
+        rows = self.connection.execute(
+            "SELECT status, COUNT(*) FROM frontier WHERE kind = ? AND item_id BETWEEN ? AND ? GROUP BY status",
+            (self.kind, start_id, end_id)
+        )
+        return {status: count for status, count in rows}
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+IDWeek 2025 Date/Time Normalizer
+Precompiled date and time patterns shared by the session, poster and faculty
+parsers, the IDWeek 2024 schedule script and the ESCMID session extractor,
+with memoized normalizers that turn "Tuesday, October 21, 2025" and
+"12:15 PM - 1:30 PM US ET" into ISO dates, 24-hour clock times and
+ISO datetimes with UTC offsets. A conference only has a handful of distinct
+days and time slots, repeated across thousands of records, so almost every
+call is a cache hit.
+"""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7, 'aug': 8,
+    'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+# Time zone labels printed next to session times, and their IANA zones
+TIMEZONES = {
+    'US ET': 'America/New_York',
+    'US CT': 'America/Chicago',
+    'US MT': 'America/Denver',
+    'US PT': 'America/Los_Angeles',
+    'CET': 'CET',
+    'CEST': 'CET',
+}
+
+# Anything before the weekday ("Date: Tuesday, ...")
+WEEKDAY_PREFIX_RE = re.compile(r'^.*?(\w+day,?\s+)', re.IGNORECASE)
+# Tuesday, October 21, 2025
+WEEKDAY_DATE_RE = re.compile(r'(\w+),\s+(\w+)\s+(\d+),\s+(\d+)', re.IGNORECASE)
+# October 21, 2025
+MONTH_DATE_RE = re.compile(r'(\w+)\s+(\d+),\s+(\d+)', re.IGNORECASE)
+# 10/21/2025
+NUMERIC_DATE_RE = re.compile(r'(\d+)/(\d+)/(\d+)')
+# 11 April 2025 (ESCMID programme day headings)
+DAY_MONTH_DATE_RE = re.compile(r'(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})')
+# 11/04 (ESCMID session headers: day/month, no year)
+DAY_MONTH_RE = re.compile(r'(\d{2})/(\d{2})')
+
+# 12:15 PM
+CLOCK_12H_RE = re.compile(r'\d+:\d+ [AP]M')
+# 12:15 PM - 1:30 PM US ET, 08:45 - 10:15 CET, 2:05 PM
+TIME_RANGE_RE = re.compile(
+    r'(\d{1,2}):(\d{2})\s*([AaPp][Mm])?'
+    r'(?:\s*[-–]\s*(\d{1,2}):(\d{2})\s*([AaPp][Mm])?)?'
+    r'\s*(US [ECMP]T|CES?T)?'
+)
+# 08:45 - 10:15 (24-hour ranges in the ESCMID session headers)
+TIME_RANGE_24H_RE = re.compile(r'(\d{2}:\d{2})\s*-\s*(\d{2}:\d{2})')
+# "8:00 AM - 12:00 PM US ET" -> "8:00 AM - 12:00 PM", "US ET"
+TIMEZONE_SUFFIX_RE = re.compile(r'\s*(US [ECMP]T|CES?T)\s*$')
+
+
+def _iso_date(year: int, month: Optional[int], day: int) -> Optional[str]:
+    if not month:
+        return None
+    try:
+        datetime(year, month, day)
+    except ValueError:
+        return None
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+@lru_cache(maxsize=4096)
+def normalize_date(text: str, default_year: Optional[int] = None) -> Optional[str]:
+    """
+    ISO date (YYYY-MM-DD) from a conference date string
+
+    Args:
+        text: "Tuesday, October 21, 2025", "October 21, 2025", "10/21/2025",
+            "Friday, 11 April 2025", or "11/04" (day/month) with default_year
+        default_year: Year for day/month dates that do not give one
+
+    Returns:
+        The ISO date, or None if the text holds no recognisable date
+    """
+    if not text:
+        return None
+    text = WEEKDAY_PREFIX_RE.sub(r'\1', text)
+
+    match = WEEKDAY_DATE_RE.search(text)
+    if match:
+        date = _iso_date(int(match.group(4)), MONTHS.get(match.group(2).lower()), int(match.group(3)))
+        if date:
+            return date
+
+    match = MONTH_DATE_RE.search(text)
+    if match:
+        if match.group(1).isdigit():
+            date = _iso_date(int(match.group(3)), int(match.group(1)), int(match.group(2)))
+        else:
+            date = _iso_date(int(match.group(3)), MONTHS.get(match.group(1).lower()), int(match.group(2)))
+        if date:
+            return date
+
+    match = NUMERIC_DATE_RE.search(text)
+    if match:
+        date = _iso_date(int(match.group(3)), int(match.group(1)), int(match.group(2)))
+        if date:
+            return date
+
+    match = DAY_MONTH_DATE_RE.search(text)
+    if match:
+        date = _iso_date(int(match.group(3)), MONTHS.get(match.group(2).lower()), int(match.group(1)))
+        if date:
+            return date
+
+    if default_year:
+        match = DAY_MONTH_RE.search(text)
+        if match:
+            return _iso_date(default_year, int(match.group(2)), int(match.group(1)))
+
+    return None
+
+
+def _clock(hour: str, minute: str, meridiem: Optional[str]) -> str:
+    hour = int(hour)
+    if meridiem:
+        if meridiem.upper() == 'PM' and hour != 12:
+            hour += 12
+        elif meridiem.upper() == 'AM' and hour == 12:
+            hour = 0
+    return f"{hour:02d}:{int(minute):02d}"
+
+
+@lru_cache(maxsize=4096)
+def normalize_time_range(text: str) -> Tuple[str, str, str]:
+    """
+    24-hour start and end times and time zone label from a time string
+
+    Args:
+        text: "12:15 PM - 1:30 PM US ET", "12:15 PM - 1:30 PMUS ET" (get_text),
+            "08:45 - 10:15 CET" or a single "2:05 PM"
+
+    Returns:
+        (start, end, timezone), e.g. ('12:15', '13:30', 'US ET'); parts
+        not in the text are empty strings
+    """
+    match = TIME_RANGE_RE.search(text or '')
+    if not match:
+        return '', '', ''
+    start = _clock(match.group(1), match.group(2), match.group(3))
+    end = _clock(match.group(4), match.group(5), match.group(6)) if match.group(4) else ''
+    return start, end, match.group(7) or ''
+
+
+def split_timezone(text: str) -> Tuple[str, str]:
+    """("8:00 AM - 12:00 PM", "US ET") from "8:00 AM - 12:00 PM US ET"; ("...", "") with no label"""
+    match = TIMEZONE_SUFFIX_RE.search(text or '')
+    if not match:
+        return (text or '').strip(), ''
+    return text[:match.start()].strip(), match.group(1)
+
+
+@lru_cache(maxsize=4096)
+def to_iso_datetime(date: str, clock: str, timezone: str = '') -> str:
+    """
+    ISO 8601 datetime from an ISO date, a 24-hour HH:MM time and a time zone label
+
+    Returns:
+        "2025-10-21T12:15:00-04:00", without the offset when the label is
+        not in TIMEZONES, or '' when the date or time is missing
+    """
+    if not date or not clock:
+        return ''
+    value = datetime.strptime(f"{date} {clock}", '%Y-%m-%d %H:%M')
+    zone = TIMEZONES.get(timezone)
+    if zone:
+        value = value.replace(tzinfo=ZoneInfo(zone))
+    return value.isoformat()
+
+
+def normalize_schedule(date_text: str, time_text: str, timezone: str = '',
+                       default_year: Optional[int] = None) -> Dict[str, str]:
+    """
+    Start and end ISO datetimes for a date string and a time range string
+
+    Args:
+        date_text: Date as printed, e.g. "Tuesday, October 21, 2025"
+        time_text: Time range as printed, e.g. "12:15 PM - 1:30 PM US ET"
+        timezone: Time zone label, when it is printed apart from the times
+        default_year: Year for day/month dates
+
+    Returns:
+        Dictionary with start_datetime and end_datetime ('' when unknown)
+    """
+    date = normalize_date(date_text, default_year) if date_text else None
+    start, end, label = normalize_time_range(time_text) if time_text else ('', '', '')
+    timezone = timezone or label
+    return {
+        'start_datetime': to_iso_datetime(date, start, timezone) if date else '',
+        'end_datetime': to_iso_datetime(date, end, timezone) if date else '',
+    }
+
+
+def cache_info() -> Dict[str, object]:
+    """lru_cache statistics of the memoized normalizers"""
+    return {
+        'normalize_date': normalize_date.cache_info(),
+        'normalize_time_range': normalize_time_range.cache_info(),
+        'to_iso_datetime': to_iso_datetime.cache_info(),
+    }
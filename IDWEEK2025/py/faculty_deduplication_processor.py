@@ -6,11 +6,13 @@ Migrates faculty data to normalized structure and handles cross-conference match
 
 import mysql.connector
 import logging
+import os
 import re
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from faculty_html_parser import FacultyHTMLParser
+from faculty_name_index import FacultyNameIndex, names_similar
 import argparse
-from difflib import SequenceMatcher
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,10 +27,18 @@ logger = logging.getLogger(__name__)
 class FacultyDeduplicationProcessor:
     """Process and deduplicate faculty across conferences"""
     
-    def __init__(self, db_config: Dict):
+    def __init__(self, db_config: Dict, exhaustive_fuzzy: bool = False):
+        """
+        Args:
+            db_config: MySQL connection settings
+            exhaustive_fuzzy: Fuzzy-match against every Faculty_Master row instead
+                of the name index's (approximate) word/trigram candidates
+        """
         self.db_config = db_config
+        self.exhaustive_fuzzy = exhaustive_fuzzy
         self.parser = FacultyHTMLParser()
         self.connection = None
+        self.name_index = None
         self.stats = {
             'faculty_processed': 0,
             'new_faculty_created': 0,
@@ -66,8 +76,15 @@ class FacultyDeduplicationProcessor:
         
         return name
     
+    def load_name_index(self):
+        """Preload Faculty_Master into an in-memory index used by find_matching_faculty"""
+        self.name_index = FacultyNameIndex.from_connection(self.connection, exhaustive=self.exhaustive_fuzzy)
+    
     def find_matching_faculty(self, normalized_name: str, email: str = None) -> Optional[int]:
         """Find existing faculty by normalized name or email"""
+        if self.name_index is not None:
+            return self.name_index.find(normalized_name, email)
+        
         cursor = self.connection.cursor()
         
         try:
@@ -111,31 +128,23 @@ class FacultyDeduplicationProcessor:
     
     def _names_similar(self, name1: str, name2: str, threshold: float = 0.9) -> bool:
         """Check if two normalized names are similar enough to be the same person"""
-        if not name1 or not name2:
-            return False
-        
-        # Use sequence matcher for similarity
-        similarity = SequenceMatcher(None, name1, name2).ratio()
-        
-        # Also check if one name is contained in the other (for middle name variations)
-        name1_words = set(name1.split())
-        name2_words = set(name2.split())
-        
-        # If all words from shorter name are in longer name
-        if len(name1_words) <= len(name2_words):
-            word_match = name1_words.issubset(name2_words)
-        else:
-            word_match = name2_words.issubset(name1_words)
-        
-        return similarity >= threshold or (word_match and similarity >= 0.8)
+        return names_similar(name1, name2, threshold)
     
-    def create_or_update_faculty(self, faculty_data: Dict, conference_data: Dict) -> int:
-        """Create new faculty or update existing one"""
+    def create_or_update_faculty(self, faculty_data: Dict, conference_data: Dict, faculty_id: Optional[int] = None) -> int:
+        """
+        Create new faculty or update existing one
+        
+        Args:
+            faculty_data: Parsed faculty fields
+            conference_data: Conference participation fields
+            faculty_id: Already-resolved Faculty_Master match, skipping the lookup
+        """
         normalized_name = self.normalize_name(faculty_data.get('full_name', ''))
         email = faculty_data.get('email')
         
         # Try to find existing faculty
-        faculty_id = self.find_matching_faculty(normalized_name, email)
+        if faculty_id is None:
+            faculty_id = self.find_matching_faculty(normalized_name, email)
         
         cursor = self.connection.cursor()
         
@@ -199,6 +208,14 @@ class FacultyDeduplicationProcessor:
             self.create_conference_participation(faculty_id, conference_data, cursor)
             
             self.connection.commit()
+            
+            # Keep the in-memory index in step with the committed row
+            if self.name_index is not None:
+                if faculty_id in self.name_index.names:
+                    self.name_index.set_email(faculty_id, email)
+                else:
+                    self.name_index.add(faculty_id, normalized_name, email)
+            
             return faculty_id
             
         except mysql.connector.Error as e:
@@ -305,6 +322,7 @@ class FacultyDeduplicationProcessor:
         """Process IDWeek 2025 faculty data"""
         try:
             self.connect_db()
+            self.load_name_index()
             cursor = self.connection.cursor(dictionary=True)
             
             # Get all IDWeek 2025 faculty records with raw data
@@ -312,6 +330,7 @@ class FacultyDeduplicationProcessor:
                 SELECT id, presenterid, raw_data 
                 FROM IDWEEK_Faculty_2025 
                 WHERE raw_data IS NOT NULL
+                ORDER BY id
             """)
             
             records = cursor.fetchall()
@@ -321,35 +340,7 @@ class FacultyDeduplicationProcessor:
                 try:
                     # Parse HTML data
                     parsed_data = self.parser.parse_faculty_data(record['raw_data'], record['id'])
-                    
-                    if parsed_data['parsing_status'] == 'error':
-                        self.stats['parsing_errors'] += 1
-                        continue
-                    
-                    # Prepare conference data
-                    conference_data = {
-                        'conference_year': 2025,
-                        'conference_name': 'IDWEEK',
-                        'presenter_id': record['presenterid'],
-                        'job_title': parsed_data['faculty'].get('job_title'),
-                        'organization': parsed_data['faculty'].get('organization'),
-                        'raw_data': record['raw_data'],
-                        'parsing_status': 'parsed'
-                    }
-                    
-                    # Create or match faculty
-                    faculty_id = self.create_or_update_faculty(parsed_data['faculty'], conference_data)
-                    
-                    # Migrate posters
-                    self.migrate_posters(parsed_data['posters'], faculty_id, 2025, 'IDWEEK')
-                    
-                    # Create migration tracking record
-                    self.create_migration_record(faculty_id, 'IDWEEK_Faculty_2025', record['id'], 2025, 'IDWEEK')
-                    
-                    self.stats['faculty_processed'] += 1
-                    
-                    if self.stats['faculty_processed'] % 10 == 0:
-                        logger.info(f"Processed {self.stats['faculty_processed']} faculty records...")
+                    self.apply_parsed_record(record, parsed_data)
                 
                 except Exception as e:
                     logger.error(f"Error processing record {record['id']}: {e}")
@@ -357,6 +348,123 @@ class FacultyDeduplicationProcessor:
             
             cursor.close()
             self.print_stats()
+            logger.info(f"Name index: {self.name_index.get_stats()}")
+            
+        except Exception as e:
+            logger.error(f"Error processing IDWeek 2025 data: {e}")
+            raise
+        finally:
+            self.disconnect_db()
+    
+    def apply_parsed_record(self, record: Dict, parsed_data: Dict, faculty_id: Optional[int] = None):
+        """
+        Write one parsed IDWeek 2025 record: faculty, participation, posters and migration record
+        
+        Args:
+            record: IDWEEK_Faculty_2025 row (id, presenterid, raw_data)
+            parsed_data: Output of FacultyHTMLParser.parse_faculty_data
+            faculty_id: Already-resolved Faculty_Master match, skipping the lookup
+        """
+        if parsed_data['parsing_status'] == 'error':
+            self.stats['parsing_errors'] += 1
+            return
+        
+        # Prepare conference data
+        conference_data = {
+            'conference_year': 2025,
+            'conference_name': 'IDWEEK',
+            'presenter_id': record['presenterid'],
+            'job_title': parsed_data['faculty'].get('job_title'),
+            'organization': parsed_data['faculty'].get('organization'),
+            'raw_data': record['raw_data'],
+            'parsing_status': 'parsed'
+        }
+        
+        # Create or match faculty
+        faculty_id = self.create_or_update_faculty(parsed_data['faculty'], conference_data, faculty_id)
+        
+        # Migrate posters
+        self.migrate_posters(parsed_data['posters'], faculty_id, 2025, 'IDWEEK')
+        
+        # Create migration tracking record
+        self.create_migration_record(faculty_id, 'IDWEEK_Faculty_2025', record['id'], 2025, 'IDWEEK')
+        
+        self.stats['faculty_processed'] += 1
+        
+        if self.stats['faculty_processed'] % 10 == 0:
+            logger.info(f"Processed {self.stats['faculty_processed']} faculty records...")
+    
+    def shard_ranges(self, shards: int) -> List[Tuple[int, int]]:
+        """Split the IDWEEK_Faculty_2025 ID range into contiguous, ascending shards"""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT MIN(id), MAX(id) FROM IDWEEK_Faculty_2025 WHERE raw_data IS NOT NULL")
+        min_id, max_id = cursor.fetchone()
+        cursor.close()
+        
+        if min_id is None:
+            return []
+        
+        shard_size = -(-(max_id - min_id + 1) // shards)
+        return [(start, min(start + shard_size - 1, max_id)) for start in range(min_id, max_id + 1, shard_size)]
+    
+    def process_idweek_2025_data_sharded(self, workers: Optional[int] = None):
+        """
+        Process IDWeek 2025 faculty data with parsing and matching spread over worker processes
+        
+        Workers parse ID-range shards in parallel and propose matches against
+        Faculty_Master as it was before the run. The merge then applies the
+        records on this connection in record ID order, exactly as a serial run
+        would: proposals that hit an existing row by exact name are final
+        (nothing created later can take precedence), and every other record is
+        re-resolved against the live index, so two shards proposing to create
+        the same normalized_name collapse onto the lowest record ID. Inserts
+        happen in the serial order, so Faculty_Master ends up identical,
+        faculty_ids included.
+        
+        Args:
+            workers: Worker processes (default: CPU count)
+        """
+        workers = workers or os.cpu_count() or 1
+        
+        try:
+            self.connect_db()
+            self.load_name_index()
+            snapshot_ids = set(self.name_index.names)
+            
+            shards = self.shard_ranges(workers)
+            logger.info(f"Parsing {len(shards)} shards with {workers} workers: {shards}")
+            
+            accepted = 0
+            re_resolved = 0
+            
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(parse_shard, self.db_config, start, end, self.exhaustive_fuzzy) for start, end in shards]
+                
+                # Merge shard by shard in ID order, as each one finishes in turn
+                for future in futures:
+                    for proposal in future.result():
+                        record = proposal['record']
+                        
+                        if proposal['error']:
+                            logger.error(f"Error processing record {record['id']}: {proposal['error']}")
+                            continue
+                        
+                        faculty_id = None
+                        if proposal['proposal_kind'] == 'exact_name' and proposal['proposed_faculty_id'] in snapshot_ids:
+                            faculty_id = proposal['proposed_faculty_id']
+                            accepted += 1
+                        elif proposal['parsed_data']['parsing_status'] != 'error':
+                            re_resolved += 1
+                        
+                        try:
+                            self.apply_parsed_record(record, proposal['parsed_data'], faculty_id)
+                        except Exception as e:
+                            logger.error(f"Error processing record {record['id']}: {e}")
+                            continue
+            
+            self.print_stats()
+            logger.info(f"Merge: {accepted} proposals accepted, {re_resolved} re-resolved against the live index")
+            logger.info(f"Name index: {self.name_index.get_stats()}")
             
         except Exception as e:
             logger.error(f"Error processing IDWeek 2025 data: {e}")
@@ -396,6 +504,61 @@ class FacultyDeduplicationProcessor:
             logger.info(f"Faculty match rate: {match_rate:.1f}%")
 
 
+def parse_shard(db_config: Dict, start_id: int, end_id: int, exhaustive_fuzzy: bool = False) -> List[Dict[str, Any]]:
+    """
+    Parse one ID range of IDWEEK_Faculty_2025 and propose matches (runs in a worker process)
+    
+    Each worker opens its own connection, parses its records and proposes a
+    Faculty_Master match for each against the table as it was before the
+    run. Nothing is written; the merge step applies the proposals.
+    
+    Returns:
+        Proposal dicts in record ID order: record, parsed_data (or error),
+        normalized_name, proposed_faculty_id and proposal_kind
+    """
+    processor = FacultyDeduplicationProcessor(db_config, exhaustive_fuzzy)
+    processor.connect_db()
+    
+    try:
+        processor.load_name_index()
+        cursor = processor.connection.cursor(dictionary=True)
+        cursor.execute("""
+            SELECT id, presenterid, raw_data 
+            FROM IDWEEK_Faculty_2025 
+            WHERE raw_data IS NOT NULL AND id BETWEEN %s AND %s
+            ORDER BY id
+        """, (start_id, end_id))
+        records = cursor.fetchall()
+        cursor.close()
+        
+        proposals = []
+        for record in records:
+            proposal = {'record': record, 'parsed_data': None, 'error': None, 'normalized_name': None,
+                        'proposed_faculty_id': None, 'proposal_kind': None}
+            try:
+                parsed_data = processor.parser.parse_faculty_data(record['raw_data'], record['id'])
+                proposal['parsed_data'] = parsed_data
+                
+                if parsed_data['parsing_status'] != 'error':
+                    faculty = parsed_data['faculty']
+                    normalized_name = processor.normalize_name(faculty.get('full_name', ''))
+                    proposal['normalized_name'] = normalized_name
+                    proposal['proposed_faculty_id'], proposal['proposal_kind'] = processor.name_index.match(
+                        normalized_name, faculty.get('email')
+                    )
+                
+            except Exception as e:
+                proposal['error'] = str(e)
+            
+            proposals.append(proposal)
+        
+        logger.info(f"Shard {start_id}-{end_id}: parsed {len(proposals)} records")
+        return proposals
+    
+    finally:
+        processor.disconnect_db()
+
+
 def main():
     """Main function with command line arguments"""
     parser = argparse.ArgumentParser(description='Process Faculty Data with Deduplication')
@@ -404,6 +567,10 @@ def main():
     parser.add_argument('--password', required=True, help='Database password')
     parser.add_argument('--database', required=True, help='Database name')
     parser.add_argument('--port', type=int, default=3306, help='Database port')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for a sharded run (1 = serial)')
+    parser.add_argument('--exhaustive-fuzzy', action='store_true',
+                        help='Fuzzy-match every Faculty_Master row (slow) instead of the indexed candidates')
     
     args = parser.parse_args()
     
@@ -415,9 +582,12 @@ def main():
         'port': args.port
     }
     
-    processor = FacultyDeduplicationProcessor(db_config)
+    processor = FacultyDeduplicationProcessor(db_config, exhaustive_fuzzy=args.exhaustive_fuzzy)
     logger.info("Starting faculty deduplication processing...")
-    processor.process_idweek_2025_data()
+    if args.workers > 1:
+        processor.process_idweek_2025_data_sharded(args.workers)
+    else:
+        processor.process_idweek_2025_data()
     logger.info("Processing completed!")
 
 
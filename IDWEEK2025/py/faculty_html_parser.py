@@ -9,22 +9,76 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup, Tag
+from lxml import html as lxml_html
+
+from datetime_normalizer import normalize_date, normalize_schedule, normalize_time_range
+from xpath_registry import (
+    FACULTY_FULL_NAME,
+    FACULTY_LINKS,
+    FACULTY_MAILTO_LINKS,
+    FACULTY_ORGANIZATION,
+    FACULTY_PARAGRAPHS,
+    FACULTY_PHOTO,
+)
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Parsing backends: BeautifulSoup's html.parser, or lxml (several times faster). Output is
+# only verified identical on the embedded sample and the benchmark corpus; malformed HTML
+# (block elements inside <p>, unclosed <p>) is repaired differently by the two parsers.
+BACKENDS = ('bs4', 'lxml')
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+NON_TEXT_TAGS = ('script', 'style', 'template')
+
+POSTER_ID_RE = re.compile(r'PosterID=(\d+)')
+
+
+def lxml_strings(element):
+    """Text nodes inside an lxml element in document order, as BeautifulSoup's get_text() sees them"""
+    if isinstance(element.tag, str) and element.tag not in NON_TEXT_TAGS and element.text:
+        yield element.text
+    for child in element:
+        yield from lxml_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def lxml_text(element) -> str:
+    """BeautifulSoup's get_text(strip=True) for an lxml element"""
+    return ''.join(text.strip() for text in lxml_strings(element))
+
+
+def lxml_string(element) -> Optional[str]:
+    """BeautifulSoup's .string: the text of an element whose only child is one string (or one such element)"""
+    while True:
+        children = list(element)
+        if not children:
+            return element.text
+        if len(children) > 1 or element.text or children[0].tail:
+            return None
+        element = children[0]
+
+
+def has_class(element, css_class: str) -> bool:
+    return css_class in (element.get('class') or '').split()
+
+
 class FacultyHTMLParser:
     """Parser for IDWeek 2025 faculty HTML data"""
     
-    def __init__(self):
-        self.date_patterns = [
-            r'(\w+),\s+(\w+)\s+(\d+),\s+(\d+)',  # Tuesday, October 21, 2025
-            r'(\w+)\s+(\d+),\s+(\d+)',           # October 21, 2025
-            r'(\d+)/(\d+)/(\d+)',                # 10/21/2025
-        ]
-        
-        self.time_pattern = r'(\d+):(\d+)\s+(AM|PM)\s*(?:-\s*(\d+):(\d+)\s+(AM|PM))?\s*(?:<small>(.+?)</small>)?'
+    def __init__(self, backend: str = 'bs4'):
+        """
+        Args:
+            backend: 'bs4' (BeautifulSoup html.parser) or 'lxml'. Parity is verified on the
+                embedded sample and benchmark_faculty_html_parser.py's corpus only; on
+                malformed markup the two trees, and so the output, can differ
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown parser backend '{backend}' (expected one of {', '.join(BACKENDS)})")
+        self.backend = backend
     
     def parse_faculty_data(self, raw_html: str, faculty_id: int = None) -> Dict:
         """
@@ -38,13 +92,18 @@ class FacultyHTMLParser:
             Dictionary with parsed faculty data
         """
         try:
-            soup = BeautifulSoup(raw_html, 'html.parser')
-            
-            # Extract basic faculty info
-            faculty_data = self._extract_faculty_info(soup)
-            
-            # Extract poster information
-            posters = self._extract_poster_info(soup)
+            if self.backend == 'lxml':
+                root = self._lxml_root(raw_html)
+                faculty_data = self._extract_faculty_info_lxml(root)
+                posters = self._extract_poster_info_lxml(root)
+            else:
+                soup = BeautifulSoup(raw_html, 'html.parser')
+                
+                # Extract basic faculty info
+                faculty_data = self._extract_faculty_info(soup)
+                
+                # Extract poster information
+                posters = self._extract_poster_info(soup)
             
             result = {
                 'faculty': faculty_data,
@@ -209,6 +268,131 @@ class FacultyHTMLParser:
         
         return posters
     
+    @staticmethod
+    def _lxml_root(raw_html: str):
+        """Parsed document for the lxml backend (an empty one for blank input, which lxml rejects)"""
+        if not raw_html or not raw_html.strip():
+            return lxml_html.Element('html')
+        return lxml_html.document_fromstring(raw_html)
+    
+    def _extract_faculty_info_lxml(self, root) -> Dict:
+        """_extract_faculty_info on an lxml tree"""
+        faculty_info = {}
+        
+        name_elems = FACULTY_FULL_NAME(root)
+        if name_elems:
+            full_name = lxml_text(name_elems[0])
+            faculty_info['full_name'] = full_name
+            faculty_info.update(self._parse_name_and_credentials(full_name))
+        
+        org_elems = FACULTY_ORGANIZATION(root)
+        if org_elems:
+            job_title, organization = self._parse_organization_info(lxml_text(org_elems[0]))
+            faculty_info['job_title'] = job_title
+            faculty_info['organization'] = organization
+        
+        photo_elems = FACULTY_PHOTO(root)
+        if photo_elems:
+            faculty_info['photo_url'] = photo_elems[0].get('src')
+        
+        email_links = FACULTY_MAILTO_LINKS(root)
+        if email_links:
+            email_match = re.search(r'mailto:([^"]+)', email_links[0].get('href', ''))
+            if email_match:
+                faculty_info['email'] = email_match.group(1)
+        
+        # Same precedence as the soup version: a <p> whose only string mentions
+        # Disclosure, else the first <p> with Disclosure anywhere in its text
+        paragraphs = FACULTY_PARAGRAPHS(root)
+        disclosure_elem = next((p for p in paragraphs if 'Disclosure' in (lxml_string(p) or '')), None)
+        if disclosure_elem is None:
+            disclosure_elem = next((p for p in paragraphs if 'Disclosure' in ''.join(lxml_strings(p))), None)
+        
+        if disclosure_elem is not None:
+            faculty_info['disclosure_info'] = lxml_text(disclosure_elem)
+        
+        bio_elem = self._find_biography_lxml(paragraphs)
+        if bio_elem is not None:
+            faculty_info['biography'] = lxml_text(bio_elem)
+        
+        return faculty_info
+    
+    def _find_biography_lxml(self, paragraphs) -> Optional[object]:
+        """_find_biography over lxml <p> elements"""
+        bio_candidates = []
+        for p in paragraphs:
+            text = lxml_text(p)
+            if not text:
+                continue
+            
+            if any(keyword in text for keyword in [
+                'Disclosure', 'popupOrganization', 'text-muted', 
+                'Copyright', 'Designed by'
+            ]):
+                continue
+            
+            if has_class(p, 'text-muted') or has_class(p, 'copyrights'):
+                continue
+            
+            bio_candidates.append((p, len(text)))
+        
+        if bio_candidates:
+            bio_candidates.sort(key=lambda x: x[1], reverse=True)
+            return bio_candidates[0][0]
+        
+        return None
+    
+    def _extract_poster_info_lxml(self, root) -> List[Dict]:
+        """_extract_poster_info on an lxml tree"""
+        posters = []
+        
+        for link in FACULTY_LINKS(root):
+            href = link.get('href', '')
+            poster_id_match = POSTER_ID_RE.search(href)
+            if not poster_id_match:
+                continue
+            
+            poster_info = {
+                'poster_id': poster_id_match.group(1),
+                'url_reference': href
+            }
+            
+            poster_number, title = self._parse_poster_title(lxml_text(link))
+            poster_info['poster_number'] = poster_number
+            poster_info['title'] = title
+            
+            poster_container = next(link.iterancestors('li'), None)
+            if poster_container is None:
+                poster_container = next(link.iterancestors('div'), None)
+            if poster_container is not None:
+                poster_info.update(self._extract_date_time_lxml(poster_container))
+            
+            posters.append(poster_info)
+        
+        return posters
+    
+    def _extract_date_time_lxml(self, container) -> Dict:
+        """_extract_date_time on an lxml element"""
+        date_time_info = {}
+        date_text = time_text = ''
+        
+        date_elem = next((i for i in container.iter('i') if has_class(i, 'fa-calendar')), None)
+        if date_elem is not None and date_elem.getparent() is not None:
+            date_text = lxml_text(date_elem.getparent())
+            parsed_date = self._parse_date(date_text)
+            if parsed_date:
+                date_time_info['presentation_date'] = parsed_date
+        
+        time_elem = next((i for i in container.iter('i') if has_class(i, 'fa-clock-o')), None)
+        if time_elem is not None and time_elem.getparent() is not None:
+            time_text = lxml_text(time_elem.getparent())
+            date_time_info.update(self._parse_time(time_text))
+        
+        if 'presentation_date' in date_time_info and 'presentation_time' in date_time_info:
+            date_time_info.update(normalize_schedule(date_text, time_text))
+        
+        return date_time_info
+    
     def _parse_poster_title(self, title_text: str) -> Tuple[Optional[str], str]:
         """Parse poster number and title from title text"""
         # Pattern for poster numbers like (P-1469)
@@ -224,6 +408,8 @@ class FacultyHTMLParser:
         """Extract date and time information from poster container"""
         date_time_info = {}
         
+        date_text = time_text = ''
+        
         # Look for calendar icon and date
         date_elem = container.find('i', class_='fa-calendar')
         if date_elem:
@@ -243,117 +429,57 @@ class FacultyHTMLParser:
                 time_info = self._parse_time(time_text)
                 date_time_info.update(time_info)
         
+        if 'presentation_date' in date_time_info and 'presentation_time' in date_time_info:
+            date_time_info.update(normalize_schedule(date_text, time_text))
+        
         return date_time_info
     
     def _parse_date(self, date_text: str) -> Optional[str]:
         """Parse date from various formats"""
-        # Remove extra whitespace and common prefixes
-        date_text = re.sub(r'^.*?(\w+day,?\s+)', r'\1', date_text, flags=re.IGNORECASE)
-        
-        # Try different date patterns
-        for pattern in self.date_patterns:
-            match = re.search(pattern, date_text, re.IGNORECASE)
-            if match:
-                try:
-                    if len(match.groups()) == 4:  # Tuesday, October 21, 2025
-                        month_name = match.group(2)
-                        day = int(match.group(3))
-                        year = int(match.group(4))
-                    elif len(match.groups()) == 3:  # October 21, 2025 or 10/21/2025
-                        if match.group(1).isdigit():  # 10/21/2025
-                            month = int(match.group(1))
-                            day = int(match.group(2))
-                            year = int(match.group(3))
-                            return f"{year:04d}-{month:02d}-{day:02d}"
-                        else:  # October 21, 2025
-                            month_name = match.group(1)
-                            day = int(match.group(2))
-                            year = int(match.group(3))
-                    
-                    # Convert month name to number
-                    if 'month_name' in locals():
-                        month_map = {
-                            'january': 1, 'february': 2, 'march': 3, 'april': 4,
-                            'may': 5, 'june': 6, 'july': 7, 'august': 8,
-                            'september': 9, 'october': 10, 'november': 11, 'december': 12
-                        }
-                        month = month_map.get(month_name.lower())
-                        if month:
-                            return f"{year:04d}-{month:02d}-{day:02d}"
-                
-                except (ValueError, KeyError):
-                    continue
-        
-        return None
+        return normalize_date(date_text)
     
     def _parse_time(self, time_text: str) -> Dict:
         """Parse time information"""
         time_info = {}
         
-        match = re.search(self.time_pattern, time_text)
-        if match:
-            start_hour = int(match.group(1))
-            start_min = int(match.group(2))
-            start_ampm = match.group(3)
-            
-            # Convert to 24-hour format
-            if start_ampm.upper() == 'PM' and start_hour != 12:
-                start_hour += 12
-            elif start_ampm.upper() == 'AM' and start_hour == 12:
-                start_hour = 0
-            
-            start_time = f"{start_hour:02d}:{start_min:02d}"
-            
-            # Check for end time
-            if match.group(4):  # End time exists
-                end_hour = int(match.group(4))
-                end_min = int(match.group(5))
-                end_ampm = match.group(6)
-                
-                if end_ampm.upper() == 'PM' and end_hour != 12:
-                    end_hour += 12
-                elif end_ampm.upper() == 'AM' and end_hour == 12:
-                    end_hour = 0
-                
-                end_time = f"{end_hour:02d}:{end_min:02d}"
-                time_info['presentation_time'] = f"{start_time} - {end_time}"
-            else:
-                time_info['presentation_time'] = start_time
-            
-            # Extract timezone if present
-            if match.group(7):
-                time_info['time_zone'] = match.group(7).strip()
+        start_time, end_time, time_zone = normalize_time_range(time_text)
+        if start_time:
+            time_info['presentation_time'] = f"{start_time} - {end_time}" if end_time else start_time
+            if time_zone:
+                time_info['time_zone'] = time_zone
         
         return time_info
 
 
-# Test function
-def test_parser():
-    """Test the parser with sample data"""
-    sample_html = '''<div class="popup_content popupmodeside">
-        <h1 class="popupFullName mar-no">David Singer, PharmD, MS</h1>
-        <p class="text-muted mar-top popupOrganization">Director, US Health Economics and Outcomes Research<br/>GSK</p>
-        <p class="text-muted">Disclosure(s): GSK: Employed by GSK, Stocks/Bonds (Public Company)</p>
-        <p>David Singer, PharmD, MS, is Director, US Health Economics...</p>
-        <ul class="list-view list-group list-unstyled">
-            <li class="pad-btm">
-                <div class="bold" data-url="/ajaxcalls/PosterInfo.asp?PosterID=759828">
-                    <a class="loadbyurl" href="/ajaxcalls/PosterInfo.asp?PosterID=759828">(P-1469) RSV-Related Knowledge, Attitudes, and Practices Among US Adults During the 2024–2025 RSV Season</a>
+# Popup markup used by test_parser and benchmark_faculty_html_parser
+SAMPLE_FACULTY_HTML = '''<div class="popup_content popupmodeside">
+    <h1 class="popupFullName mar-no">David Singer, PharmD, MS</h1>
+    <p class="text-muted mar-top popupOrganization">Director, US Health Economics and Outcomes Research<br/>GSK</p>
+    <p class="text-muted">Disclosure(s): GSK: Employed by GSK, Stocks/Bonds (Public Company)</p>
+    <p>David Singer, PharmD, MS, is Director, US Health Economics...</p>
+    <ul class="list-view list-group list-unstyled">
+        <li class="pad-btm">
+            <div class="bold" data-url="/ajaxcalls/PosterInfo.asp?PosterID=759828">
+                <a class="loadbyurl" href="/ajaxcalls/PosterInfo.asp?PosterID=759828">(P-1469) RSV-Related Knowledge, Attitudes, and Practices Among US Adults During the 2024–2025 RSV Season</a>
+            </div>
+            <div class="clearfix text-muted">
+                <div class="pull-left pres-tidbit tipsytip" title="">
+                    <i class="fa fa-calendar fa-fw"></i>Tuesday, October 21, 2025
                 </div>
-                <div class="clearfix text-muted">
-                    <div class="pull-left pres-tidbit tipsytip" title="">
-                        <i class="fa fa-calendar fa-fw"></i>Tuesday, October 21, 2025
-                    </div>
-                    <div class='pull-left pres-tidbit tipsytip' title=''>
-                        <i class="fa fa-clock-o fa-fw"></i>12:15 PM - 1:30 PM <small>US ET</small>
-                    </div>
+                <div class='pull-left pres-tidbit tipsytip' title=''>
+                    <i class="fa fa-clock-o fa-fw"></i>12:15 PM - 1:30 PM <small>US ET</small>
                 </div>
-            </li>
-        </ul>
-    </div>'''
-    
-    parser = FacultyHTMLParser()
-    result = parser.parse_faculty_data(sample_html, faculty_id=999)
+            </div>
+        </li>
+    </ul>
+</div>'''
+
+
+# Test function
+def test_parser(backend: str = 'bs4'):
+    """Test the parser with sample data"""
+    parser = FacultyHTMLParser(backend=backend)
+    result = parser.parse_faculty_data(SAMPLE_FACULTY_HTML, faculty_id=999)
     
     print("Test Results:")
     print("Faculty Data:", result['faculty'])
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Faculty Name Index
+In-memory lookup of Faculty_Master for deduplication. Exact normalized-name
+and email matches are hash lookups; fuzzy matching by default only compares
+against candidates that share a word or enough character trigrams with the
+name, instead of every faculty row in the table. That blocking is a
+heuristic: it can miss a pair names_similar would accept (e.g.
+'cdbgbbeg gfefdcafe' vs 'ecdbgbbeg gdfefedcbafe'), so exhaustive=True keeps
+the full scan.
+"""
+
+import logging
+import math
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def match_key(value: Optional[str]) -> str:
+    """
+    Comparison key mirroring MySQL's utf8mb4_0900_ai_ci collation
+
+    Faculty_Master compares names and emails case- and accent-insensitively,
+    so the hash maps do too.
+    """
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize('NFKD', value)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def names_similar(name1: str, name2: str, threshold: float = 0.9) -> bool:
+    """Check if two normalized names are similar enough to be the same person"""
+    if not name1 or not name2:
+        return False
+
+    matcher = SequenceMatcher(None, name1, name2)
+
+    # Both rules need a ratio of at least 0.8; the cheap upper bounds rule most pairs out
+    if matcher.real_quick_ratio() < 0.8 or matcher.quick_ratio() < 0.8:
+        return False
+
+    # Use sequence matcher for similarity
+    similarity = matcher.ratio()
+
+    # Also check if one name is contained in the other (for middle name variations)
+    name1_words = set(name1.split())
+    name2_words = set(name2.split())
+
+    # If all words from shorter name are in longer name
+    if len(name1_words) <= len(name2_words):
+        word_match = name1_words.issubset(name2_words)
+    else:
+        word_match = name2_words.issubset(name1_words)
+
+    return similarity >= threshold or (word_match and similarity >= 0.8)
+
+
+def name_trigrams(name: str) -> Set[str]:
+    """Character trigrams of a name, padded so first and last letters count"""
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FacultyNameIndex:
+    """
+    Preloaded, incrementally updated index of Faculty_Master names and emails
+
+    Lookups follow the same order as the SQL matcher: exact normalized name,
+    then email, then fuzzy name. Fuzzy candidates are rows sharing a word
+    token (which every word-subset match does) or at least
+    min_trigram_overlap of the name's trigrams (which typical typo and
+    middle-name variants do), checked in faculty_id order like the full
+    table scan. The blocking is approximate: a pair with few shared words
+    and trigrams can still reach names_similar's ratio and is then never
+    compared. With exhaustive=True every row is a candidate and the
+    results are the full scan's.
+    """
+
+    def __init__(self, min_trigram_overlap: float = 0.5, exhaustive: bool = False):
+        """
+        Args:
+            min_trigram_overlap: Fraction of a name's trigrams a row must share
+                to be a fuzzy candidate without sharing a whole word
+            exhaustive: Compare every indexed row in fuzzy matching (no blocking)
+        """
+        self.min_trigram_overlap = min_trigram_overlap
+        self.exhaustive = exhaustive
+        self.names = {}
+        self.emails = {}
+        self.by_name = {}
+        self.by_email = defaultdict(set)
+        self.by_token = defaultdict(set)
+        self.by_trigram = defaultdict(set)
+        self.stats = {
+            'faculty_indexed': 0,
+            'exact_name_hits': 0,
+            'email_hits': 0,
+            'fuzzy_hits': 0,
+            'misses': 0,
+            'fuzzy_comparisons': 0
+        }
+
+    @classmethod
+    def from_connection(cls, connection, **kwargs) -> 'FacultyNameIndex':
+        """Build an index from every row of Faculty_Master"""
+        index = cls(**kwargs)
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT faculty_id, normalized_name, email FROM Faculty_Master ORDER BY faculty_id")
+            index.add_many(cursor.fetchall())
+        finally:
+            cursor.close()
+        logger.info(f"Indexed {index.stats['faculty_indexed']} Faculty_Master rows")
+        return index
+
+    def add_many(self, rows: Iterable[Tuple[int, Optional[str], Optional[str]]]):
+        """Index (faculty_id, normalized_name, email) rows"""
+        for faculty_id, normalized_name, email in rows:
+            self.add(faculty_id, normalized_name, email)
+
+    def add(self, faculty_id: int, normalized_name: Optional[str], email: Optional[str] = None):
+        """Index a faculty row (call after inserting into Faculty_Master)"""
+        if faculty_id not in self.names:
+            self.stats['faculty_indexed'] += 1
+        self.names[faculty_id] = normalized_name
+
+        if normalized_name:
+            # First row wins, like the unordered SELECT returning the oldest row
+            self.by_name.setdefault(match_key(normalized_name), faculty_id)
+            for token in normalized_name.split():
+                self.by_token[token].add(faculty_id)
+            for trigram in name_trigrams(normalized_name):
+                self.by_trigram[trigram].add(faculty_id)
+
+        self.set_email(faculty_id, email)
+
+    def set_email(self, faculty_id: int, email: Optional[str]):
+        """Record a faculty email (call after an update sets it; None keeps the current one)"""
+        if not email:
+            return
+
+        old_key = self.emails.get(faculty_id)
+        if old_key:
+            owners = self.by_email[old_key]
+            owners.discard(faculty_id)
+            if not owners:
+                del self.by_email[old_key]
+
+        self.emails[faculty_id] = match_key(email)
+        self.by_email[self.emails[faculty_id]].add(faculty_id)
+
+    def _fuzzy_candidates(self, normalized_name: str) -> List[int]:
+        """Faculty IDs worth a full comparison, in faculty_id order"""
+        if self.exhaustive:
+            return sorted(self.names)
+
+        candidates = set()
+        for token in normalized_name.split():
+            candidates |= self.by_token.get(token, set())
+
+        trigrams = name_trigrams(normalized_name)
+        needed = max(1, math.ceil(len(trigrams) * self.min_trigram_overlap))
+        shared = defaultdict(int)
+        for trigram in trigrams:
+            for faculty_id in self.by_trigram.get(trigram, ()):
+                shared[faculty_id] += 1
+        candidates.update(faculty_id for faculty_id, count in shared.items() if count >= needed)
+
+        return sorted(candidates)
+
+    def match(self, normalized_name: str, email: Optional[str] = None) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Find existing faculty by normalized name or email, like the full-table SQL matcher
+
+        Returns:
+            (faculty_id, kind) where kind is 'exact_name', 'email' or 'fuzzy',
+            or (None, None) when nothing matches
+        """
+        # First try exact normalized name match
+        if normalized_name:
+            faculty_id = self.by_name.get(match_key(normalized_name))
+            if faculty_id is not None:
+                self.stats['exact_name_hits'] += 1
+                return faculty_id, 'exact_name'
+
+        # Then try email match
+        if email:
+            owners = self.by_email.get(match_key(email))
+            if owners:
+                # Lowest ID, like the SELECT returning the oldest row
+                faculty_id = min(owners)
+                self.stats['email_hits'] += 1
+                return faculty_id, 'email'
+
+        # Finally try fuzzy matching against the blocked candidates
+        if normalized_name:
+            for faculty_id in self._fuzzy_candidates(normalized_name):
+                existing_name = self.names[faculty_id]
+                self.stats['fuzzy_comparisons'] += 1
+                if existing_name and names_similar(normalized_name, existing_name):
+                    logger.info(f"Fuzzy match found: '{normalized_name}' -> '{existing_name}' (ID: {faculty_id})")
+                    self.stats['fuzzy_hits'] += 1
+                    return faculty_id, 'fuzzy'
+
+        self.stats['misses'] += 1
+        return None, None
+
+    def find(self, normalized_name: str, email: Optional[str] = None) -> Optional[int]:
+        """Find existing faculty by normalized name or email; returns the faculty_id or None"""
+        return self.match(normalized_name, email)[0]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get index statistics"""
+        return dict(self.stats)
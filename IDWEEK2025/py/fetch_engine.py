@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+IDWeek 2025 Async Fetch Engine
+Concurrent page fetcher shared by the session and poster crawlers.
+Requests run on an asyncio event loop, bounded by a concurrency limit
+and spaced out by a per-host rate budget (fixed, or an AdaptiveThrottle
+that reacts to server behavior). With an HTMLCache attached,
+cached pages are revalidated with conditional GETs, and offline mode
+replays from the cache without touching the network.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from html_cache import HTMLCache
+from adaptive_throttle import AdaptiveThrottle, RETRY_STATUSES, parse_retry_after
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class HostRateLimiter:
+    """Per-host rate budget: request starts to one host are spaced 1/rate seconds apart"""
+
+    def __init__(self, rate_per_host: float = 10.0):
+        self.rate_per_host = rate_per_host
+        self._next_slot = {}
+
+    async def acquire(self, host: str):
+        """Wait until the next request slot for this host is available"""
+        if not self.rate_per_host or self.rate_per_host <= 0:
+            return
+
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + 1.0 / self.rate_per_host
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def record(self, host: str, status: Optional[int], latency: float, retry_after: Optional[float] = None):
+        """A fixed budget ignores server feedback"""
+
+    def current_rate(self, host: str) -> float:
+        """Requests/second allowed for a host (0 = unlimited)"""
+        return self.rate_per_host or 0.0
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        return {host: {'rate': self.rate_per_host} for host in self._next_slot}
+
+
+class AsyncFetchEngine:
+    """Fetch many URLs concurrently with a concurrency limit and per-host rate budget"""
+
+    def __init__(self, concurrency: int = 8, rate_per_host: float = 10.0, timeout: float = 30,
+                 cache: Optional[HTMLCache] = None, offline: bool = False,
+                 throttle: Optional[AdaptiveThrottle] = None, max_retries: int = 3):
+        """
+        Args:
+            concurrency: Maximum number of requests in flight at once
+            rate_per_host: Fixed maximum request starts per second to any one host
+                (0 = unlimited); ignored when a throttle is given
+            timeout: Total timeout per request in seconds
+            cache: Optional raw HTML cache used for conditional GETs and offline replay
+            offline: Serve every URL from the cache and never touch the network
+            throttle: Adaptive per-host rate controller used instead of the fixed budget
+            max_retries: Retries per URL after 429/5xx responses or connection errors
+        """
+        if offline and cache is None:
+            raise ValueError("Offline mode requires a cache")
+
+        self.concurrency = max(1, concurrency)
+        self.rate_limiter = throttle if throttle else HostRateLimiter(rate_per_host)
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.cache = cache
+        self.offline = offline
+        self.stats = {
+            'requests': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'not_modified': 0,
+            'from_cache': 0,
+            'retries': 0
+        }
+
+    async def fetch_one(self, http: aiohttp.ClientSession, item_id: Any, url: str) -> Dict[str, Any]:
+        """
+        Fetch a single URL
+
+        Returns:
+            Dict with id, url, status, text, content_hash, error and elapsed seconds
+        """
+        result = {'id': item_id, 'url': url, 'status': None, 'text': None, 'content_hash': None,
+                  'error': None, 'elapsed': 0.0}
+
+        if self.offline:
+            return self._replay_from_cache(result)
+
+        host = urlsplit(url).netloc
+        cached_entry = self.cache.lookup(url) if self.cache else None
+        headers = self.cache.conditional_headers(url) if cached_entry else {}
+        started = time.monotonic()
+
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire(host)
+            attempt_started = time.monotonic()
+            self.stats['requests'] += 1
+            retry_after = None
+            result['error'] = None
+
+            try:
+                async with http.get(url, headers=headers) as response:
+                    result['status'] = response.status
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+
+                    if response.status == 304 and cached_entry:
+                        result['text'] = self.cache.read(url)
+                        if result['text'] is not None:
+                            result['content_hash'] = cached_entry['content_hash']
+                            self.cache.touch(url)
+                            self.stats['not_modified'] += 1
+                    else:
+                        response.raise_for_status()
+                        result['text'] = await response.text()
+                        if self.cache:
+                            result['content_hash'] = self.cache.store(url, result['text'], response.headers, response.status)
+
+                if result['status'] == 304 and result['text'] is None:
+                    # The body is gone from the cache: ask again unconditionally within this
+                    # attempt, so a healthy 304 is neither throttled as a failure nor retried
+                    cached_entry = None
+                    headers = {}
+                    await self.rate_limiter.acquire(host)
+                    self.stats['requests'] += 1
+                    async with http.get(url) as response:
+                        result['status'] = response.status
+                        response.raise_for_status()
+                        result['text'] = await response.text()
+                        result['content_hash'] = self.cache.store(url, result['text'], response.headers, response.status)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                result['error'] = str(e) or e.__class__.__name__
+                if not isinstance(e, aiohttp.ClientResponseError):
+                    result['status'] = None
+
+            self.rate_limiter.record(host, result['status'], time.monotonic() - attempt_started, retry_after)
+
+            retryable = result['status'] is None or result['status'] in RETRY_STATUSES
+            if not result['error'] or not retryable or attempt == self.max_retries:
+                break
+
+            self.stats['retries'] += 1
+            logger.info(f"Retrying {url} after {result['error']} (attempt {attempt + 2}/{self.max_retries + 1})")
+
+        if result['error']:
+            self.stats['failed'] += 1
+        else:
+            self.stats['succeeded'] += 1
+
+        result['elapsed'] = time.monotonic() - started
+        return result
+
+    def _replay_from_cache(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill a result from the cache without a network request"""
+        entry = self.cache.lookup(result['url'])
+        body = self.cache.read(result['url']) if entry else None
+
+        if body is None:
+            result['error'] = f"Not in cache (offline): {result['url']}"
+            self.stats['failed'] += 1
+        else:
+            result['status'] = entry.get('status', 200)
+            result['text'] = body
+            result['content_hash'] = entry['content_hash']
+            self.stats['from_cache'] += 1
+            self.stats['succeeded'] += 1
+
+        return result
+
+    async def fetch_all(self, items: Iterable[Tuple[Any, str]], on_result: Callable[[Dict[str, Any]], Any]):
+        """
+        Fetch every (item_id, url) pair, calling on_result as each response arrives
+
+        on_result may be a plain function or a coroutine function. Results arrive
+        in completion order, not item order.
+        """
+        pending = iter(items)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as http:
+
+            async def worker():
+                # All workers pull from the same iterator, so at most
+                # `concurrency` requests are ever in flight
+                for item_id, url in pending:
+                    result = await self.fetch_one(http, item_id, url)
+                    handled = on_result(result)
+                    if asyncio.iscoroutine(handled):
+                        await handled
+
+            await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+    def crawl(self, items: Iterable[Tuple[Any, str]], on_result: Optional[Callable[[Dict[str, Any]], Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Blocking entry point: fetch all items and return results
+
+        If on_result is given it is called for every result and nothing is
+        accumulated; otherwise the list of result dicts is returned.
+        """
+        results = []
+        callback = on_result if on_result else results.append
+        asyncio.run(self.fetch_all(items, callback))
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get fetch statistics, including the current per-host rate"""
+        stats = dict(self.stats)
+        stats['host_rates'] = {host: metrics['rate'] for host, metrics in self.rate_limiter.get_metrics().items()}
+        return stats
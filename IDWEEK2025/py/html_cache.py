@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Raw HTML Cache
+Local on-disk cache of crawled pages, shared by all conference crawlers.
+Pages are keyed by URL and stored by content hash, so identical pages are
+kept once. ETag / Last-Modified are remembered so refetches are conditional
+GETs, and offline runs replay entirely from the cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from adaptive_throttle import AdaptiveThrottle, RETRY_STATUSES, parse_retry_after
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'html_cache')
+
+
+class CacheMissError(LookupError):
+    """Raised in offline mode when a URL has never been cached"""
+
+
+class HTMLCache:
+    """
+    Content-addressed page cache
+
+    Layout:
+        <cache_dir>/objects/ab/abcdef....html  page bodies, named by SHA-256 of the body
+        <cache_dir>/urls/12/123456....json     per-URL entry: content hash, ETag, Last-Modified
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, 'objects')
+        self.urls_dir = os.path.join(cache_dir, 'urls')
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.urls_dir, exist_ok=True)
+
+    @staticmethod
+    def content_hash(body: str) -> str:
+        """SHA-256 of the UTF-8 encoded page body"""
+        return hashlib.sha256(body.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, url: str) -> str:
+        url_key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.urls_dir, url_key[:2], f"{url_key}.json")
+
+    def _object_path(self, content_hash: str) -> str:
+        return os.path.join(self.objects_dir, content_hash[:2], f"{content_hash}.html")
+
+    @staticmethod
+    def _write_atomic(path: str, data: str):
+        """Write via a temp file and rename, so readers never see partial files"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """Get the cache entry for a URL, or None if it was never cached"""
+        try:
+            with open(self._entry_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def read(self, url: str) -> Optional[str]:
+        """Get the cached body for a URL, or None"""
+        entry = self.lookup(url)
+        if not entry:
+            return None
+
+        try:
+            with open(self._object_path(entry['content_hash']), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            logger.warning(f"Cache entry for {url} points at a missing object {entry['content_hash']}")
+            return None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for revalidating a cached URL"""
+        entry = self.lookup(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, body: str, headers: Optional[Mapping[str, str]] = None, status: int = 200) -> str:
+        """
+        Store a fetched page
+
+        Returns:
+            Content hash of the body
+        """
+        headers = headers or {}
+        content_hash = self.content_hash(body)
+
+        object_path = self._object_path(content_hash)
+        if not os.path.exists(object_path):
+            self._write_atomic(object_path, body)
+
+        entry = {
+            'url': url,
+            'content_hash': content_hash,
+            'status': status,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'fetched_at': datetime.now().isoformat(),
+        }
+        self._write_atomic(self._entry_path(url), json.dumps(entry))
+        return content_hash
+
+    def touch(self, url: str):
+        """Record a successful revalidation (304) for a cached URL"""
+        entry = self.lookup(url)
+        if entry:
+            entry['fetched_at'] = datetime.now().isoformat()
+            self._write_atomic(self._entry_path(url), json.dumps(entry))
+
+    def get(self, url: str, offline: bool = False, session: Optional[requests.Session] = None, timeout: float = 30,
+            throttle: Optional[AdaptiveThrottle] = None, max_retries: int = 3) -> str:
+        """
+        Blocking fetch through the cache, for the requests-based crawler scripts
+
+        Online, a cached URL is revalidated with a conditional GET and the cached
+        body is returned on 304. Offline, the cached body is returned without
+        touching the network. With a throttle, requests wait for the host's
+        rate budget and 429/5xx/connection errors are retried with backoff.
+
+        Raises:
+            CacheMissError: offline and the URL is not cached
+            requests.RequestException: the network fetch failed
+        """
+        if offline:
+            body = self.read(url)
+            if body is None:
+                raise CacheMissError(f"Not in cache (offline): {url}")
+            return body
+
+        http = session or requests
+        host = urlsplit(url).netloc
+        cached_body = self.read(url)
+        headers = self.conditional_headers(url) if cached_body is not None else {}
+
+        for attempt in range(max_retries + 1):
+            if throttle:
+                throttle.acquire_sync(host)
+            started = time.monotonic()
+
+            try:
+                response = http.get(url, headers=headers, timeout=timeout)
+            except requests.RequestException:
+                if not throttle:
+                    raise
+                throttle.record(host, None, time.monotonic() - started)
+                if attempt == max_retries:
+                    raise
+                continue
+
+            if not throttle:
+                break
+            throttle.record(host, response.status_code, time.monotonic() - started,
+                            parse_retry_after(response.headers.get('Retry-After')))
+            if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+                break
+
+        if response.status_code == 304 and cached_body is not None:
+            self.touch(url)
+            return cached_body
+
+        response.raise_for_status()
+        self.store(url, response.text, response.headers, response.status_code)
+        return response.text
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Listing Stream Parser
+Single-pass extractor for the large saved listing sources: the IDWeek
+meeting-site listings in source_html_from_meeting_URLs/ and the annotated
+ESCMID FinalProgramme_Full_v2.html. The file is fed to an lxml
+HTMLPullParser in chunks and each session, presentation or poster record is
+yielded as soon as its closing tag arrives; everything before it is then
+dropped from the tree, so memory stays flat however large the file is.
+
+    python listing_stream_parser.py "../source_html_from_meeting_URLs/IDWeek2025 symposia_website_source_0909.html" --output symposia.jsonl
+"""
+
+import argparse
+import logging
+import os
+import re
+import time
+from typing import Any, Dict, Iterator, List
+
+from lxml import etree
+
+from stream_writers import JSONLWriter
+from xpath_registry import (
+    LISTING_LOCATION,
+    LISTING_PRESENTERS,
+    LISTING_TIME,
+    LISTING_TIMEZONE,
+    LISTING_TITLE,
+    LISTING_TRACKS,
+)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+# "Saturday, October 18, 2025" (IDWeek) and "Friday, 11 April 2025" (ESCMID) day headings
+DAY_RE = re.compile(r'^(?:Mon|Tues|Wednes|Thurs|Fri|Satur|Sun)day, (?:\w+ \d{1,2}|\d{1,2} \w+),? \d{4}$')
+# "PW02 - Best Practices..." listing titles and "(P-1533) Title" poster titles
+SESSION_CODE_RE = re.compile(r'^([A-Z]*\d+)\s+-\s+(.*)$', re.DOTALL)
+POSTER_NUMBER_RE = re.compile(r'^\((P-\d+)\)\s*(.*)$', re.DOTALL)
+# "744926\t(P-1533)\t Title" lines of the saved poster listings
+POSTER_LINE_RE = re.compile(r'^(\d+)\s+\((P-\d+)\)\s*(.*)$')
+PRESENTER_ID_RE = re.compile(r'HPRID=(\d+)')
+# "(Nantes, France)" after a name in the ESCMID presenter lists
+PLACE_RE = re.compile(r'\(([^)]*)\)')
+
+# ESCMID programme classes and the record field each one fills
+ESCMID_FIELDS = {
+    'start': 'start',
+    'end': 'end',
+    'location': 'location',
+    'title': 'title',
+    'header': 'session_type',
+    'heading': 'session_type',
+}
+
+
+def clean_text(text: str) -> str:
+    """Collapse runs of whitespace"""
+    return ' '.join((text or '').split())
+
+
+def element_text(element) -> str:
+    """All text inside an element, whitespace collapsed"""
+    return clean_text(''.join(element.itertext()))
+
+
+class TreeReleaser:
+    """
+    Frees the parsed tree as records are read from it
+
+    release(element) clears the element and deletes everything parsed before
+    it, keeping only its open ancestors. Only the levels below the lowest
+    ancestor it shares with the previously released element can have gained
+    content since then, so the walk up stops there: the annotated ESCMID
+    programme nests hundreds of unclosed spans deep.
+    """
+
+    def __init__(self):
+        self.path = []
+        self.path_nodes = set()
+
+    def release(self, element):
+        element.clear(keep_tail=True)
+        walked = []
+        node = element
+        while node is not None and node not in self.path_nodes:
+            parent = node.getparent()
+            while node.getprevious() is not None:
+                del parent[0]
+            walked.append(node)
+            node = parent
+
+        shared = self.path.index(node) if node is not None else len(self.path)
+        self.path_nodes.difference_update(self.path[:shared])
+        self.path_nodes.update(walked)
+        self.path = walked + self.path[shared:]
+
+
+def parse_name_places(text: str) -> List[Dict[str, str]]:
+    """
+    [{'name', 'location'}] from 'Name (City, Country) Name (City, Country)'
+
+    Author lists name only some people with a place ("A* (City, Country), B, C");
+    the others get an empty location.
+    """
+    parts = PLACE_RE.split(clean_text(text))
+    people = []
+    for index in range(0, len(parts), 2):
+        names = [{'name': name.strip(), 'location': ''} for name in parts[index].split(',') if name.strip()]
+        if names and index + 1 < len(parts):
+            names[-1]['location'] = parts[index + 1].strip()
+        people.extend(names)
+    return people
+
+
+class ListingStreamParser:
+    """Streams records out of saved listing pages without building the whole tree"""
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.stats = {'files': 0, 'bytes': 0, 'records': 0}
+
+    def iter_file(self, path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Records from a saved listing, by format
+
+        Plain-text poster listings ("id (P-n) title" per line), ESCMID programme
+        HTML (p.sessionid markers) and IDWeek listing HTML (li[data-presid]) are
+        told apart from the start of the file.
+        """
+        with open(path, 'rb') as f:
+            head = f.read(self.chunk_size)
+
+        self.stats['files'] += 1
+        if not head.lstrip().startswith(b'<'):
+            records = self.iter_poster_lines(path)
+        elif b'class="sessionid"' in head:
+            records = self.iter_escmid_programme(path)
+        else:
+            records = self.iter_idweek_listing(path)
+
+        for record in records:
+            self.stats['records'] += 1
+            yield record
+
+    def _events(self, path: str, **parser_options) -> Iterator[Any]:
+        """(event, element) pairs, fed to the pull parser one chunk at a time"""
+        # huge_tree: unclosed spans in the annotated programme nest past libxml2's default depth limit
+        parser = etree.HTMLPullParser(events=('end',), encoding='utf-8', huge_tree=True, **parser_options)
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(self.chunk_size)
+                if not chunk:
+                    break
+                self.stats['bytes'] += len(chunk)
+                parser.feed(chunk)
+                yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    def iter_idweek_listing(self, path: str) -> Iterator[Dict[str, Any]]:
+        """Session (or poster) records from an IDWeek listing page, one per li[data-presid]"""
+        date = ''
+        releaser = TreeReleaser()
+        for _, element in self._events(path, tag='li'):
+            if 'dayrow' in (element.get('class') or ''):
+                date = element_text(element)
+                releaser.release(element)
+            elif element.get('data-presid'):
+                yield self._listing_record(element, date)
+                releaser.release(element)
+
+    def _listing_record(self, element, date: str) -> Dict[str, Any]:
+        title_elements = LISTING_TITLE(element)
+        title = element_text(title_elements[0]) if title_elements else ''
+        time_elements = LISTING_TIME(element)
+        timezone_elements = LISTING_TIMEZONE(element)
+        location = next((text.strip() for text in LISTING_LOCATION(element) if 'Location:' in text), '')
+
+        record = {
+            'kind': 'session',
+            'presentation_id': element.get('data-presid'),
+            'code': '',
+            'title': title,
+            'date': date,
+            'time': clean_text(time_elements[0]) if time_elements else '',
+            'timezone': clean_text(timezone_elements[0]) if timezone_elements else '',
+            'location': clean_text(location.replace('Location:', '')),
+            'presenters': [self._listing_presenter(div) for div in LISTING_PRESENTERS(element)],
+            'tracks': [clean_text(track) for track in LISTING_TRACKS(element)],
+        }
+
+        poster_match = POSTER_NUMBER_RE.match(title)
+        code_match = SESSION_CODE_RE.match(title)
+        if poster_match:
+            record.update(kind='poster', code=poster_match.group(1), title=poster_match.group(2))
+        elif code_match:
+            record.update(code=code_match.group(1), title=code_match.group(2))
+        return record
+
+    @staticmethod
+    def _listing_presenter(div) -> Dict[str, str]:
+        """'Workshop Moderator: <a>Name</a> – Affiliation' as role, name, affiliation and presenter ID"""
+        link = div.find('a')
+        role = (div.text or '').split(':', 1)[0].strip()
+        if link is None:
+            return {'role': role, 'name': element_text(div).split(':', 1)[-1].strip(),
+                    'affiliation': '', 'presenter_id': ''}
+
+        presenter_id = PRESENTER_ID_RE.search(link.get('data-url', ''))
+        return {
+            'role': role,
+            'name': element_text(link),
+            'affiliation': clean_text(link.tail).lstrip('–- ').strip(),
+            'presenter_id': presenter_id.group(1) if presenter_id else '',
+        }
+
+    def iter_escmid_programme(self, path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Session and presentation records from the annotated ESCMID programme
+
+        Each p.sessionid starts a record; the classed start/end/location/title/
+        presenter(s) elements after it fill it in. A record is yielded when the
+        next one starts. Records with an end time or location are sessions; the
+        others are presentations of the session before them.
+        """
+        date = ''
+        session_code = ''
+        record = None
+        releaser = TreeReleaser()
+
+        def finish(record):
+            nonlocal session_code
+            if record['end'] or record['location']:
+                record['kind'] = 'session'
+                session_code = record['code']
+            else:
+                record['kind'] = 'presentation'
+                record['parent_code'] = session_code
+            return record
+
+        for _, element in self._events(path):
+            classes = (element.get('class') or '').split()
+            if not classes:
+                if element.tag == 'p':
+                    text = element_text(element)
+                    if DAY_RE.match(text):
+                        date = text
+                continue
+
+            if 'sessionid' in classes:
+                if record is not None:
+                    yield finish(record)
+                record = {
+                    'kind': '', 'code': element_text(element), 'parent_code': '', 'date': date,
+                    'start': '', 'end': '', 'location': '', 'session_type': '', 'title': '', 'presenters': [],
+                }
+                releaser.release(element)
+            elif record is not None:
+                if 'presenter' in classes or 'presenters' in classes:
+                    record['presenters'].extend(parse_name_places(element_text(element)))
+                    continue
+                for css_class in classes:
+                    field = ESCMID_FIELDS.get(css_class)
+                    if field and not record[field]:
+                        # Times and halls are sometimes left unclosed around the next field: own text only
+                        text = element.text if field in ('start', 'end', 'location') else ''.join(element.itertext())
+                        record[field] = clean_text(text)
+
+        if record is not None:
+            yield finish(record)
+
+    def iter_poster_lines(self, path: str) -> Iterator[Dict[str, Any]]:
+        """Poster records from a plain-text listing, one "id (P-n) title" per line"""
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                self.stats['bytes'] += len(line)
+                match = POSTER_LINE_RE.match(line.strip())
+                if match:
+                    yield {
+                        'kind': 'poster',
+                        'presentation_id': match.group(1),
+                        'code': match.group(2),
+                        'title': clean_text(match.group(3)),
+                    }
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get parsing statistics"""
+        return dict(self.stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract session and poster records from saved listing sources')
+    parser.add_argument('files', nargs='+', help='Saved listing files (.html or .txt)')
+    parser.add_argument('--output', required=True, help='JSONL file to write the records to')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='Bytes fed to the parser at a time')
+    args = parser.parse_args()
+
+    listing_parser = ListingStreamParser(chunk_size=args.chunk_size)
+    started = time.time()
+    with JSONLWriter(args.output) as writer:
+        for path in args.files:
+            before = writer.count
+            for record in listing_parser.iter_file(path):
+                record['source_file'] = os.path.basename(path)
+                writer.write(record)
+            logger.info(f"{os.path.basename(path)}: {writer.count - before} records")
+
+    stats = listing_parser.get_stats()
+    elapsed = time.time() - started
+    logger.info(f"Wrote {stats['records']} records from {stats['files']} files to {args.output} "
+                f"({stats['bytes'] / 1024 / 1024:.1f} MB in {elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
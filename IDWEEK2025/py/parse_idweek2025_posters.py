@@ -4,78 +4,227 @@ IDWeek 2025 Poster Crawler
 Crawls local poster data using the poster HTML parser
 """
 
-import requests
 from poster_html_parser import PosterHTMLParser, parse_poster_batch
+from fetch_engine import AsyncFetchEngine
+from adaptive_throttle import AdaptiveThrottle
+from html_cache import HTMLCache, DEFAULT_CACHE_DIR
+from parse_pipeline import ParsePipeline
+from crawl_frontier import CrawlFrontier, DEFAULT_FRONTIER_PATH
+from stream_writers import JSONLWriter, CSVStreamWriter
 import json
 import csv
-import time
 import logging
-from typing import List, Dict, Any
-import sys
+from typing import List, Dict, Any, Optional
+import argparse
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Column order of the flattened poster CSV
+POSTER_CSV_FIELDS = [
+    'poster_id', 'source_url', 'track_code', 'track_name', 'session_type', 'presentation_id', 'title',
+    'date', 'time', 'timezone', 'location',
+    'presenting_author_name', 'presenting_author_title', 'presenting_author_institution', 'presenting_author_location',
+    'total_presenting_authors', 'total_co_authors', 'all_presenting_authors', 'all_co_authors',
+]
+
+
+def flatten_poster(poster: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten one parsed poster into a POSTER_CSV_FIELDS row"""
+    flat_record = {
+        'poster_id': poster.get('poster_id', ''),
+        'source_url': poster.get('source_url', ''),
+        'track_code': poster.get('track_info', {}).get('code', ''),
+        'track_name': poster.get('track_info', {}).get('full_name', ''),
+        'session_type': poster.get('session_info', {}).get('type', ''),
+        'presentation_id': poster.get('presentation_details', {}).get('id', ''),
+        'title': poster.get('presentation_details', {}).get('title', ''),
+        'date': poster.get('schedule', {}).get('date', ''),
+        'time': poster.get('schedule', {}).get('time', ''),
+        'timezone': poster.get('schedule', {}).get('timezone', ''),
+        'location': poster.get('schedule', {}).get('location', ''),
+    }
+    
+    # Add author information
+    authors = poster.get('authors', {})
+    presenting_authors = authors.get('presenting', [])
+    co_authors = authors.get('co_authors', [])
+    
+    # Primary presenting author
+    if presenting_authors:
+        flat_record.update({
+            'presenting_author_name': presenting_authors[0].get('name', ''),
+            'presenting_author_title': presenting_authors[0].get('title', ''),
+            'presenting_author_institution': presenting_authors[0].get('institution', ''),
+            'presenting_author_location': presenting_authors[0].get('location', ''),
+        })
+    
+    # Count authors
+    flat_record['total_presenting_authors'] = len(presenting_authors)
+    flat_record['total_co_authors'] = len(co_authors)
+    
+    # All author names (semicolon separated)
+    all_presenting = [auth.get('name', '') for auth in presenting_authors]
+    all_co_authors = [auth.get('name', '') for auth in co_authors]
+    
+    flat_record['all_presenting_authors'] = '; '.join(all_presenting)
+    flat_record['all_co_authors'] = '; '.join(all_co_authors)
+    
+    return flat_record
+
+
 class IDWeek2025PosterCrawler:
     """Crawler for IDWeek 2025 poster data from local server"""
     
-    def __init__(self, base_url: str = "http://local.dev.conferencecrawler.com/IDWEEK2025/cfml_viewer/posters.cfm"):
+    def __init__(self, base_url: str = "http://local.dev.conferencecrawler.com/IDWEEK2025/cfml_viewer/posters.cfm",
+                 concurrency: int = 8, rate_limit: float = 10.0, adaptive: bool = True, workers: Optional[int] = None,
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR, offline: bool = False,
+                 frontier_path: Optional[str] = DEFAULT_FRONTIER_PATH):
+        """
+        Args:
+            base_url: Poster page URL, the poster ID is appended as thisID
+            concurrency: Maximum number of requests in flight at once
+            rate_limit: Maximum requests per second to the poster host (0 = unlimited)
+            adaptive: Let the rate float up to rate_limit, backing off on 429/5xx or slow responses
+            workers: Parser processes (None = one per core, 0 = parse inline)
+            cache_dir: Raw HTML cache directory (None disables the cache)
+            offline: Replay every page from the cache instead of the network
+            frontier_path: SQLite crawl frontier used for resuming (None keeps it in memory)
+        """
         self.base_url = base_url
+        self.cache = HTMLCache(cache_dir) if cache_dir else None
+        self.rate_limit = rate_limit
+        self.adaptive = adaptive and rate_limit > 0
+        throttle = AdaptiveThrottle(max_rate=rate_limit) if self.adaptive else None
+        self.engine = AsyncFetchEngine(concurrency=concurrency, rate_per_host=rate_limit,
+                                       cache=self.cache, offline=offline, throttle=throttle)
         self.parser = PosterHTMLParser()
-        self.session = requests.Session()
+        self.pipeline = ParsePipeline('poster', self.parser, workers=workers)
+        self.frontier = CrawlFrontier(frontier_path or ':memory:', kind='poster')
         self.crawled_data = []
+        self.stream_files = None
+        self.stream = None
+        self.records_streamed = 0
+        
+    def enable_streaming(self, jsonl_filename: str = "idweek2025_posters.jsonl",
+                         csv_filename: str = "idweek2025_posters.csv"):
+        """
+        Stream each poster to JSONL and CSV as soon as it is parsed
         
-    def crawl_poster_range(self, start_id: int = 1, end_id: int = 2169, delay: float = 0.5) -> List[Dict[str, Any]]:
+        crawled_data is then left empty, so memory stays flat regardless of
+        conference size. Rows are written in completion order, not ID order,
+        and parser error records are not streamed. A resumed crawl appends.
+        """
+        self.stream_files = {
+            'jsonl': jsonl_filename,
+            'csv': csv_filename
+        }
+    
+    def _open_stream(self, append: bool):
+        self.stream = {
+            'jsonl': JSONLWriter(self.stream_files['jsonl'], append=append),
+            'csv': CSVStreamWriter(self.stream_files['csv'], POSTER_CSV_FIELDS, append=append)
+        }
+    
+    def _stream_record(self, poster_data: Dict[str, Any]):
+        """Write one parsed poster to every stream"""
+        self.stream['jsonl'].write(poster_data)
+        self.stream['csv'].write(flatten_poster(poster_data))
+        self.records_streamed += 1
+    
+    def _close_stream(self):
+        for writer in self.stream.values():
+            writer.close()
+        logger.info(f"Streamed {self.records_streamed} posters to {', '.join(self.stream_files.values())}")
+        self.stream = None
+    
+    def crawl_poster_range(self, start_id: int = 1, end_id: int = 2169, resume: bool = False) -> List[Dict[str, Any]]:
         """
         Crawl posters from start_id to end_id
         
+        Requests are issued concurrently by the fetch engine, within the
+        crawler's concurrency limit and per-host rate budget. Fetched pages
+        are parsed in the parser process pool while fetching continues.
+        Each ID's outcome is journaled in the crawl frontier as it finishes.
+        
         Args:
             start_id: Starting poster ID
             end_id: Ending poster ID  
-            delay: Delay between requests in seconds
+            resume: Skip IDs the frontier already has as done and retry only
+                failed or never-attempted IDs
             
         Returns:
-            List of parsed poster data
+            List of parsed poster data, ordered by poster ID
         """
-        results = []
         failed_ids = []
+        processed = 0
         
-        logger.info(f"Starting crawl of posters {start_id} to {end_id}")
+        if resume:
+            completed = self.frontier.completed_ids(start_id, end_id)
+            previously_failed = self.frontier.failed_ids(start_id, end_id)
+            logger.info(f"Resuming: {len(completed)} posters already done, {len(previously_failed)} to retry")
+        else:
+            completed = set()
+            self.frontier.reset(start_id, end_id)
         
-        for poster_id in range(start_id, end_id + 1):
-            try:
-                url = f"{self.base_url}?thisID={poster_id}"
-                logger.info(f"Crawling poster {poster_id}/{end_id}: {url}")
-                
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                
-                # Parse the HTML content
-                poster_data = self.parser.parse_poster_html(response.text)
+        pending_ids = [poster_id for poster_id in range(start_id, end_id + 1) if poster_id not in completed]
+        
+        logger.info(f"Starting crawl of {len(pending_ids)} posters in {start_id} to {end_id} "
+                    f"(concurrency={self.engine.concurrency}, rate limit={self.rate_limit}/s{' adaptive' if self.adaptive else ''})")
+        
+        def handle_parsed(fetched, poster_data, error):
+            nonlocal processed
+            poster_id = fetched['id']
+            url = fetched['url']
+            processed += 1
+            
+            if fetched['error']:
+                logger.error(f"Request failed for poster {poster_id}: {error}")
+                failed_ids.append(poster_id)
+            elif error:
+                logger.error(f"Unexpected error processing poster {poster_id}: {error}")
+                failed_ids.append(poster_id)
+            else:
+                logger.info(f"Crawled poster {poster_id}/{end_id}: {url}")
                 poster_data['poster_id'] = poster_id
                 poster_data['source_url'] = url
                 
-                results.append(poster_data)
-                
-                # Add delay between requests
-                if delay > 0:
-                    time.sleep(delay)
-                    
-            except requests.RequestException as e:
-                logger.error(f"Request failed for poster {poster_id}: {e}")
-                failed_ids.append(poster_id)
-                
-            except Exception as e:
-                logger.error(f"Unexpected error processing poster {poster_id}: {e}")
-                failed_ids.append(poster_id)
+                if 'error' in poster_data:
+                    failed_ids.append(poster_id)
+                elif self.stream:
+                    self._stream_record(poster_data)
+            
+            self.frontier.record_outcome(poster_id, url, http_status=fetched['status'],
+                                         content_hash=fetched['content_hash'], record=poster_data, error=error)
             
             # Progress update every 50 posters
-            if poster_id % 50 == 0:
-                logger.info(f"Progress: {poster_id}/{end_id} posters processed")
+            if processed % 50 == 0:
+                logger.info(f"Progress: {processed}/{len(pending_ids)} posters processed, "
+                            f"current rate {self.engine.get_stats()['host_rates']}")
+        
+        urls = ((poster_id, f"{self.base_url}?thisID={poster_id}") for poster_id in pending_ids)
+        if self.stream_files:
+            self._open_stream(append=resume)
+        try:
+            self.pipeline.run(self.engine, urls, handle_parsed)
+        finally:
+            if self.stream:
+                self._close_stream()
+        failed_ids.sort()
         
         if failed_ids:
             logger.warning(f"Failed to process {len(failed_ids)} posters: {failed_ids[:10]}{'...' if len(failed_ids) > 10 else ''}")
+            logger.warning("Re-run with --resume to retry only the failed posters")
+        
+        if self.stream_files:
+            # Records are already on disk; don't rebuild them in memory
+            self.crawled_data = []
+            return []
+        
+        # The frontier holds this run's records plus any completed before a resume,
+        # already ordered by ID
+        results = list(self.frontier.records(start_id, end_id))
         
         self.crawled_data = results
         return results
@@ -98,89 +247,121 @@ class IDWeek2025PosterCrawler:
             return
         
         # Flatten the nested data structure for CSV
-        flattened_data = []
-        for poster in self.crawled_data:
-            if 'error' in poster:
-                continue
-                
-            flat_record = {
-                'poster_id': poster.get('poster_id', ''),
-                'source_url': poster.get('source_url', ''),
-                'track_code': poster.get('track_info', {}).get('code', ''),
-                'track_name': poster.get('track_info', {}).get('full_name', ''),
-                'session_type': poster.get('session_info', {}).get('type', ''),
-                'presentation_id': poster.get('presentation_details', {}).get('id', ''),
-                'title': poster.get('presentation_details', {}).get('title', ''),
-                'date': poster.get('schedule', {}).get('date', ''),
-                'time': poster.get('schedule', {}).get('time', ''),
-                'timezone': poster.get('schedule', {}).get('timezone', ''),
-                'location': poster.get('schedule', {}).get('location', ''),
-            }
-            
-            # Add author information
-            authors = poster.get('authors', {})
-            presenting_authors = authors.get('presenting', [])
-            co_authors = authors.get('co_authors', [])
-            
-            # Primary presenting author
-            if presenting_authors:
-                flat_record.update({
-                    'presenting_author_name': presenting_authors[0].get('name', ''),
-                    'presenting_author_title': presenting_authors[0].get('title', ''),
-                    'presenting_author_institution': presenting_authors[0].get('institution', ''),
-                    'presenting_author_location': presenting_authors[0].get('location', ''),
-                })
-            
-            # Count authors
-            flat_record['total_presenting_authors'] = len(presenting_authors)
-            flat_record['total_co_authors'] = len(co_authors)
-            
-            # All author names (semicolon separated)
-            all_presenting = [auth.get('name', '') for auth in presenting_authors]
-            all_co_authors = [auth.get('name', '') for auth in co_authors]
-            
-            flat_record['all_presenting_authors'] = '; '.join(all_presenting)
-            flat_record['all_co_authors'] = '; '.join(all_co_authors)
-            
-            flattened_data.append(flat_record)
+        flattened_data = [flatten_poster(poster) for poster in self.crawled_data if 'error' not in poster]
         
         # Write to CSV
         if flattened_data:
             with open(filename, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = flattened_data[0].keys()
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer = csv.DictWriter(f, fieldnames=POSTER_CSV_FIELDS, restval='')
                 writer.writeheader()
                 writer.writerows(flattened_data)
             
             logger.info(f"Saved {len(flattened_data)} poster records to {filename}")
     
+    def export_tables(self, formats: List[str], output_dir: str = '.', prefix: str = 'idweek2025'):
+        """
+        Write the posters and authors tables in each format (csv, parquet, xlsx)
+        
+        Builds Arrow tables from crawled_data in one pass (columnar_export),
+        so every format comes from the same in-memory tables.
+        """
+        if not self.crawled_data:
+            logger.warning("No data to save")
+            return
+        
+        # pyarrow is only needed for the columnar export
+        from columnar_export import poster_tables, write_tables
+        write_tables(poster_tables(self.crawled_data), output_dir, prefix, formats)
+    
+    def save_to_store(self, store_dir: str, conference: str = 'IDWEEK', year: int = 2025):
+        """
+        Write the posters and authors tables to the partitioned Parquet store
+        
+        Replaces this conference/year's partitions under store_dir (conference_store).
+        """
+        if not self.crawled_data:
+            logger.warning("No data to save")
+            return
+        
+        # pyarrow is only needed for the store
+        from columnar_export import poster_tables
+        from conference_store import write_store
+        write_store(poster_tables(self.crawled_data), conference, year, store_dir)
+    
     def get_stats(self):
         """Get crawling statistics"""
         parser_stats = self.parser.get_stats()
+        fetch_stats = self.engine.get_stats()
         return {
-            'total_crawled': len(self.crawled_data),
+            'total_crawled': self.records_streamed if self.stream_files else len(self.crawled_data),
             'successful_parses': parser_stats['parsed_count'],
-            'parse_errors': parser_stats['error_count']
+            'parse_errors': parser_stats['error_count'],
+            'failed_requests': fetch_stats['failed'],
+            'not_modified': fetch_stats['not_modified'],
+            'from_cache': fetch_stats['from_cache'],
+            'retries': fetch_stats['retries'],
+            'host_rates': fetch_stats['host_rates']
         }
 
 
 def main():
     """Main crawling function"""
     # Parse command line arguments
-    start_id = int(sys.argv[1]) if len(sys.argv) > 1 else 1
-    end_id = int(sys.argv[2]) if len(sys.argv) > 2 else 2169
-    delay = float(sys.argv[3]) if len(sys.argv) > 3 else 0.5
+    parser = argparse.ArgumentParser(description='Crawl IDWeek 2025 poster pages')
+    parser.add_argument('start_id', type=int, nargs='?', default=1, help='Starting poster ID')
+    parser.add_argument('end_id', type=int, nargs='?', default=2169, help='Ending poster ID')
+    parser.add_argument('delay', type=float, nargs='?', default=None,
+                        help='Seconds between requests (old interface; same as --rate-limit 1/DELAY --fixed-rate)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Maximum requests in flight')
+    parser.add_argument('--rate-limit', type=float, default=10.0, help='Maximum requests per second to the host (0 = unlimited)')
+    parser.add_argument('--fixed-rate', action='store_true', help='Hold --rate-limit fixed instead of adapting to server responses')
+    parser.add_argument('--workers', type=int, default=None, help='Parser processes (default: one per core, 0 = parse inline)')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Raw HTML cache directory')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the raw HTML cache')
+    parser.add_argument('--offline', action='store_true', help='Replay pages from the raw HTML cache without network access')
+    parser.add_argument('--resume', action='store_true', help='Skip IDs already completed in the crawl frontier and retry failed ones')
+    parser.add_argument('--frontier', default=DEFAULT_FRONTIER_PATH, help='SQLite crawl frontier file')
+    parser.add_argument('--stream', action='store_true', help='Write JSONL/CSV as each record is parsed instead of at the end')
+    parser.add_argument('--formats', nargs='+', choices=['csv', 'parquet', 'xlsx'],
+                        help='Write table exports in these formats through Arrow instead of the row-by-row CSV writer')
+    parser.add_argument('--store', help='Also write the tables to the partitioned Parquet store in this directory')
+    args = parser.parse_args()
+    
+    if args.delay is not None:
+        # The old third positional argument: a fixed pause between request starts
+        args.rate_limit = 1.0 / args.delay if args.delay > 0 else 0
+        args.fixed_rate = True
+    
+    logger.info(f"Starting IDWeek 2025 poster crawl: IDs {args.start_id}-{args.end_id} "
+                f"with concurrency {args.concurrency} at {args.rate_limit} req/s{' (offline)' if args.offline else ''}")
+    
+    if args.offline and args.no_cache:
+        parser.error('--offline needs the cache; drop --no-cache')
+    if args.stream and args.formats:
+        parser.error('--formats exports at the end of the crawl; drop --stream')
+    if args.stream and args.store:
+        parser.error('--store writes at the end of the crawl; drop --stream')
     
-    logger.info(f"Starting IDWeek 2025 poster crawl: IDs {start_id}-{end_id} with {delay}s delay")
+    crawler = IDWeek2025PosterCrawler(concurrency=args.concurrency, rate_limit=args.rate_limit, adaptive=not args.fixed_rate,
+                                      workers=args.workers,
+                                      cache_dir=None if args.no_cache else args.cache_dir, offline=args.offline,
+                                      frontier_path=args.frontier)
     
-    crawler = IDWeek2025PosterCrawler()
+    if args.stream:
+        crawler.enable_streaming()
     
     # Crawl the data
-    results = crawler.crawl_poster_range(start_id, end_id, delay)
+    results = crawler.crawl_poster_range(args.start_id, args.end_id, resume=args.resume)
     
-    # Save results
-    crawler.save_to_json()
-    crawler.save_to_csv()
+    # Save results (already written as they arrived when streaming)
+    if not args.stream:
+        crawler.save_to_json()
+        if args.formats:
+            crawler.export_tables(args.formats)
+        else:
+            crawler.save_to_csv()
+        if args.store:
+            crawler.save_to_store(args.store)
     
     # Print statistics
     stats = crawler.get_stats()
@@ -4,78 +4,326 @@ IDWeek 2025 Session Crawler
 Crawls local session data using the session HTML parser
 """
 
-import requests
 from session_parser_fixed import SessionHTMLParserFixed
+from fetch_engine import AsyncFetchEngine
+from adaptive_throttle import AdaptiveThrottle
+from html_cache import HTMLCache, DEFAULT_CACHE_DIR
+from parse_pipeline import ParsePipeline
+from crawl_frontier import CrawlFrontier, DEFAULT_FRONTIER_PATH
+from stream_writers import JSONLWriter, CSVStreamWriter
 import json
 import csv
-import time
 import logging
-from typing import List, Dict, Any
-import sys
+from typing import List, Dict, Any, Optional
+import argparse
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Column order of the flattened session CSV
+SESSION_CSV_FIELDS = [
+    'session_id', 'source_url', 'primary_track', 'all_tracks', 'track_count',
+    'session_type', 'session_number', 'session_title', 'full_title',
+    'date', 'time', 'timezone', 'location',
+    'cme_hours', 'moc_hours', 'cne_hours', 'acpe_hours', 'acpe_number', 'pace_hours', 'ce_broker_hours',
+    'primary_speaker_name', 'primary_speaker_title', 'primary_speaker_department',
+    'primary_speaker_institution', 'primary_speaker_location',
+    'total_speakers', 'all_speakers', 'disclosure_count', 'disclosures',
+    'presentation_count', 'presentation_titles', 'presentation_times', 'presentation_speakers',
+]
+
+# Column order of the per-presentation CSV
+PRESENTATION_CSV_FIELDS = [
+    'session_id', 'session_type', 'session_title', 'session_date', 'session_location',
+    'presentation_id', 'presentation_time', 'presentation_title', 'speaker_name', 'speaker_affiliation',
+]
+
+
+def sanitize_csv_field(value):
+    """Clean field values to prevent CSV formatting issues"""
+    if not isinstance(value, str):
+        return value
+    # Replace newlines with semicolons, clean up whitespace
+    return value.replace('\n', '; ').replace('\r', '').strip()
+
+
+def _session_speaker_list(session: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Session speakers as one list; the parser groups them by role"""
+    speakers = session.get('speakers', [])
+    if isinstance(speakers, dict):
+        return [speaker for role_speakers in speakers.values() for speaker in role_speakers]
+    return speakers
+
+
+def _presentation_speaker(presentation: Dict[str, Any]) -> Dict[str, Any]:
+    """First speaker of a presentation (older records carry a single 'speaker')"""
+    if presentation.get('speaker'):
+        return presentation['speaker']
+    speakers = presentation.get('speakers') or [{}]
+    return speakers[0]
+
+
+def flatten_session(session: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten one parsed session into a SESSION_CSV_FIELDS row"""
+    # Basic session info
+    flat_record = {
+        'session_id': session.get('session_id', ''),
+        'source_url': session.get('source_url', ''),
+        'primary_track': sanitize_csv_field(session.get('tracks', {}).get('primary_track', '')),
+        'all_tracks': '; '.join(session.get('tracks', {}).get('all_tracks', [])),
+        'track_count': session.get('tracks', {}).get('track_count', 0),
+        'session_type': sanitize_csv_field(session.get('session_info', {}).get('type', '')),
+        'session_number': sanitize_csv_field(session.get('session_info', {}).get('number', '')),
+        'session_title': sanitize_csv_field(session.get('session_info', {}).get('title', '')),
+        'full_title': sanitize_csv_field(session.get('session_info', {}).get('full_title', '')),
+        'date': sanitize_csv_field(session.get('schedule', {}).get('date', '')),
+        'time': sanitize_csv_field(session.get('schedule', {}).get('time', '')),
+        'timezone': sanitize_csv_field(session.get('schedule', {}).get('timezone', '')),
+        'location': sanitize_csv_field(session.get('schedule', {}).get('location', '')),
+    }
+    
+    # Credit information
+    credits = session.get('credits', {})
+    flat_record.update({
+        'cme_hours': sanitize_csv_field(credits.get('cme_hours', '')),
+        'moc_hours': sanitize_csv_field(credits.get('moc_hours', '')),
+        'cne_hours': sanitize_csv_field(credits.get('cne_hours', '')),
+        'acpe_hours': sanitize_csv_field(credits.get('acpe_hours', '')),
+        'acpe_number': sanitize_csv_field(credits.get('acpe_number', '')),
+        'pace_hours': sanitize_csv_field(credits.get('pace_hours', '')),
+        'ce_broker_hours': sanitize_csv_field(credits.get('ce_broker_hours', '')),
+    })
+    
+    # Speaker information
+    speakers = _session_speaker_list(session)
+    if speakers:
+        # Primary speaker
+        primary_speaker = speakers[0]
+        flat_record.update({
+            'primary_speaker_name': sanitize_csv_field(primary_speaker.get('name', '')),
+            'primary_speaker_title': sanitize_csv_field(primary_speaker.get('title', '')),
+            'primary_speaker_department': sanitize_csv_field(primary_speaker.get('department', '')),
+            'primary_speaker_institution': sanitize_csv_field(primary_speaker.get('institution', '')),
+            'primary_speaker_location': sanitize_csv_field(primary_speaker.get('location', '')),
+        })
+    
+    # Speaker counts and lists
+    flat_record['total_speakers'] = len(speakers)
+    flat_record['all_speakers'] = sanitize_csv_field('; '.join([s.get('name', '') for s in speakers]))
+    
+    # Disclosure information
+    disclosures = session.get('disclosures', [])
+    flat_record['disclosure_count'] = len(disclosures)
+    if disclosures:
+        disclosure_text = ' | '.join([f"{d.get('speaker', '')}: {d.get('disclosure', '')}" for d in disclosures])
+        flat_record['disclosures'] = sanitize_csv_field(disclosure_text)
+    else:
+        flat_record['disclosures'] = ''
+    
+    # Presentation information
+    presentations = session.get('presentations', [])
+    flat_record['presentation_count'] = len(presentations)
+    if presentations:
+        pres_titles = [p.get('title', '') for p in presentations]
+        flat_record['presentation_titles'] = sanitize_csv_field(' | '.join(pres_titles))
+        
+        pres_times = [p.get('time', '') for p in presentations]
+        flat_record['presentation_times'] = sanitize_csv_field(' | '.join(pres_times))
+        
+        pres_speakers = [_presentation_speaker(p).get('name', '') for p in presentations]
+        flat_record['presentation_speakers'] = sanitize_csv_field(' | '.join(pres_speakers))
+    else:
+        flat_record.update({
+            'presentation_titles': '',
+            'presentation_times': '',
+            'presentation_speakers': ''
+        })
+    
+    return flat_record
+
+
+def session_presentation_rows(session: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """One PRESENTATION_CSV_FIELDS row per presentation in a parsed session"""
+    session_info = {
+        'session_id': session.get('session_id', ''),
+        'session_type': session.get('session_info', {}).get('type', ''),
+        'session_title': session.get('session_info', {}).get('title', ''),
+        'session_date': session.get('schedule', {}).get('date', ''),
+        'session_location': session.get('schedule', {}).get('location', ''),
+    }
+    
+    rows = []
+    for pres in session.get('presentations', []):
+        speaker = _presentation_speaker(pres)
+        pres_record = session_info.copy()
+        pres_record.update({
+            'presentation_id': pres.get('presentation_id', ''),
+            'presentation_time': pres.get('time', ''),
+            'presentation_title': pres.get('title', ''),
+            'speaker_name': speaker.get('name', ''),
+            'speaker_affiliation': speaker.get('affiliation', ''),
+        })
+        rows.append(pres_record)
+    
+    return rows
+
+
 class IDWeek2025SessionCrawler:
     """Crawler for IDWeek 2025 session data from local server"""
     
-    def __init__(self, base_url: str = "http://local.dev.conferencecrawler.com/IDWEEK2025/cfml_viewer/sessions.cfm"):
+    def __init__(self, base_url: str = "http://local.dev.conferencecrawler.com/IDWEEK2025/cfml_viewer/sessions.cfm",
+                 concurrency: int = 8, rate_limit: float = 10.0, adaptive: bool = True, workers: Optional[int] = None,
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR, offline: bool = False,
+                 frontier_path: Optional[str] = DEFAULT_FRONTIER_PATH):
+        """
+        Args:
+            base_url: Session page URL, the session ID is appended as thisID
+            concurrency: Maximum number of requests in flight at once
+            rate_limit: Maximum requests per second to the session host (0 = unlimited)
+            adaptive: Let the rate float up to rate_limit, backing off on 429/5xx or slow responses
+            workers: Parser processes (None = one per core, 0 = parse inline)
+            cache_dir: Raw HTML cache directory (None disables the cache)
+            offline: Replay every page from the cache instead of the network
+            frontier_path: SQLite crawl frontier used for resuming (None keeps it in memory)
+        """
         self.base_url = base_url
+        self.cache = HTMLCache(cache_dir) if cache_dir else None
+        self.rate_limit = rate_limit
+        self.adaptive = adaptive and rate_limit > 0
+        throttle = AdaptiveThrottle(max_rate=rate_limit) if self.adaptive else None
+        self.engine = AsyncFetchEngine(concurrency=concurrency, rate_per_host=rate_limit,
+                                       cache=self.cache, offline=offline, throttle=throttle)
         self.parser = SessionHTMLParserFixed()
-        self.session = requests.Session()
+        self.pipeline = ParsePipeline('session', self.parser, workers=workers)
+        self.frontier = CrawlFrontier(frontier_path or ':memory:', kind='session')
         self.crawled_data = []
+        self.stream_files = None
+        self.stream = None
+        self.records_streamed = 0
+        
+    def enable_streaming(self, jsonl_filename: str = "idweek2025_sessions.jsonl",
+                         csv_filename: str = "idweek2025_sessions.csv",
+                         presentations_csv_filename: str = "idweek2025_presentations.csv"):
+        """
+        Stream each session to JSONL, session CSV and presentations CSV as soon as it is parsed
         
-    def crawl_session_range(self, start_id: int = 1, end_id: int = 1013, delay: float = 0.5) -> List[Dict[str, Any]]:
+        crawled_data is then left empty, so memory stays flat regardless of
+        conference size. Rows are written in completion order, not ID order,
+        and parser error records are not streamed. A resumed crawl appends.
+        """
+        self.stream_files = {
+            'jsonl': jsonl_filename,
+            'csv': csv_filename,
+            'presentations_csv': presentations_csv_filename
+        }
+    
+    def _open_stream(self, append: bool):
+        self.stream = {
+            'jsonl': JSONLWriter(self.stream_files['jsonl'], append=append),
+            'csv': CSVStreamWriter(self.stream_files['csv'], SESSION_CSV_FIELDS, append=append),
+            'presentations_csv': CSVStreamWriter(self.stream_files['presentations_csv'], PRESENTATION_CSV_FIELDS, append=append)
+        }
+    
+    def _stream_record(self, session_data: Dict[str, Any]):
+        """Write one parsed session to every stream"""
+        self.stream['jsonl'].write(session_data)
+        self.stream['csv'].write(flatten_session(session_data))
+        self.stream['presentations_csv'].write_rows(session_presentation_rows(session_data))
+        self.records_streamed += 1
+    
+    def _close_stream(self):
+        for writer in self.stream.values():
+            writer.close()
+        logger.info(f"Streamed {self.records_streamed} sessions to {', '.join(self.stream_files.values())}")
+        self.stream = None
+    
+    def crawl_session_range(self, start_id: int = 1, end_id: int = 1013, resume: bool = False) -> List[Dict[str, Any]]:
         """
         Crawl sessions from start_id to end_id
         
+        Requests are issued concurrently by the fetch engine, within the
+        crawler's concurrency limit and per-host rate budget. Fetched pages
+        are parsed in the parser process pool while fetching continues.
+        Each ID's outcome is journaled in the crawl frontier as it finishes.
+        
         Args:
             start_id: Starting session ID
             end_id: Ending session ID  
-            delay: Delay between requests in seconds
+            resume: Skip IDs the frontier already has as done and retry only
+                failed or never-attempted IDs
             
         Returns:
-            List of parsed session data
+            List of parsed session data, ordered by session ID
         """
-        results = []
         failed_ids = []
+        processed = 0
         
-        logger.info(f"Starting crawl of sessions {start_id} to {end_id}")
+        if resume:
+            completed = self.frontier.completed_ids(start_id, end_id)
+            previously_failed = self.frontier.failed_ids(start_id, end_id)
+            logger.info(f"Resuming: {len(completed)} sessions already done, {len(previously_failed)} to retry")
+        else:
+            completed = set()
+            self.frontier.reset(start_id, end_id)
         
-        for session_id in range(start_id, end_id + 1):
-            try:
-                url = f"{self.base_url}?thisID={session_id}"
-                logger.info(f"Crawling session {session_id}/{end_id}: {url}")
-                
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                
-                # Parse the HTML content
-                session_data = self.parser.parse_session_html(response.text)
+        pending_ids = [session_id for session_id in range(start_id, end_id + 1) if session_id not in completed]
+        
+        logger.info(f"Starting crawl of {len(pending_ids)} sessions in {start_id} to {end_id} "
+                    f"(concurrency={self.engine.concurrency}, rate limit={self.rate_limit}/s{' adaptive' if self.adaptive else ''})")
+        
+        def handle_parsed(fetched, session_data, error):
+            nonlocal processed
+            session_id = fetched['id']
+            url = fetched['url']
+            processed += 1
+            
+            if fetched['error']:
+                logger.error(f"Request failed for session {session_id}: {error}")
+                failed_ids.append(session_id)
+            elif error:
+                logger.error(f"Unexpected error processing session {session_id}: {error}")
+                failed_ids.append(session_id)
+            else:
+                logger.info(f"Crawled session {session_id}/{end_id}: {url}")
                 session_data['session_id'] = session_id
                 session_data['source_url'] = url
                 
-                results.append(session_data)
-                
-                # Add delay between requests
-                if delay > 0:
-                    time.sleep(delay)
-                    
-            except requests.RequestException as e:
-                logger.error(f"Request failed for session {session_id}: {e}")
-                failed_ids.append(session_id)
-                
-            except Exception as e:
-                logger.error(f"Unexpected error processing session {session_id}: {e}")
-                failed_ids.append(session_id)
+                if 'error' in session_data:
+                    failed_ids.append(session_id)
+                elif self.stream:
+                    self._stream_record(session_data)
+            
+            self.frontier.record_outcome(session_id, url, http_status=fetched['status'],
+                                         content_hash=fetched['content_hash'], record=session_data, error=error)
             
             # Progress update every 50 sessions
-            if session_id % 50 == 0:
-                logger.info(f"Progress: {session_id}/{end_id} sessions processed")
+            if processed % 50 == 0:
+                logger.info(f"Progress: {processed}/{len(pending_ids)} sessions processed, "
+                            f"current rate {self.engine.get_stats()['host_rates']}")
+        
+        urls = ((session_id, f"{self.base_url}?thisID={session_id}") for session_id in pending_ids)
+        if self.stream_files:
+            self._open_stream(append=resume)
+        try:
+            self.pipeline.run(self.engine, urls, handle_parsed)
+        finally:
+            if self.stream:
+                self._close_stream()
+        failed_ids.sort()
         
         if failed_ids:
             logger.warning(f"Failed to process {len(failed_ids)} sessions: {failed_ids[:10]}{'...' if len(failed_ids) > 10 else ''}")
+            logger.warning("Re-run with --resume to retry only the failed sessions")
+        
+        if self.stream_files:
+            # Records are already on disk; don't rebuild them in memory
+            self.crawled_data = []
+            return []
+        
+        # The frontier holds this run's records plus any completed before a resume,
+        # already ordered by ID
+        results = list(self.frontier.records(start_id, end_id))
         
         self.crawled_data = results
         return results
@@ -97,100 +345,13 @@ class IDWeek2025SessionCrawler:
             logger.warning("No data to save")
             return
         
-        def sanitize_csv_field(value):
-            """Clean field values to prevent CSV formatting issues"""
-            if not isinstance(value, str):
-                return value
-            # Replace newlines with semicolons, clean up whitespace
-            return value.replace('\n', '; ').replace('\r', '').strip()
-        
         # Flatten the nested data structure for CSV
-        flattened_data = []
-        for session in self.crawled_data:
-            if 'error' in session:
-                continue
-                
-            # Basic session info
-            flat_record = {
-                'session_id': session.get('session_id', ''),
-                'source_url': session.get('source_url', ''),
-                'primary_track': sanitize_csv_field(session.get('tracks', {}).get('primary_track', '')),
-                'all_tracks': '; '.join(session.get('tracks', {}).get('all_tracks', [])),
-                'track_count': session.get('tracks', {}).get('track_count', 0),
-                'session_type': sanitize_csv_field(session.get('session_info', {}).get('type', '')),
-                'session_number': sanitize_csv_field(session.get('session_info', {}).get('number', '')),
-                'session_title': sanitize_csv_field(session.get('session_info', {}).get('title', '')),
-                'full_title': sanitize_csv_field(session.get('session_info', {}).get('full_title', '')),
-                'date': sanitize_csv_field(session.get('schedule', {}).get('date', '')),
-                'time': sanitize_csv_field(session.get('schedule', {}).get('time', '')),
-                'timezone': sanitize_csv_field(session.get('schedule', {}).get('timezone', '')),
-                'location': sanitize_csv_field(session.get('schedule', {}).get('location', '')),
-            }
-            
-            # Credit information
-            credits = session.get('credits', {})
-            flat_record.update({
-                'cme_hours': sanitize_csv_field(credits.get('cme_hours', '')),
-                'moc_hours': sanitize_csv_field(credits.get('moc_hours', '')),
-                'cne_hours': sanitize_csv_field(credits.get('cne_hours', '')),
-                'acpe_hours': sanitize_csv_field(credits.get('acpe_hours', '')),
-                'acpe_number': sanitize_csv_field(credits.get('acpe_number', '')),
-                'pace_hours': sanitize_csv_field(credits.get('pace_hours', '')),
-                'ce_broker_hours': sanitize_csv_field(credits.get('ce_broker_hours', '')),
-            })
-            
-            # Speaker information
-            speakers = session.get('speakers', [])
-            if speakers:
-                # Primary speaker
-                primary_speaker = speakers[0]
-                flat_record.update({
-                    'primary_speaker_name': sanitize_csv_field(primary_speaker.get('name', '')),
-                    'primary_speaker_title': sanitize_csv_field(primary_speaker.get('title', '')),
-                    'primary_speaker_department': sanitize_csv_field(primary_speaker.get('department', '')),
-                    'primary_speaker_institution': sanitize_csv_field(primary_speaker.get('institution', '')),
-                    'primary_speaker_location': sanitize_csv_field(primary_speaker.get('location', '')),
-                })
-            
-            # Speaker counts and lists
-            flat_record['total_speakers'] = len(speakers)
-            flat_record['all_speakers'] = sanitize_csv_field('; '.join([s.get('name', '') for s in speakers]))
-            
-            # Disclosure information
-            disclosures = session.get('disclosures', [])
-            flat_record['disclosure_count'] = len(disclosures)
-            if disclosures:
-                disclosure_text = ' | '.join([f"{d.get('speaker', '')}: {d.get('disclosure', '')}" for d in disclosures])
-                flat_record['disclosures'] = sanitize_csv_field(disclosure_text)
-            else:
-                flat_record['disclosures'] = ''
-            
-            # Presentation information
-            presentations = session.get('presentations', [])
-            flat_record['presentation_count'] = len(presentations)
-            if presentations:
-                pres_titles = [p.get('title', '') for p in presentations]
-                flat_record['presentation_titles'] = sanitize_csv_field(' | '.join(pres_titles))
-                
-                pres_times = [p.get('time', '') for p in presentations]
-                flat_record['presentation_times'] = sanitize_csv_field(' | '.join(pres_times))
-                
-                pres_speakers = [p.get('speaker', {}).get('name', '') for p in presentations]
-                flat_record['presentation_speakers'] = sanitize_csv_field(' | '.join(pres_speakers))
-            else:
-                flat_record.update({
-                    'presentation_titles': '',
-                    'presentation_times': '',
-                    'presentation_speakers': ''
-                })
-            
-            flattened_data.append(flat_record)
+        flattened_data = [flatten_session(session) for session in self.crawled_data if 'error' not in session]
         
         # Write to CSV
         if flattened_data:
             with open(filename, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = flattened_data[0].keys()
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer = csv.DictWriter(f, fieldnames=SESSION_CSV_FIELDS, restval='')
                 writer.writeheader()
                 writer.writerows(flattened_data)
             
@@ -207,64 +368,121 @@ class IDWeek2025SessionCrawler:
         for session in self.crawled_data:
             if 'error' in session:
                 continue
-            
-            session_info = {
-                'session_id': session.get('session_id', ''),
-                'session_type': session.get('session_info', {}).get('type', ''),
-                'session_title': session.get('session_info', {}).get('title', ''),
-                'session_date': session.get('schedule', {}).get('date', ''),
-                'session_location': session.get('schedule', {}).get('location', ''),
-            }
-            
-            presentations = session.get('presentations', [])
-            for pres in presentations:
-                pres_record = session_info.copy()
-                pres_record.update({
-                    'presentation_id': pres.get('presentation_id', ''),
-                    'presentation_time': pres.get('time', ''),
-                    'presentation_title': pres.get('title', ''),
-                    'speaker_name': pres.get('speaker', {}).get('name', ''),
-                    'speaker_affiliation': pres.get('speaker', {}).get('affiliation', ''),
-                })
-                presentation_records.append(pres_record)
+            presentation_records.extend(session_presentation_rows(session))
         
         if presentation_records:
             with open(filename, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = presentation_records[0].keys()
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer = csv.DictWriter(f, fieldnames=PRESENTATION_CSV_FIELDS)
                 writer.writeheader()
                 writer.writerows(presentation_records)
             
             logger.info(f"Saved {len(presentation_records)} presentation records to {filename}")
     
+    def export_tables(self, formats: List[str], output_dir: str = '.', prefix: str = 'idweek2025'):
+        """
+        Write the sessions, presentations and speakers tables in each format (csv, parquet, xlsx)
+        
+        Builds Arrow tables from crawled_data in one pass (columnar_export),
+        so every format comes from the same in-memory tables.
+        """
+        if not self.crawled_data:
+            logger.warning("No data to save")
+            return
+        
+        # pyarrow is only needed for the columnar export
+        from columnar_export import session_tables, write_tables
+        write_tables(session_tables(self.crawled_data), output_dir, prefix, formats)
+    
+    def save_to_store(self, store_dir: str, conference: str = 'IDWEEK', year: int = 2025):
+        """
+        Write the sessions, presentations and speakers tables to the partitioned Parquet store
+        
+        Replaces this conference/year's partitions under store_dir (conference_store).
+        """
+        if not self.crawled_data:
+            logger.warning("No data to save")
+            return
+        
+        # pyarrow is only needed for the store
+        from columnar_export import session_tables
+        from conference_store import write_store
+        write_store(session_tables(self.crawled_data), conference, year, store_dir)
+    
     def get_stats(self):
         """Get crawling statistics"""
         parser_stats = self.parser.get_stats()
+        fetch_stats = self.engine.get_stats()
         return {
-            'total_crawled': len(self.crawled_data),
+            'total_crawled': self.records_streamed if self.stream_files else len(self.crawled_data),
             'successful_parses': parser_stats['parsed_count'],
-            'parse_errors': parser_stats['error_count']
+            'parse_errors': parser_stats['error_count'],
+            'failed_requests': fetch_stats['failed'],
+            'not_modified': fetch_stats['not_modified'],
+            'from_cache': fetch_stats['from_cache'],
+            'retries': fetch_stats['retries'],
+            'host_rates': fetch_stats['host_rates']
         }
 
 
 def main():
     """Main crawling function"""
     # Parse command line arguments
-    start_id = int(sys.argv[1]) if len(sys.argv) > 1 else 1
-    end_id = int(sys.argv[2]) if len(sys.argv) > 2 else 1013
-    delay = float(sys.argv[3]) if len(sys.argv) > 3 else 0.5
+    parser = argparse.ArgumentParser(description='Crawl IDWeek 2025 session pages')
+    parser.add_argument('start_id', type=int, nargs='?', default=1, help='Starting session ID')
+    parser.add_argument('end_id', type=int, nargs='?', default=1013, help='Ending session ID')
+    parser.add_argument('delay', type=float, nargs='?', default=None,
+                        help='Seconds between requests (old interface; same as --rate-limit 1/DELAY --fixed-rate)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Maximum requests in flight')
+    parser.add_argument('--rate-limit', type=float, default=10.0, help='Maximum requests per second to the host (0 = unlimited)')
+    parser.add_argument('--fixed-rate', action='store_true', help='Hold --rate-limit fixed instead of adapting to server responses')
+    parser.add_argument('--workers', type=int, default=None, help='Parser processes (default: one per core, 0 = parse inline)')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Raw HTML cache directory')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the raw HTML cache')
+    parser.add_argument('--offline', action='store_true', help='Replay pages from the raw HTML cache without network access')
+    parser.add_argument('--resume', action='store_true', help='Skip IDs already completed in the crawl frontier and retry failed ones')
+    parser.add_argument('--frontier', default=DEFAULT_FRONTIER_PATH, help='SQLite crawl frontier file')
+    parser.add_argument('--stream', action='store_true', help='Write JSONL/CSV as each record is parsed instead of at the end')
+    parser.add_argument('--formats', nargs='+', choices=['csv', 'parquet', 'xlsx'],
+                        help='Write table exports in these formats through Arrow instead of the row-by-row CSV writer')
+    parser.add_argument('--store', help='Also write the tables to the partitioned Parquet store in this directory')
+    args = parser.parse_args()
+    
+    if args.delay is not None:
+        # The old third positional argument: a fixed pause between request starts
+        args.rate_limit = 1.0 / args.delay if args.delay > 0 else 0
+        args.fixed_rate = True
+    
+    logger.info(f"Starting IDWeek 2025 session crawl: IDs {args.start_id}-{args.end_id} "
+                f"with concurrency {args.concurrency} at {args.rate_limit} req/s{' (offline)' if args.offline else ''}")
+    
+    if args.offline and args.no_cache:
+        parser.error('--offline needs the cache; drop --no-cache')
+    if args.stream and args.formats:
+        parser.error('--formats exports at the end of the crawl; drop --stream')
+    if args.stream and args.store:
+        parser.error('--store writes at the end of the crawl; drop --stream')
     
-    logger.info(f"Starting IDWeek 2025 session crawl: IDs {start_id}-{end_id} with {delay}s delay")
+    crawler = IDWeek2025SessionCrawler(concurrency=args.concurrency, rate_limit=args.rate_limit, adaptive=not args.fixed_rate,
+                                       workers=args.workers,
+                                       cache_dir=None if args.no_cache else args.cache_dir, offline=args.offline,
+                                       frontier_path=args.frontier)
     
-    crawler = IDWeek2025SessionCrawler()
+    if args.stream:
+        crawler.enable_streaming()
     
     # Crawl the data
-    results = crawler.crawl_session_range(start_id, end_id, delay)
+    results = crawler.crawl_session_range(args.start_id, args.end_id, resume=args.resume)
     
-    # Save results
-    crawler.save_to_json()
-    crawler.save_to_csv()
-    crawler.save_presentations_csv()
+    # Save results (already written as they arrived when streaming)
+    if not args.stream:
+        crawler.save_to_json()
+        if args.formats:
+            crawler.export_tables(args.formats)
+        else:
+            crawler.save_to_csv()
+            crawler.save_presentations_csv()
+        if args.store:
+            crawler.save_to_store(args.store)
     
     # Print statistics
     stats = crawler.get_stats()
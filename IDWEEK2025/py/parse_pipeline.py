@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+IDWeek 2025 Parse Pipeline
+Producer/consumer pipeline that decouples HTML parsing from fetching.
+Fetchers put raw pages on a bounded queue; a ProcessPoolExecutor of
+parser workers drains it, so network waits and lxml parsing overlap
+and parsing uses every core.
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from session_parser_fixed import SessionHTMLParserFixed
+from poster_html_parser import PosterHTMLParser
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Parser class and parse method for each page kind
+PAGE_PARSERS = {
+    'session': (SessionHTMLParserFixed, 'parse_session_html'),
+    'poster': (PosterHTMLParser, 'parse_poster_html'),
+}
+
+# One parser per page kind, created lazily inside each worker process
+_worker_parsers = {}
+
+
+def parse_page(kind: str, html_content: str) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """
+    Parse one page in a worker process
+
+    Returns:
+        Tuple of (parsed data, stats delta) where the delta holds the change
+        in the worker parser's parsed_count/error_count for this page
+    """
+    parser = _worker_parsers.get(kind)
+    if parser is None:
+        parser_class, _ = PAGE_PARSERS[kind]
+        parser = _worker_parsers[kind] = parser_class()
+
+    before = parser.get_stats()
+    data = getattr(parser, PAGE_PARSERS[kind][1])(html_content)
+    after = parser.get_stats()
+
+    return data, {key: after[key] - before[key] for key in after}
+
+
+def merge_parser_stats(parser, stats_delta: Dict[str, int]):
+    """Add a worker's stats delta to the main-process parser"""
+    parser.parsed_count += stats_delta.get('parsed_count', 0)
+    parser.error_count += stats_delta.get('error_count', 0)
+
+
+class ParsePipeline:
+    """Fetch -> bounded queue -> parser process pool"""
+
+    def __init__(self, kind: str, parser, workers: Optional[int] = None, queue_size: int = 64):
+        """
+        Args:
+            kind: Page kind, 'session' or 'poster'
+            parser: Main-process parser; worker stats are merged into it, and it
+                parses inline when workers is 0
+            workers: Number of parser processes (None = one per core, 0 = parse inline)
+            queue_size: Maximum number of fetched pages waiting to be parsed
+        """
+        if kind not in PAGE_PARSERS:
+            raise ValueError(f"Unknown page kind: {kind}")
+
+        self.kind = kind
+        self.parser = parser
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.queue_size = queue_size
+
+    def _parse_inline(self, html_content: str) -> Dict[str, Any]:
+        """Parse in this process with the main parser"""
+        return getattr(self.parser, PAGE_PARSERS[self.kind][1])(html_content)
+
+    async def _run(self, engine, items, handle_parsed, pool):
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+
+        failed = []
+
+        async def consumer():
+            while True:
+                fetched = await queue.get()
+                if fetched is None:
+                    break
+                if failed:
+                    # Keep draining so the fetchers never block on a full queue
+                    continue
+
+                data = None
+                error = fetched['error']
+                if not error:
+                    try:
+                        if pool:
+                            data, stats_delta = await loop.run_in_executor(pool, parse_page, self.kind, fetched['text'])
+                            merge_parser_stats(self.parser, stats_delta)
+                        else:
+                            data = self._parse_inline(fetched['text'])
+                    except Exception as e:
+                        error = str(e)
+
+                try:
+                    handle_parsed(fetched, data, error)
+                except Exception as e:
+                    # A failing handler (frontier, writer) fails the crawl instead of hanging it
+                    logger.error(f"Handling {self.kind} {fetched['id']} failed: {e}")
+                    failed.append(e)
+                    fetch_task.cancel()
+
+        # queue.put blocks when the queue is full, which throttles the fetchers
+        fetch_task = asyncio.create_task(engine.fetch_all(items, queue.put))
+
+        # Two consumers per worker keep the pool busy while results come back
+        consumers = [asyncio.create_task(consumer()) for _ in range(max(1, self.workers * 2))]
+
+        try:
+            await fetch_task
+        except asyncio.CancelledError:
+            if not failed:
+                raise
+
+        for _ in consumers:
+            await queue.put(None)
+        await asyncio.gather(*consumers)
+
+        if failed:
+            raise failed[0]
+
+    def run(self, engine, items: Iterable[Tuple[Any, str]], handle_parsed: Callable[[Dict[str, Any], Optional[Dict[str, Any]], Optional[str]], Any]):
+        """
+        Fetch items with the engine and parse them in the worker pool
+
+        Args:
+            engine: AsyncFetchEngine used for fetching
+            items: Iterable of (item_id, url) pairs
+            handle_parsed: Called in the main process as handle_parsed(fetched, data, error);
+                data is None and error is set when the fetch or parse failed.
+                If it raises, fetching stops and the exception is re-raised here.
+        """
+        if self.workers > 0:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                asyncio.run(self._run(engine, items, handle_parsed, pool))
+        else:
+            asyncio.run(self._run(engine, items, handle_parsed, None))
@@ -10,6 +10,20 @@ import re
 from typing import Dict, List, Optional, Any
 import logging
 
+from datetime_normalizer import normalize_schedule, split_timezone
+from xpath_registry import (
+    PAGE_TITLE,
+    POSTER_SESSION_NAME,
+    POSTER_SPEAKER_ITEMS,
+    POSTER_TIME,
+    POSTER_TIMEZONE,
+    POSTER_TRACK_NAMES,
+    SCHEDULE_DATE,
+    SCHEDULE_LOCATION,
+    SPEAKER_NAME,
+    SPEAKER_PROF_TEXT,
+)
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -61,7 +75,7 @@ class PosterHTMLParser:
         """Extract track information from trackname class"""
         try:
             # Track name is in span within p.trackname
-            track_elements = tree.xpath('//p[contains(@class, "trackname")]//span/text()')
+            track_elements = POSTER_TRACK_NAMES(tree)
             track_name = track_elements[0].strip() if track_elements else ""
             
             # Extract track code if present (e.g., "B4." at the beginning)
@@ -83,7 +97,7 @@ class PosterHTMLParser:
         """Extract session information from Poster Session paragraph"""
         try:
             # Session info is in the second <b> tag within a paragraph containing "Poster Session:"
-            session_elements = tree.xpath('//p[contains(text(), "Poster Session:")]/b[2]/text()')
+            session_elements = POSTER_SESSION_NAME(tree)
             session_type = session_elements[0].strip() if session_elements else ""
             
             return {
@@ -97,7 +111,7 @@ class PosterHTMLParser:
         """Extract presentation title and ID"""
         try:
             # Title is in h1 tag
-            title_elements = tree.xpath('//h1/text()')
+            title_elements = PAGE_TITLE(tree)
             title = title_elements[0].strip() if title_elements else ""
             
             # Extract poster ID from title (e.g., "(P-1533)")
@@ -121,33 +135,37 @@ class PosterHTMLParser:
         """Extract date, time, and location information"""
         try:
             # Date follows fa-calendar icon
-            date_elements = tree.xpath('//i[contains(@class, "fa-calendar")]/following-sibling::text()[1]')
+            date_elements = SCHEDULE_DATE(tree)
             date = date_elements[0].strip() if date_elements else ""
             
             # Time follows fa-clock-o icon
-            time_elements = tree.xpath('//i[contains(@class, "fa-clock-o")]/following-sibling::text()[1]')
+            time_elements = POSTER_TIME(tree)
             time_raw = time_elements[0].strip() if time_elements else ""
             
-            # Clean up time - remove "US ET" suffix if present
-            time = re.sub(r'\s*US ET\s*$', '', time_raw).strip()
-            timezone = "US ET" if "US ET" in time_raw else ""
+            # Time zone label follows the time in a <small>
+            time, timezone = split_timezone(time_raw)
+            timezone_elements = POSTER_TIMEZONE(tree)
+            if timezone_elements and timezone_elements[0].strip():
+                timezone = timezone_elements[0].strip()
             
             # Location follows fa-map-marker icon
-            location_elements = tree.xpath('//i[contains(@class, "fa-map-marker")]/following-sibling::text()[1]')
+            location_elements = SCHEDULE_LOCATION(tree)
             location_raw = location_elements[0].strip() if location_elements else ""
             
             # Clean up location - remove "Location: " prefix
             location = re.sub(r'^Location:\s*', '', location_raw).strip()
             
-            return {
+            schedule = {
                 'date': date,
                 'time': time,
                 'timezone': timezone,
                 'location': location
             }
+            schedule.update(normalize_schedule(date, time, timezone))
+            return schedule
         except Exception as e:
             logger.warning(f"Error extracting schedule info: {e}")
-            return {'date': '', 'time': '', 'timezone': '', 'location': ''}
+            return {'date': '', 'time': '', 'timezone': '', 'location': '', 'start_datetime': '', 'end_datetime': ''}
     
     def _extract_authors(self, tree) -> Dict[str, List[Dict[str, str]]]:
         """Extract author information from the speakers-wrap section"""
@@ -155,7 +173,7 @@ class PosterHTMLParser:
             authors = {'presenting': [], 'co_authors': []}
             
             # Get all child elements of the speakers-wrap ul
-            speaker_elements = tree.xpath('//ul[@class="speakers-wrap"]/*')
+            speaker_elements = POSTER_SPEAKER_ITEMS(tree)
             current_role = None
             
             for element in speaker_elements:
@@ -185,14 +203,14 @@ class PosterHTMLParser:
         """Parse individual author li element"""
         try:
             # Author name is in p.speaker-name within an a tag
-            name_elements = element.xpath('.//p[contains(@class, "speaker-name")]/text()')
+            name_elements = SPEAKER_NAME(element)
             name = name_elements[0].strip() if name_elements else ""
             
             # Presenter ID is in data-presenterid attribute
             presenter_id = element.get('data-presenterid', '')
             
             # Affiliation info is in p.prof-text - may span multiple text nodes due to <br/> tags
-            affiliation_elements = element.xpath('.//p[contains(@class, "prof-text")]//text()')
+            affiliation_elements = SPEAKER_PROF_TEXT(element)
             
             # Clean and join affiliation text
             affiliation_parts = []
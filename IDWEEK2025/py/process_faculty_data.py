@@ -8,7 +8,7 @@ import mysql.connector
 import json
 import logging
 from typing import Dict, List, Optional
-from faculty_html_parser import FacultyHTMLParser
+from faculty_html_parser import BACKENDS, FacultyHTMLParser
 import argparse
 from datetime import datetime
 
@@ -23,19 +23,179 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+FACULTY_COLUMNS = ['full_name', 'credentials', 'job_title', 'organization', 'photo_url',
+                   'email', 'disclosure_info', 'biography']
+POSTER_COLUMNS = ['poster_number', 'title', 'presentation_date', 'presentation_time', 'time_zone', 'url_reference']
+
+
+def multi_row_values(row_count: int, column_count: int) -> str:
+    """VALUES placeholder list for a multi-row INSERT, e.g. (%s, %s), (%s, %s)"""
+    row = '(' + ', '.join(['%s'] * column_count) + ')'
+    return ', '.join([row] * row_count)
+
+
+class FacultyBatchWriter:
+    """
+    Buffer parsed faculty and write them in bulk
+
+    Faculty updates, posters and faculty-poster relationships are collected
+    in memory and flushed as multi-row INSERT ... ON DUPLICATE KEY UPDATE /
+    INSERT IGNORE statements of up to batch_size rows, in one transaction
+    per flush, instead of one statement and commit per row.
+    """
+
+    def __init__(self, connection, batch_size: int = 500):
+        """
+        Args:
+            connection: Open MySQL connection
+            batch_size: Faculty records per flush, and rows per statement
+        """
+        self.connection = connection
+        self.batch_size = max(1, batch_size)
+        self.pending = []
+        self.stats = {
+            'flushes': 0,
+            'statements': 0,
+            'faculty_written': 0,
+            'posters_written': 0,
+            'relationships_created': 0
+        }
+
+    def add(self, faculty_id: int, parsed_data: Dict):
+        """Queue one parsed faculty record"""
+        self.pending.append((faculty_id, parsed_data))
+
+    def is_full(self) -> bool:
+        return len(self.pending) >= self.batch_size
+
+    def clear(self):
+        self.pending = []
+
+    def _chunks(self, rows: List) -> List[List]:
+        return [rows[i:i + self.batch_size] for i in range(0, len(rows), self.batch_size)]
+
+    def _build_rows(self):
+        """Faculty, poster and relationship rows for the pending records"""
+        faculty_rows = []
+        posters = {}
+        relationships = {}
+
+        for faculty_id, parsed_data in self.pending:
+            faculty_info = parsed_data['faculty']
+            faculty_rows.append(
+                (faculty_id,)
+                + tuple(faculty_info.get(column) for column in FACULTY_COLUMNS)
+                + (parsed_data['parsing_status'], parsed_data.get('parse_error'))
+            )
+
+            if parsed_data['parsing_status'] != 'parsed':
+                continue
+
+            for poster_data in parsed_data['posters']:
+                poster_id = poster_data.get('poster_id')
+                if not poster_id:
+                    continue
+                # Later records win, as with one-at-a-time upserts
+                posters[poster_id] = (poster_id,) + tuple(poster_data.get(column) for column in POSTER_COLUMNS)
+                relationships[(faculty_id, poster_id)] = (faculty_id, poster_id)
+
+        return faculty_rows, list(posters.values()), list(relationships.values())
+
+    def flush(self) -> Dict[str, int]:
+        """
+        Write all pending records in one transaction
+
+        Returns:
+            Counts written by this flush: faculty, posters, relationships
+
+        Raises:
+            mysql.connector.Error: the transaction is rolled back and the
+                pending records are kept, so the caller can retry them
+        """
+        counts = {'faculty': 0, 'posters': 0, 'relationships': 0}
+        if not self.pending:
+            return counts
+
+        faculty_rows, poster_rows, relationship_rows = self._build_rows()
+        cursor = self.connection.cursor()
+
+        try:
+            # Every id comes from IDWEEK_Faculty_2025, so this only ever takes the UPDATE branch
+            faculty_updates = ', '.join(f"{column} = VALUES({column})" for column in FACULTY_COLUMNS)
+            for chunk in self._chunks(faculty_rows):
+                cursor.execute(f"""
+                    INSERT INTO IDWEEK_Faculty_2025
+                    (id, {', '.join(FACULTY_COLUMNS)}, parsing_status, parse_error_msg)
+                    VALUES {multi_row_values(len(chunk), len(FACULTY_COLUMNS) + 3)}
+                    ON DUPLICATE KEY UPDATE
+                        {faculty_updates},
+                        parsing_status = VALUES(parsing_status),
+                        parse_error_msg = VALUES(parse_error_msg),
+                        dlm = NOW()
+                """, [value for row in chunk for value in row])
+                self.stats['statements'] += 1
+            counts['faculty'] = len(faculty_rows)
+
+            poster_updates = ', '.join(f"{column} = VALUES({column})" for column in POSTER_COLUMNS)
+            for chunk in self._chunks(poster_rows):
+                cursor.execute(f"""
+                    INSERT INTO IDWEEK_Posters_2025
+                    (poster_id, {', '.join(POSTER_COLUMNS)})
+                    VALUES {multi_row_values(len(chunk), len(POSTER_COLUMNS) + 1)}
+                    ON DUPLICATE KEY UPDATE
+                        {poster_updates},
+                        dlm = NOW()
+                """, [value for row in chunk for value in row])
+                self.stats['statements'] += 1
+            counts['posters'] = len(poster_rows)
+
+            for chunk in self._chunks(relationship_rows):
+                cursor.execute(f"""
+                    INSERT IGNORE INTO IDWEEK_Faculty_Posters_2025
+                    (faculty_id, poster_id, role)
+                    VALUES {', '.join(["(%s, %s, 'presenter')"] * len(chunk))}
+                """, [value for row in chunk for value in row])
+                counts['relationships'] += cursor.rowcount
+                self.stats['statements'] += 1
+
+            self.connection.commit()
+
+        except mysql.connector.Error:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        self.stats['flushes'] += 1
+        self.stats['faculty_written'] += counts['faculty']
+        self.stats['posters_written'] += counts['posters']
+        self.stats['relationships_created'] += counts['relationships']
+        self.clear()
+        return counts
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get writer statistics"""
+        return dict(self.stats)
+
+
 class FacultyDataProcessor:
     """Process faculty HTML data and populate normalized database structure"""
     
-    def __init__(self, db_config: Dict):
+    def __init__(self, db_config: Dict, batch_size: int = 500, parser_backend: str = 'bs4'):
         """
         Initialize with database configuration
         
         Args:
             db_config: Dictionary with database connection parameters
+            batch_size: Faculty records written per bulk flush (0 = write and commit each record on its own)
+            parser_backend: FacultyHTMLParser backend, 'bs4' (default) or 'lxml'; lxml stays
+                opt-in until benchmark_faculty_html_parser.py shows no diffs on raw_data
         """
         self.db_config = db_config
-        self.parser = FacultyHTMLParser()
+        self.batch_size = batch_size
+        self.parser = FacultyHTMLParser(backend=parser_backend)
         self.connection = None
+        self.writer = None
         self.stats = {
             'processed': 0,
             'parsed_successfully': 0,
@@ -91,9 +251,16 @@ class FacultyDataProcessor:
             
             logger.info(f"Found {len(faculty_records)} faculty records to process")
             
+            if self.batch_size > 0:
+                self.writer = FacultyBatchWriter(self.connection, self.batch_size)
+            
             for record in faculty_records:
                 self.process_single_faculty(record)
             
+            if self.writer:
+                self.flush_batch()
+                logger.info(f"Bulk writer: {self.writer.get_stats()}")
+            
             cursor.close()
             self.print_statistics()
             
@@ -120,16 +287,15 @@ class FacultyDataProcessor:
             # Parse the HTML data
             parsed_data = self.parser.parse_faculty_data(raw_data, faculty_id)
             
-            # Update faculty table with parsed data
-            self.update_faculty_record(faculty_id, parsed_data)
+            if self.writer:
+                # Queue for the next bulk flush
+                self.writer.add(faculty_id, parsed_data)
+                if self.writer.is_full():
+                    self.flush_batch()
+            else:
+                self.write_faculty(faculty_id, parsed_data)
             
-            # Process posters if parsing was successful
             if parsed_data['parsing_status'] == 'parsed':
-                for poster_data in parsed_data['posters']:
-                    poster_id = self.create_or_update_poster(poster_data)
-                    if poster_id:
-                        self.create_faculty_poster_relationship(faculty_id, poster_id)
-                
                 self.stats['parsed_successfully'] += 1
             else:
                 self.stats['parse_errors'] += 1
@@ -146,6 +312,46 @@ class FacultyDataProcessor:
             # Mark as error in database
             self.mark_faculty_error(faculty_id, str(e))
     
+    def write_faculty(self, faculty_id: int, parsed_data: Dict):
+        """Write one parsed faculty record, its posters and relationships (one statement and commit each)"""
+        # Update faculty table with parsed data
+        self.update_faculty_record(faculty_id, parsed_data)
+        
+        # Process posters if parsing was successful
+        if parsed_data['parsing_status'] == 'parsed':
+            for poster_data in parsed_data['posters']:
+                poster_id = self.create_or_update_poster(poster_data)
+                if poster_id:
+                    self.create_faculty_poster_relationship(faculty_id, poster_id)
+    
+    def flush_batch(self):
+        """
+        Flush the bulk writer
+        
+        If the bulk transaction fails, it is rolled back and the batch is
+        replayed one record at a time, so a single bad row only fails itself.
+        """
+        pending = list(self.writer.pending)
+        
+        try:
+            counts = self.writer.flush()
+            self.stats['posters_created'] += counts['posters']
+            self.stats['relationships_created'] += counts['relationships']
+            logger.info(f"Flushed {counts['faculty']} faculty, {counts['posters']} posters, "
+                        f"{counts['relationships']} new relationships")
+            
+        except mysql.connector.Error as e:
+            logger.error(f"Bulk write of {len(pending)} records failed ({e}), retrying one at a time")
+            self.writer.clear()
+            
+            for faculty_id, parsed_data in pending:
+                try:
+                    self.write_faculty(faculty_id, parsed_data)
+                except Exception as record_error:
+                    logger.error(f"Error processing faculty {faculty_id}: {record_error}")
+                    self.stats['db_errors'] += 1
+                    self.mark_faculty_error(faculty_id, str(record_error))
+    
     def update_faculty_record(self, faculty_id: int, parsed_data: Dict):
         """Update faculty record with parsed data"""
         cursor = self.connection.cursor()
@@ -339,6 +545,11 @@ def main():
     parser.add_argument('--limit', type=int, help='Limit number of records to process')
     parser.add_argument('--offset', type=int, default=0, help='Offset for record processing')
     parser.add_argument('--summary', action='store_true', help='Show processing summary only')
+    parser.add_argument('--batch-size', type=int, default=500,
+                        help='Records per bulk write (0 = write and commit each record individually)')
+    parser.add_argument('--parser', choices=BACKENDS, default='bs4',
+                        help='HTML parser backend (lxml is faster; keep bs4 until benchmark_faculty_html_parser.py '
+                             'shows no differences on the raw_data corpus)')
     
     args = parser.parse_args()
     
@@ -350,7 +561,7 @@ def main():
         'port': args.port
     }
     
-    processor = FacultyDataProcessor(db_config)
+    processor = FacultyDataProcessor(db_config, batch_size=args.batch_size, parser_backend=args.parser)
     
     if args.summary:
         processor.get_processing_summary()
@@ -9,10 +9,40 @@ import re
 from typing import Dict, List, Optional, Any
 import logging
 
+from datetime_normalizer import normalize_schedule, split_timezone
+from xpath_registry import (
+    PAGE_TITLE,
+    PRESENTATION_BIO_NAMES,
+    PRESENTATION_PRESENTERS,
+    PRESENTATION_TIME,
+    PRESENTATION_TITLE,
+    SCHEDULE_DATE,
+    SCHEDULE_LOCATION,
+    SESSION_CREDIT_BLOCKS,
+    SESSION_DISCLOSURE_BLOCKS,
+    SESSION_PRESENTATIONS,
+    SESSION_SPEAKER_ITEMS,
+    SESSION_TIME,
+    SESSION_TIMEZONE,
+    SESSION_TRACK_NAMES,
+    SESSION_TYPE_TEXT,
+    SPEAKERS_WRAP,
+    SPEAKER_NAME,
+    SPEAKER_PROF_TEXT,
+)
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Presentation markup, parsed from the raw page HTML
+PRESID_ATTR_RE = re.compile(r'data-presid=["\']?([^"\'\s>]*)["\']?[^>]*>')
+PRESENTERS_RE = re.compile(r'<small[^>]*class=["\']presentation-presenters["\'][^>]*>(.*?)</small>', re.DOTALL)
+PARAGRAPH_RE = re.compile(r'<p[^>]*>(.*?)</p>', re.DOTALL)
+ROLE_RE = re.compile(r'^([^:]+):\s*')
+BIOPOPUP_RE = re.compile(r'<span[^>]*class=["\']biopopup["\'][^>]*>(.*?)</span>')
+TAG_RE = re.compile(r'<[^>]+>')
+
 
 class SessionHTMLParserFixed:
     """Fixed parser for IDWeek 2025 session HTML content"""
@@ -28,14 +58,15 @@ class SessionHTMLParserFixed:
             # Store original HTML content for manual parsing when needed
             self.original_html = html_content
             
+            schedule = self._extract_schedule_info(tree)
             session_data = {
                 'tracks': self._extract_tracks(tree),
                 'session_info': self._extract_session_info(tree),
-                'schedule': self._extract_schedule_info(tree),
+                'schedule': schedule,
                 'credits': self._extract_credit_info(tree),
                 'speakers': self._extract_speakers(tree),
                 'disclosures': self._extract_disclosures(tree),
-                'presentations': self._extract_presentations(tree)
+                'presentations': self._extract_presentations(tree, schedule)
             }
             
             self.parsed_count += 1
@@ -55,7 +86,7 @@ class SessionHTMLParserFixed:
         """Extract track information - sessions have multiple tracks"""
         try:
             # Tracks are in p.trackname elements
-            track_elements = tree.xpath('//p[contains(@class, "trackname")]/text()')
+            track_elements = SESSION_TRACK_NAMES(tree)
             tracks = [track.strip() for track in track_elements if track.strip()]
             
             # Remove duplicates while preserving order
@@ -80,12 +111,12 @@ class SessionHTMLParserFixed:
         try:
             # Session type from div containing "Session Type:"
             session_type = ""
-            type_divs = tree.xpath('//div[contains(text(), "Session Type:")]/text()')
+            type_divs = SESSION_TYPE_TEXT(tree)
             if type_divs:
                 session_type = type_divs[0].replace("Session Type: ", "").strip()
             
             # Session title from h1
-            title_elements = tree.xpath('//h1/text()')
+            title_elements = PAGE_TITLE(tree)
             full_title = title_elements[0].strip() if title_elements else ""
             
             # Parse session number and clean title
@@ -111,44 +142,41 @@ class SessionHTMLParserFixed:
         """Extract schedule information"""
         try:
             # Date after fa-calendar icon
-            date_elements = tree.xpath('//i[contains(@class, "fa-calendar")]/following-sibling::text()[1]')
+            date_elements = SCHEDULE_DATE(tree)
             date = date_elements[0].strip() if date_elements else ""
             
             # Time from span with tipsytip class after fa-clock-o
-            time_elements = tree.xpath('//i[contains(@class, "fa-clock-o")]/following-sibling::span[@class="tipsytip"]/text()')
+            time_elements = SESSION_TIME(tree)
             time_raw = time_elements[0].strip() if time_elements else ""
             
-            # Parse time and timezone
-            time = time_raw
-            timezone = ""
-            if time_raw:
-                # Remove <small>US ET</small> part
-                time_match = re.search(r'^([^<]+)', time_raw)
-                if time_match:
-                    time = time_match.group(1).strip()
-                if "US ET" in time_raw:
-                    timezone = "US ET"
+            # Time zone is in a <small> inside the same span ("8:00 AM - 12:00 PM <small>US ET</small>")
+            time, timezone = split_timezone(time_raw)
+            timezone_elements = SESSION_TIMEZONE(tree)
+            if timezone_elements and timezone_elements[0].strip():
+                timezone = timezone_elements[0].strip()
             
             # Location after fa-map-marker
-            location_elements = tree.xpath('//i[contains(@class, "fa-map-marker")]/following-sibling::text()[1]')
+            location_elements = SCHEDULE_LOCATION(tree)
             location_raw = location_elements[0].strip() if location_elements else ""
             location = location_raw.replace("Location: ", "").strip()
             
-            return {
+            schedule = {
                 'date': date,
                 'time': time,
                 'timezone': timezone,
                 'location': location
             }
+            schedule.update(normalize_schedule(date, time, timezone))
+            return schedule
         except Exception as e:
             logger.warning(f"Error extracting schedule: {e}")
-            return {'date': '', 'time': '', 'timezone': '', 'location': ''}
+            return {'date': '', 'time': '', 'timezone': '', 'location': '', 'start_datetime': '', 'end_datetime': ''}
     
     def _extract_credit_info(self, tree) -> Dict[str, str]:
         """Extract CME credit information"""
         try:
             # Credits in div.mar-top
-            credit_elements = tree.xpath('//div[@class="mar-top"]')
+            credit_elements = SESSION_CREDIT_BLOCKS(tree)
             if not credit_elements:
                 return {}
             
@@ -187,14 +215,14 @@ class SessionHTMLParserFixed:
             speakers_by_role = {}
             
             # Find all speaker sections with role titles
-            speakers_wrap = tree.xpath('//ul[@class="speakers-wrap"]')
+            speakers_wrap = SPEAKERS_WRAP(tree)
             if not speakers_wrap:
                 return {}
             
             speakers_wrap = speakers_wrap[0]
             
             # Get all elements in the speakers wrap (both role titles and speaker rows)
-            all_elements = speakers_wrap.xpath('.//*[self::h2[@class="role-title"] or self::li[@class="speakerrow"]]')
+            all_elements = SESSION_SPEAKER_ITEMS(speakers_wrap)
             
             current_role = "speakers"  # default role
             
@@ -207,14 +235,14 @@ class SessionHTMLParserFixed:
                     # This is a speaker row
                     try:
                         # Speaker name
-                        name_elements = element.xpath('.//p[contains(@class, "speaker-name")]/text()')
+                        name_elements = SPEAKER_NAME(element)
                         name = name_elements[0].strip() if name_elements else ""
                         
                         # Presenter ID
                         presenter_id = element.get('data-presenterid', '')
                         
                         # Professional info
-                        prof_elements = element.xpath('.//p[contains(@class, "prof-text")]//text()')
+                        prof_elements = SPEAKER_PROF_TEXT(element)
                         prof_parts = [text.strip() for text in prof_elements if text.strip()]
                         
                         # Parse affiliation components
@@ -266,7 +294,7 @@ class SessionHTMLParserFixed:
             disclosures = []
             
             # Disclosure blocks
-            disclosure_elements = tree.xpath('//div[@class="presentation-disclosure-block"]')
+            disclosure_elements = SESSION_DISCLOSURE_BLOCKS(tree)
             
             for element in disclosure_elements:
                 text = element.text_content().strip()
@@ -295,13 +323,21 @@ class SessionHTMLParserFixed:
             logger.warning(f"Error extracting disclosures: {e}")
             return []
     
-    def _extract_presentations(self, tree) -> List[Dict[str, Any]]:
-        """Extract presentation information with multiple speakers support"""
+    def _extract_presentations(self, tree, schedule: Dict[str, str]) -> List[Dict[str, Any]]:
+        """
+        Extract presentation information with multiple speakers support
+        
+        Args:
+            tree: Parsed session page
+            schedule: The page's _extract_schedule_info result (session day and
+                time zone, for the presentation datetimes)
+        """
         try:
             presentations = []
             
             # Presentation li elements
-            pres_elements = tree.xpath('//ul[contains(@class, "list-group")]//li[contains(@class, "list-group-item")]')
+            pres_elements = SESSION_PRESENTATIONS(tree)
+            pres_segments = self._index_presentation_html(getattr(self, 'original_html', ''))
             
             for element in pres_elements:
                 try:
@@ -309,95 +345,27 @@ class SessionHTMLParserFixed:
                     pres_id = element.get('data-presid', '')
                     
                     # Time
-                    time_elements = element.xpath('.//span[@class="tipsytip"][contains(text(), "AM") or contains(text(), "PM")]/text()')
+                    time_elements = PRESENTATION_TIME(element)
                     time_raw = time_elements[0].strip() if time_elements else ""
-                    time = re.sub(r'\s*US ET\s*$', '', time_raw).strip()
+                    time, timezone = split_timezone(time_raw)
                     
                     # Title (first text node in prestitle div)
-                    title_elements = element.xpath('.//div[contains(@class, "prestitle")]/text()[1]')
+                    title_elements = PRESENTATION_TITLE(element)
                     title = title_elements[0].strip() if title_elements else ""
                     
                     # Extract all speakers from presentation-presenters section
                     speakers = []
-                    presenter_elements = element.xpath('.//small[@class="presentation-presenters"]')
+                    presenter_elements = PRESENTATION_PRESENTERS(element)
                     
                     if presenter_elements:
-                        # Extract presentation ID to find the correct section in original HTML
-                        pres_id = element.get('data-presid', '')
-                        
-                        # Find the presentation section in original HTML using regex
-                        pres_pattern = rf'data-presid=["\']?{re.escape(pres_id)}["\']?[^>]*>.*?</li>'
-                        pres_match = re.search(pres_pattern, getattr(self, 'original_html', ''), re.DOTALL)
-                        
-                        if pres_match:
-                            pres_html = pres_match.group(0)
-                            
-                            # Extract <p> tags from presentation-presenters section
-                            presenters_pattern = r'<small[^>]*class=["\']presentation-presenters["\'][^>]*>(.*?)</small>'
-                            presenters_match = re.search(presenters_pattern, pres_html, re.DOTALL)
-                            
-                            if presenters_match:
-                                presenters_content = presenters_match.group(1)
-                                p_pattern = r'<p[^>]*>(.*?)</p>'
-                                p_matches = re.findall(p_pattern, presenters_content, re.DOTALL)
-                                
-                                for p_content in p_matches:
-                                    if not p_content.strip():
-                                        continue
-                                        
-                                    # Parse the paragraph content
-                                    # Extract role (Speaker, Workshop Moderator, etc.)
-                                    role = ""
-                                    name = ""
-                                    affiliation = ""
-                                    
-                                    # Look for role pattern like "Speaker:" or "Workshop Moderator:"
-                                    role_match = re.match(r'^([^:]+):\s*', p_content)
-                                    if role_match:
-                                        role = role_match.group(1).strip()
-                                        remaining_text = p_content[role_match.end():].strip()
-                                    else:
-                                        remaining_text = p_content
-                                    
-                                    # Extract name from biopopup span
-                                    biopopup_match = re.search(r'<span[^>]*class=["\']biopopup["\'][^>]*>(.*?)</span>', remaining_text)
-                                    if biopopup_match:
-                                        name = biopopup_match.group(1).strip()
-                                        # Extract affiliation (everything after the em dash)
-                                        if '&ndash;' in remaining_text:
-                                            affiliation = remaining_text.split('&ndash;', 1)[1].strip()
-                                            # Clean HTML tags from affiliation
-                                            affiliation = re.sub(r'<[^>]+>', '', affiliation).strip()
-                                        elif '–' in remaining_text:
-                                            affiliation = remaining_text.split('–', 1)[1].strip()
-                                            affiliation = re.sub(r'<[^>]+>', '', affiliation).strip()
-                                        elif ' - ' in remaining_text:
-                                            affiliation = remaining_text.split(' - ', 1)[1].strip()
-                                            affiliation = re.sub(r'<[^>]+>', '', affiliation).strip()
-                                    else:
-                                        # Fallback: try to parse name from plain text
-                                        clean_text = re.sub(r'<[^>]+>', '', remaining_text)
-                                        if '–' in clean_text:
-                                            parts = clean_text.split('–', 1)
-                                            name = parts[0].strip()
-                                            affiliation = parts[1].strip()
-                                        elif ' - ' in clean_text:
-                                            parts = clean_text.split(' - ', 1)
-                                            name = parts[0].strip()
-                                            affiliation = parts[1].strip()
-                                        else:
-                                            name = clean_text.strip()
-                                    
-                                    if name:  # Only add if we found a name
-                                        speakers.append({
-                                            'name': name,
-                                            'role': role,
-                                            'affiliation': affiliation
-                                        })
+                        # Raw HTML of this presentation, from the one-pass index of the page
+                        pres_html = pres_segments.get(pres_id)
+                        if pres_html is not None:
+                            speakers = self._parse_presenters_html(pres_html)
                     
                     # If no speakers found in structured format, fall back to old method
                     if not speakers:
-                        speaker_name_elements = element.xpath('.//span[@class="biopopup"]/text()')
+                        speaker_name_elements = PRESENTATION_BIO_NAMES(element)
                         speaker_name = speaker_name_elements[0].strip() if speaker_name_elements else ""
                         
                         affiliation = ""
@@ -415,13 +383,15 @@ class SessionHTMLParserFixed:
                                 'affiliation': affiliation
                             })
                     
-                    presentations.append({
+                    presentation = {
                         'presentation_id': pres_id,
                         'time': time,
                         'title': title,
                         'speakers': speakers,
                         'speaker_count': len(speakers)
-                    })
+                    }
+                    presentation.update(normalize_schedule(schedule['date'], time, timezone or schedule['timezone']))
+                    presentations.append(presentation)
                     
                 except Exception as pres_error:
                     logger.warning(f"Error parsing presentation: {pres_error}")
@@ -433,6 +403,85 @@ class SessionHTMLParserFixed:
             logger.warning(f"Error extracting presentations: {e}")
             return []
     
+    def _index_presentation_html(self, page_html: str) -> Dict[str, str]:
+        """
+        Raw HTML of every presentation, keyed by data-presid, in one pass over the page
+        
+        Each segment runs from the data-presid attribute to the first </li> after
+        its tag, so presenters are parsed from their own presentation's markup
+        without searching the whole page again for every presentation.
+        """
+        segments = {}
+        for match in PRESID_ATTR_RE.finditer(page_html):
+            end = page_html.find('</li>', match.end())
+            if end != -1:
+                segments.setdefault(match.group(1), page_html[match.start():end + len('</li>')])
+        return segments
+    
+    def _parse_presenters_html(self, pres_html: str) -> List[Dict[str, str]]:
+        """Speakers with role and affiliation from a presentation's presentation-presenters markup"""
+        speakers = []
+        
+        presenters_match = PRESENTERS_RE.search(pres_html)
+        if presenters_match:
+            p_matches = PARAGRAPH_RE.findall(presenters_match.group(1))
+            
+            for p_content in p_matches:
+                if not p_content.strip():
+                    continue
+                
+                # Parse the paragraph content
+                # Extract role (Speaker, Workshop Moderator, etc.)
+                role = ""
+                name = ""
+                affiliation = ""
+                
+                # Look for role pattern like "Speaker:" or "Workshop Moderator:"
+                role_match = ROLE_RE.match(p_content)
+                if role_match:
+                    role = role_match.group(1).strip()
+                    remaining_text = p_content[role_match.end():].strip()
+                else:
+                    remaining_text = p_content
+                
+                # Extract name from biopopup span
+                biopopup_match = BIOPOPUP_RE.search(remaining_text)
+                if biopopup_match:
+                    name = biopopup_match.group(1).strip()
+                    # Extract affiliation (everything after the em dash)
+                    if '&ndash;' in remaining_text:
+                        affiliation = remaining_text.split('&ndash;', 1)[1].strip()
+                        # Clean HTML tags from affiliation
+                        affiliation = TAG_RE.sub('', affiliation).strip()
+                    elif '–' in remaining_text:
+                        affiliation = remaining_text.split('–', 1)[1].strip()
+                        affiliation = TAG_RE.sub('', affiliation).strip()
+                    elif ' - ' in remaining_text:
+                        affiliation = remaining_text.split(' - ', 1)[1].strip()
+                        affiliation = TAG_RE.sub('', affiliation).strip()
+                else:
+                    # Fallback: try to parse name from plain text
+                    clean_text = TAG_RE.sub('', remaining_text)
+                    if '–' in clean_text:
+                        parts = clean_text.split('–', 1)
+                        name = parts[0].strip()
+                        affiliation = parts[1].strip()
+                    elif ' - ' in clean_text:
+                        parts = clean_text.split(' - ', 1)
+                        name = parts[0].strip()
+                        affiliation = parts[1].strip()
+                    else:
+                        name = clean_text.strip()
+                
+                if name:  # Only add if we found a name
+                    speakers.append({
+                        'name': name,
+                        'role': role,
+                        'affiliation': affiliation
+                    })
+        
+        return speakers
+    
     def get_stats(self) -> Dict[str, int]:
         """Get parsing statistics"""
         return {
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Streaming Output Writers
+Append-as-you-go JSONL and CSV writers for the crawlers. Each record is
+written and flushed as soon as it is parsed, so memory stays flat and the
+partial output is readable while a crawl is still running.
+"""
+
+import csv
+import json
+import os
+from typing import Any, Dict, Iterable, List
+
+
+class JSONLWriter:
+    """Write one JSON document per line"""
+
+    def __init__(self, filename: str, append: bool = False):
+        self.filename = filename
+        self.count = 0
+        self.file = open(filename, 'a' if append else 'w', encoding='utf-8')
+
+    def write(self, record: Dict[str, Any]):
+        """Write and flush one record"""
+        self.file.write(json.dumps(record, ensure_ascii=False))
+        self.file.write('\n')
+        self.file.flush()
+        self.count += 1
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class CSVStreamWriter:
+    """CSV writer with a fixed header, written once per file"""
+
+    def __init__(self, filename: str, fieldnames: List[str], append: bool = False):
+        self.filename = filename
+        self.count = 0
+
+        # Only write the header when starting a new (or empty) file
+        write_header = not (append and os.path.exists(filename) and os.path.getsize(filename) > 0)
+
+        self.file = open(filename, 'a' if append else 'w', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=fieldnames, restval='', extrasaction='ignore')
+        if write_header:
+            self.writer.writeheader()
+            self.file.flush()
+
+    def write(self, row: Dict[str, Any]):
+        """Write and flush one row"""
+        self.writer.writerow(row)
+        self.file.flush()
+        self.count += 1
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]):
+        """Write and flush several rows"""
+        for row in rows:
+            self.writer.writerow(row)
+            self.count += 1
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
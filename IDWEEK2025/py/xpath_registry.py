@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+IDWeek 2025 XPath Registry
+XPath expressions used by SessionHTMLParserFixed, PosterHTMLParser, the
+listing stream parser and FacultyHTMLParser's lxml backend, compiled once at import time instead of on every tree.xpath('...') call.
+Each constant is an lxml.etree.XPath; call it with the tree or element the
+expression was written against, e.g. SESSION_TRACK_NAMES(tree).
+"""
+
+from lxml import etree
+
+# Shared by both parsers
+PAGE_TITLE = etree.XPath('//h1/text()')
+SCHEDULE_DATE = etree.XPath('//i[contains(@class, "fa-calendar")]/following-sibling::text()[1]')
+SCHEDULE_LOCATION = etree.XPath('//i[contains(@class, "fa-map-marker")]/following-sibling::text()[1]')
+SPEAKERS_WRAP = etree.XPath('//ul[@class="speakers-wrap"]')
+
+# Relative to a speaker row (li.speakerrow / a speakers-wrap child)
+SPEAKER_NAME = etree.XPath('.//p[contains(@class, "speaker-name")]/text()')
+SPEAKER_PROF_TEXT = etree.XPath('.//p[contains(@class, "prof-text")]//text()')
+
+# SessionHTMLParserFixed
+SESSION_TRACK_NAMES = etree.XPath('//p[contains(@class, "trackname")]/text()')
+SESSION_TYPE_TEXT = etree.XPath('//div[contains(text(), "Session Type:")]/text()')
+SESSION_TIME = etree.XPath('//i[contains(@class, "fa-clock-o")]/following-sibling::span[@class="tipsytip"]/text()')
+SESSION_TIMEZONE = etree.XPath('//i[contains(@class, "fa-clock-o")]/following-sibling::span[@class="tipsytip"]/small/text()')
+SESSION_CREDIT_BLOCKS = etree.XPath('//div[@class="mar-top"]')
+SESSION_SPEAKER_ITEMS = etree.XPath('.//*[self::h2[@class="role-title"] or self::li[@class="speakerrow"]]')
+SESSION_DISCLOSURE_BLOCKS = etree.XPath('//div[@class="presentation-disclosure-block"]')
+SESSION_PRESENTATIONS = etree.XPath('//ul[contains(@class, "list-group")]//li[contains(@class, "list-group-item")]')
+
+# Relative to a presentation (li.list-group-item)
+PRESENTATION_TIME = etree.XPath('.//span[@class="tipsytip"][contains(text(), "AM") or contains(text(), "PM")]/text()')
+PRESENTATION_TITLE = etree.XPath('.//div[contains(@class, "prestitle")]/text()[1]')
+PRESENTATION_PRESENTERS = etree.XPath('.//small[@class="presentation-presenters"]')
+PRESENTATION_BIO_NAMES = etree.XPath('.//span[@class="biopopup"]/text()')
+
+# PosterHTMLParser
+POSTER_TRACK_NAMES = etree.XPath('//p[contains(@class, "trackname")]//span/text()')
+POSTER_SESSION_NAME = etree.XPath('//p[contains(text(), "Poster Session:")]/b[2]/text()')
+POSTER_TIME = etree.XPath('//i[contains(@class, "fa-clock-o")]/following-sibling::text()[1]')
+POSTER_TIMEZONE = etree.XPath('//i[contains(@class, "fa-clock-o")]/following-sibling::small[1]/text()')
+POSTER_SPEAKER_ITEMS = etree.XPath('//ul[@class="speakers-wrap"]/*')
+
+# Meeting-site listing rows (li[data-presid]), for listing_stream_parser
+LISTING_TIME = etree.XPath('.//div[contains(@class, "prestime")]/span/text()')
+LISTING_TIMEZONE = etree.XPath('.//div[contains(@class, "prestime")]//small/text()')
+LISTING_TITLE = etree.XPath('.//div[contains(@class, "list-row-primary")]/span[1]')
+LISTING_LOCATION = etree.XPath('.//div[@class="text-12"]/text()')
+LISTING_PRESENTERS = etree.XPath('.//div[@class="mar-btm-xs"]')
+LISTING_TRACKS = etree.XPath('.//span[@class="text-bubble"]/text()')
+
+# FacultyHTMLParser lxml backend (class tests match one token of @class, like BeautifulSoup's class_)
+FACULTY_FULL_NAME = etree.XPath('//h1[contains(concat(" ", normalize-space(@class), " "), " popupFullName ")]')
+FACULTY_ORGANIZATION = etree.XPath('//p[contains(concat(" ", normalize-space(@class), " "), " popupOrganization ")]')
+FACULTY_PHOTO = etree.XPath('//img[contains(concat(" ", normalize-space(@class), " "), " presenterphoto ")]')
+FACULTY_MAILTO_LINKS = etree.XPath('//a[starts-with(@href, "mailto:")]')
+FACULTY_PARAGRAPHS = etree.XPath('//p')
+FACULTY_LINKS = etree.XPath('//a[@href]')
@@ -4,107 +4,198 @@ Conference Crawler API
 Flask application for managing conference assignments
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
-import sqlite3
 import json
 from datetime import datetime
 import os
+import time
+from change_feed import ChangeNotifier, format_sse, load_changes
+from db_pool import SQLitePool
+from http_cache import (RepresentationCache, choose_encoding, conference_version, encode_body,
+                        ensure_version_tracking, make_etag)
+from search_index import KINDS, ensure_search_schema, search
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
 # Database configuration
-DATABASE_PATH = os.path.join(os.path.dirname(__file__), 'conference_crawler.db')
+DATABASE_PATH = os.environ.get('CONFERENCE_DB_PATH', os.path.join(os.path.dirname(__file__), 'conference_crawler.db'))
+
+# Pooled connections: readers are reused across requests, writes go through one serialized writer
+db_pool = SQLitePool(DATABASE_PATH, size=int(os.environ.get('DB_POOL_SIZE', 8)))
 
 def get_db_connection():
-    """Get database connection"""
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row  # This enables column access by name
-    return conn
+    """Borrow a pooled read connection (use in a with block; it is returned, not closed)"""
+    return db_pool.reader()
 
 # Table creation removed - database should already exist with your data
 
+# Except the per-conference version table and its triggers, which drive the ETags,
+# and the (possibly still empty) full-text search tables
+with db_pool.writer() as conn:
+    ensure_version_tracking(conn)
+    ensure_search_schema(conn)
+
+# Last serialized, compressed body per resource and encoding
+response_cache = RepresentationCache()
+
+# Wakes change feed waiters when an assignment write commits in this process
+change_notifier = ChangeNotifier()
+
+# Change feed tuning, in seconds
+FEED_MAX_WAIT = 30          # longest a long-poll request is held
+FEED_POLL_INTERVAL = 1.0    # re-check for writes made by other processes
+SSE_KEEPALIVE = 15          # comment line so proxies keep idle streams open
+SSE_STREAM_SECONDS = 300    # streams end after this; EventSource reconnects with Last-Event-ID
+
+def versioned_json_response(kind, conference_id, load_payload):
+    """
+    JSON response for a versioned conference resource
+
+    Answers 304 when If-None-Match holds the current ETag, serves the cached
+    body when the version is unchanged, and otherwise builds the payload with
+    load_payload(conn), then encodes and caches it.
+    """
+    encoding = choose_encoding(request.accept_encodings)
+
+    with get_db_connection() as conn:
+        # One read snapshot for the version and the payload
+        conn.execute('BEGIN')
+        version = conference_version(conn, conference_id)
+        etag = make_etag(kind, version, encoding)
+
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+            response.set_etag(etag)
+            response.headers['Vary'] = 'Accept-Encoding'
+            response.headers['X-Conference-Version'] = str(version)
+            return response
+
+        cache_key = (kind, conference_id, encoding)
+        body = response_cache.get(cache_key, version)
+        if body is None:
+            body = encode_body(app.json.response(load_payload(conn)).get_data(), encoding)
+            response_cache.put(cache_key, version, body)
+
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['X-Conference-Version'] = str(version)
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    return response
+
+def assignment_pairs(items):
+    """
+    Turn [{session_id, user_id}, ...] into a set of (session_id, user_id) pairs
+
+    IDs are compared as text, the way the TEXT columns store them.
+    Raises ValueError for items missing either key.
+    """
+    pairs = set()
+    for item in items or []:
+        if not isinstance(item, dict) or item.get('session_id') is None or item.get('user_id') is None:
+            raise ValueError('Each assignment needs a session_id and a user_id')
+        pairs.add((str(item['session_id']), str(item['user_id'])))
+    return pairs
+
+def load_active_user_ids(conn, conference_id):
+    """Active user IDs for a conference, in one query"""
+    rows = conn.execute('''
+        SELECT user_id FROM conference_users
+        WHERE conference_id = ? AND active = 1
+    ''', (conference_id,)).fetchall()
+    return {str(row['user_id']) for row in rows}
+
+def apply_assignment_changes(conn, conference_id, inserts, removes):
+    """
+    Insert and remove (session_id, user_id) pairs with one executemany each
+
+    Returns:
+        (inserted, removed) row counts
+    """
+    removed = 0
+    if removes:
+        removed = conn.executemany('''
+            DELETE FROM conference_assignments
+            WHERE conference_id = ? AND session_id = ? AND user_id = ?
+        ''', [(conference_id, session_id, user_id) for session_id, user_id in sorted(removes)]).rowcount
+
+    inserted = 0
+    if inserts:
+        assigned_date = datetime.now().isoformat()
+        inserted = conn.executemany('''
+            INSERT OR IGNORE INTO conference_assignments (
+                conference_id, session_id, user_id, assigned_date, assigned_by
+            ) VALUES (?, ?, ?, ?, ?)
+        ''', [(conference_id, session_id, user_id, assigned_date, 'system')
+              for session_id, user_id in sorted(inserts)]).rowcount
+
+    return inserted, removed
+
 @app.route('/api/conferences/<conference_id>/users', methods=['GET'])
 def get_conference_users(conference_id):
     """Get all users for a specific conference"""
     try:
-        conn = get_db_connection()
-
-        users = conn.execute('''
-            SELECT
-                id as user_id,
-                (firstname || ' ' || lastname) as name,
-                firstname,
-                lastname,
-                email,
-                department,
-                title,
-                degree,
-                external_id,
-                external_system,
-                active,
-                created_at
-            FROM conference_users
-            WHERE conference_id = ? AND active = 1
-            ORDER BY lastname, firstname
-        ''', (conference_id,)).fetchall()
-
-        conn.close()
-
-        # Convert to list of dictionaries
-        result = []
-        for user in users:
-            user_dict = {
-                'user_id': user['user_id'],
-                'name': user['name'],  # This is the concatenated firstname + lastname
-                'firstname': user['firstname'],
-                'lastname': user['lastname'],
-                'email': user['email'],
-                'department': user['department'],
-                'title': user['title'],
-                'degree': user['degree'],
-                'external_id': user['external_id'],
-                'external_system': user['external_system'],
-                'conference_role': 'msd',  # Default role since not in table
-                'active': bool(user['active']),
-                'assigned_date': user['created_at'],  # Using created_at since no assigned_date
-                'created_at': user['created_at']
-            }
-            result.append(user_dict)
-
-        return jsonify(result)
+        return versioned_json_response('users', conference_id, lambda conn: load_conference_users(conn, conference_id))
 
     except Exception as e:
         return jsonify({'error': 'Database error', 'message': str(e)}), 500
 
+def load_conference_users(conn, conference_id):
+    """Active users of a conference, in the frontend's format"""
+    users = conn.execute('''
+        SELECT
+            id as user_id,
+            (firstname || ' ' || lastname) as name,
+            firstname,
+            lastname,
+            email,
+            department,
+            title,
+            degree,
+            external_id,
+            external_system,
+            active,
+            created_at
+        FROM conference_users
+        WHERE conference_id = ? AND active = 1
+        ORDER BY lastname, firstname
+    ''', (conference_id,)).fetchall()
+
+    # Convert to list of dictionaries
+    result = []
+    for user in users:
+        user_dict = {
+            'user_id': user['user_id'],
+            'name': user['name'],  # This is the concatenated firstname + lastname
+            'firstname': user['firstname'],
+            'lastname': user['lastname'],
+            'email': user['email'],
+            'department': user['department'],
+            'title': user['title'],
+            'degree': user['degree'],
+            'external_id': user['external_id'],
+            'external_system': user['external_system'],
+            'conference_role': 'msd',  # Default role since not in table
+            'active': bool(user['active']),
+            'assigned_date': user['created_at'],  # Using created_at since no assigned_date
+            'created_at': user['created_at']
+        }
+        result.append(user_dict)
+
+    return result
+
 @app.route('/api/conferences/<conference_id>/assignments', methods=['GET', 'POST'])
 def handle_assignments(conference_id):
     """Get or save assignments for a conference"""
     try:
-        conn = get_db_connection()
-
         if request.method == 'GET':
-            # Get all assignments for this conference
-            assignments_rows = conn.execute('''
-                SELECT session_id, user_id
-                FROM conference_assignments
-                WHERE conference_id = ?
-                ORDER BY session_id, user_id
-            ''', (conference_id,)).fetchall()
-
-            # Convert to frontend format: {sessionId: [userId1, userId2]}
-            assignments = {}
-            for row in assignments_rows:
-                session_id = row['session_id']
-                user_id = row['user_id']
-
-                if session_id not in assignments:
-                    assignments[session_id] = []
-                assignments[session_id].append(user_id)
-
-            conn.close()
-            return jsonify({'assignments': assignments})
+            return versioned_json_response(
+                'assignments', conference_id, lambda conn: load_conference_assignments(conn, conference_id)
+            )
 
         elif request.method == 'POST':
             # Save assignments (bulk operation)
@@ -113,63 +204,208 @@ def handle_assignments(conference_id):
             if not data or 'assignments' not in data:
                 return jsonify({'error': 'Bad Request', 'message': 'No assignments data provided'}), 400
 
-            # Begin transaction
-            conn.execute('BEGIN TRANSACTION')
-
             try:
-                # Clear existing assignments for this conference
-                conn.execute('''
-                    DELETE FROM conference_assignments
-                    WHERE conference_id = ?
-                ''', (conference_id,))
-
-                # Insert new assignments
-                for assignment in data['assignments']:
-                    # Validate that user exists in conference_users
-                    user_check = conn.execute('''
-                        SELECT user_id FROM conference_users
-                        WHERE conference_id = ? AND user_id = ? AND active = 1
-                    ''', (conference_id, assignment['user_id'])).fetchone()
-
-                    if user_check:
-                        conn.execute('''
-                            INSERT INTO conference_assignments (
-                                conference_id, session_id, user_id, assigned_date, assigned_by
-                            ) VALUES (?, ?, ?, ?, ?)
-                        ''', (
-                            conference_id,
-                            assignment['session_id'],
-                            assignment['user_id'],
-                            datetime.now().isoformat(),
-                            'system'
-                        ))
-
-                conn.execute('COMMIT')
-                conn.close()
-
-                return jsonify({
-                    'success': True,
-                    'message': 'Assignments saved successfully',
-                    'count': len(data['assignments'])
-                })
-
-            except Exception as e:
-                conn.execute('ROLLBACK')
-                conn.close()
-                raise e
+                desired = assignment_pairs(data['assignments'])
+            except ValueError as e:
+                return jsonify({'error': 'Bad Request', 'message': str(e)}), 400
+
+            # One transaction on the serialized writer: commits on success, rolls back on error
+            with db_pool.writer() as conn:
+                # Keep only assignments to users active in this conference
+                active_users = load_active_user_ids(conn, conference_id)
+                desired = {pair for pair in desired if pair[1] in active_users}
+
+                # Diff against what is stored and write only the difference
+                current = {
+                    (str(row['session_id']), str(row['user_id']))
+                    for row in conn.execute('''
+                        SELECT session_id, user_id
+                        FROM conference_assignments
+                        WHERE conference_id = ?
+                    ''', (conference_id,))
+                }
+                inserted, removed = apply_assignment_changes(
+                    conn, conference_id, desired - current, current - desired
+                )
+            change_notifier.notify()
+
+            return jsonify({
+                'success': True,
+                'message': 'Assignments saved successfully',
+                'count': len(data['assignments']),
+                'inserted': inserted,
+                'removed': removed
+            })
 
     except Exception as e:
         return jsonify({'error': 'Server error', 'message': str(e)}), 500
 
+def load_conference_assignments(conn, conference_id):
+    """Assignments of a conference in the frontend's format: {sessionId: [userId1, userId2]}"""
+    assignments_rows = conn.execute('''
+        SELECT session_id, user_id
+        FROM conference_assignments
+        WHERE conference_id = ?
+        ORDER BY session_id, user_id
+    ''', (conference_id,)).fetchall()
+
+    assignments = {}
+    for row in assignments_rows:
+        session_id = row['session_id']
+        user_id = row['user_id']
+
+        if session_id not in assignments:
+            assignments[session_id] = []
+        assignments[session_id].append(user_id)
+
+    return {'assignments': assignments}
+
 @app.route('/api/conferences/<conference_id>/assignments/bulk', methods=['POST'])
 def bulk_assignments(conference_id):
     """Bulk assignment operations (alias for POST to assignments endpoint)"""
     return handle_assignments(conference_id)
 
+@app.route('/api/conferences/<conference_id>/assignments/delta', methods=['POST'])
+def assignment_delta(conference_id):
+    """
+    Apply only the changes to a conference's assignments
+
+    Body: {"add": [{session_id, user_id}, ...], "remove": [{session_id, user_id}, ...]}
+    Adds for users not active in the conference are skipped; adding an
+    existing pair or removing a missing one is a no-op.
+    """
+    try:
+        data = request.get_json(silent=True)
+
+        if not data or ('add' not in data and 'remove' not in data):
+            return jsonify({'error': 'Bad Request', 'message': 'No add or remove data provided'}), 400
+
+        try:
+            adds = assignment_pairs(data.get('add'))
+            removes = assignment_pairs(data.get('remove'))
+        except ValueError as e:
+            return jsonify({'error': 'Bad Request', 'message': str(e)}), 400
+
+        with db_pool.writer() as conn:
+            active_users = load_active_user_ids(conn, conference_id) if adds else set()
+            valid_adds = {pair for pair in adds if pair[1] in active_users}
+            inserted, removed = apply_assignment_changes(conn, conference_id, valid_adds, removes)
+        change_notifier.notify()
+
+        return jsonify({
+            'success': True,
+            'inserted': inserted,
+            'removed': removed,
+            'skipped': len(adds) - len(valid_adds)
+        })
+
+    except Exception as e:
+        return jsonify({'error': 'Server error', 'message': str(e)}), 500
+
+def read_changes(conference_id, since):
+    """Load the change feed from one read snapshot"""
+    with get_db_connection() as conn:
+        conn.execute('BEGIN')
+        return load_changes(conn, conference_id, since)
+
+def stream_changes(conference_id, since):
+    """Server-Sent Events: one 'changes' event per batch of new versions"""
+    yield 'retry: 2000\n\n'
+    deadline = time.monotonic() + SSE_STREAM_SECONDS
+    last_sent = time.monotonic()
+
+    while time.monotonic() < deadline and not change_notifier.closed:
+        generation = change_notifier.generation
+        feed = read_changes(conference_id, since)
+        if feed['version'] != since:
+            yield format_sse('changes', feed, event_id=feed['version'])
+            since = feed['version']
+            last_sent = time.monotonic()
+        elif time.monotonic() - last_sent >= SSE_KEEPALIVE:
+            yield ': keepalive\n\n'
+            last_sent = time.monotonic()
+        change_notifier.wait(generation, FEED_POLL_INTERVAL)
+
+@app.route('/api/conferences/<conference_id>/assignments/changes', methods=['GET'])
+def assignment_changes(conference_id):
+    """
+    Assignment changes after ?since=<version> (from X-Conference-Version or the last feed answer)
+
+    Answers at once by default; ?wait=<seconds> long-polls until the version
+    moves; Accept: text/event-stream streams changes as Server-Sent Events.
+    Every answer carries the version to pass as since next time, and
+    reset=true when the client must refetch the full assignments instead.
+    """
+    try:
+        # EventSource sends the last event id when it reconnects
+        since = request.headers.get('Last-Event-ID', type=int)
+        if since is None:
+            since = request.args.get('since', type=int)
+        if since is None:
+            return jsonify({'error': 'Bad Request', 'message': 'since must be a version number'}), 400
+
+        if request.accept_mimetypes.best_match(['application/json', 'text/event-stream']) == 'text/event-stream':
+            return Response(stream_changes(conference_id, since), mimetype='text/event-stream', headers={
+                'Cache-Control': 'no-cache',
+                'X-Accel-Buffering': 'no'  # don't let nginx buffer the stream
+            })
+
+        wait = min(max(request.args.get('wait', 0, type=float), 0), FEED_MAX_WAIT)
+        deadline = time.monotonic() + wait
+        while True:
+            generation = change_notifier.generation
+            feed = read_changes(conference_id, since)
+            remaining = deadline - time.monotonic()
+            if feed['version'] != since or remaining <= 0 or change_notifier.closed:
+                return jsonify(feed)
+            change_notifier.wait(generation, min(remaining, FEED_POLL_INTERVAL))
+
+    except Exception as e:
+        return jsonify({'error': 'Server error', 'message': str(e)}), 500
+
+@app.route('/api/search', methods=['GET'])
+def search_documents():
+    """
+    Ranked full-text search over sessions, presentations and posters
+
+    Query: q (required), conference, kind (session/presentation/poster, repeatable
+    or comma-separated), limit (max 100), offset. Fill the index with search_index.py.
+    """
+    try:
+        text = request.args.get('q', '').strip()
+        if not text:
+            return jsonify({'error': 'Bad Request', 'message': 'q is required'}), 400
+
+        kinds = [kind for value in request.args.getlist('kind') for kind in value.split(',') if kind]
+        unknown = set(kinds) - set(KINDS)
+        if unknown:
+            return jsonify({'error': 'Bad Request', 'message': f'Unknown kind: {", ".join(sorted(unknown))}'}), 400
+
+        started = time.perf_counter()
+        with get_db_connection() as conn:
+            result = search(
+                conn, text,
+                conference_id=request.args.get('conference'),
+                kinds=kinds or None,
+                limit=request.args.get('limit', 20, type=int),
+                offset=request.args.get('offset', 0, type=int)
+            )
+        result['took_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        return jsonify(result)
+
+    except Exception as e:
+        return jsonify({'error': 'Search error', 'message': str(e)}), 500
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'timestamp': datetime.now().isoformat()})
+    return jsonify({
+        'status': 'healthy',
+        'timestamp': datetime.now().isoformat(),
+        'database': db_pool.get_stats(),
+        'response_cache': response_cache.get_stats(),
+        'change_feed': change_notifier.get_stats()
+    })
 
 if __name__ == '__main__':
     # Run the Flask app (database should already be initialized)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Assignment change feed for the Conference Crawler API
+Reads the append-only conference_assignment_changes log (filled by the
+version triggers in http_cache) and wakes long-poll and SSE clients when an
+assignment write commits, so clients fetch deltas instead of the full map
+"""
+
+import json
+import threading
+import time
+
+from http_cache import conference_version
+
+# A client further behind than this many changes refetches the full assignments
+MAX_CHANGES = 1000
+
+
+def load_changes(conn, conference_id, since, limit=MAX_CHANGES):
+    """
+    Assignment changes of a conference after a given version
+
+    Returns:
+        {'version': current version, 'changes': [{version, op, session_id, user_id}, ...],
+         'reset': True when the client must refetch the full assignments instead}
+    """
+    version = conference_version(conn, conference_id)
+    rows = conn.execute('''
+        SELECT version, op, session_id, user_id
+        FROM conference_assignment_changes
+        WHERE conference_id = ? AND version > ?
+        ORDER BY change_id
+        LIMIT ?
+    ''', (conference_id, since, limit + 1)).fetchall()
+
+    # Too far behind, or ahead of the server (e.g. the database was restored)
+    if len(rows) > limit or since > version:
+        return {'version': version, 'changes': [], 'reset': True}
+
+    return {
+        'version': version,
+        'changes': [
+            {'version': row['version'], 'op': row['op'], 'session_id': row['session_id'], 'user_id': row['user_id']}
+            for row in rows
+        ],
+        'reset': False
+    }
+
+
+def format_sse(event, data, event_id=None):
+    """One Server-Sent Events message"""
+    lines = []
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    lines.append(f'event: {event}')
+    lines.append(f'data: {json.dumps(data, separators=(",", ":"))}')
+    return '\n'.join(lines) + '\n\n'
+
+
+class ChangeNotifier:
+    """
+    Wakes waiting feed requests when this process commits an assignment write
+
+    Waiters pass the generation they saw before checking the database, so a
+    notify between the check and the wait is never missed. Writes from other
+    processes are picked up by the waiters' poll interval instead.
+    After close(), waits return at once so open feeds finish during shutdown.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self.generation = 0
+        self.closed = False
+        self.stats = {'notifications': 0, 'waiters': 0}
+
+    def notify(self):
+        """Call after a write transaction commits"""
+        with self._condition:
+            self.generation += 1
+            self.stats['notifications'] += 1
+            self._condition.notify_all()
+
+    def close(self):
+        """Release every waiter and end open feeds (call on shutdown)"""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def wait(self, generation, timeout):
+        """
+        Block until the generation moves past the one given, or timeout seconds pass
+
+        Returns:
+            The current generation
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            self.stats['waiters'] += 1
+            try:
+                while self.generation == generation and not self.closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                return self.generation
+            finally:
+                self.stats['waiters'] -= 1
+
+    def get_stats(self):
+        with self._condition:
+            return dict(self.stats, generation=self.generation, closed=self.closed)
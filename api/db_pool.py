@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+SQLite connection pool for the Conference Crawler API
+Reusable reader connections plus one serialized writer connection, all in
+WAL mode, so concurrent requests neither reconnect nor hit "database is locked"
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+# Applied to every connection when it is opened
+CONNECTION_PRAGMAS = [
+    'PRAGMA journal_mode=WAL',      # readers never block the writer, and vice versa
+    'PRAGMA synchronous=NORMAL',    # durable at checkpoints; safe with WAL
+    'PRAGMA cache_size=-20000',     # ~20 MB page cache per connection
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',   # map up to 256 MB of the database file
+]
+
+
+class SQLitePool:
+    """Pool of reader connections and a single writer connection for one database file"""
+
+    def __init__(self, database_path, size=8, busy_timeout=5.0, cached_statements=256):
+        """
+        Args:
+            database_path: SQLite database file
+            size: Maximum number of reader connections
+            busy_timeout: Seconds a connection waits on a lock before failing
+            cached_statements: Prepared statements cached per connection
+        """
+        self.database_path = database_path
+        self.size = size
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+
+        self.stats = {
+            'connections_opened': 0,
+            'reads': 0,
+            'writes': 0,
+            'write_wait_seconds': 0.0,
+        }
+
+    def _connect(self):
+        """Open and configure a connection"""
+        # isolation_level=None: autocommit, transactions are explicit (see writer())
+        conn = sqlite3.connect(
+            self.database_path,
+            timeout=self.busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        conn.row_factory = sqlite3.Row  # This enables column access by name
+        conn.execute(f'PRAGMA busy_timeout={int(self.busy_timeout * 1000)}')
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+
+        with self._lock:
+            self.stats['connections_opened'] += 1
+        return conn
+
+    def _checkout(self):
+        """Take an idle reader, open a new one while under the limit, or wait for one"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_open = self._created < self.size
+            if can_open:
+                self._created += 1
+
+        if can_open:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        return self._idle.get()
+
+    @contextmanager
+    def reader(self):
+        """
+        Borrow a connection for reads
+
+        The connection goes back to the pool afterwards; never close it.
+        """
+        conn = self._checkout()
+        try:
+            self.stats['reads'] += 1
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    @contextmanager
+    def writer(self):
+        """
+        Run a write transaction on the single writer connection
+
+        Writers queue on a lock instead of racing for SQLite's, and the
+        transaction starts IMMEDIATE so it never has to upgrade mid-way.
+        Commits on success, rolls back and re-raises on error.
+        """
+        wait_started = time.monotonic()
+        with self._writer_lock:
+            self.stats['write_wait_seconds'] += time.monotonic() - wait_started
+            if self._writer is None:
+                self._writer = self._connect()
+
+            conn = self._writer
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            finally:
+                self.stats['writes'] += 1
+
+    def close_all(self):
+        """Close every idle reader and the writer"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._created = 0
+
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def get_stats(self):
+        """Pool statistics"""
+        stats = dict(self.stats)
+        stats['write_wait_seconds'] = round(stats['write_wait_seconds'], 3)
+        stats['readers_open'] = self._created
+        stats['readers_idle'] = self._idle.qsize()
+        return stats
+
@@ -0,0 +1,44 @@
+"""
+Gunicorn settings for the Conference Crawler API
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Sizing can be overridden with API_BIND, API_WORKERS, API_THREADS and
+API_ACCESS_LOG; use load_test.py to pick values for a box.
+"""
+
+import multiprocessing
+import os
+import sys
+
+bind = os.environ.get('API_BIND', '0.0.0.0:5001')
+
+# Processes for CPU work (JSON, compression), threads for requests waiting on
+# SQLite. Writes are serialized per worker and by SQLite across workers.
+workers = int(os.environ.get('API_WORKERS', min(multiprocessing.cpu_count(), 8)))
+worker_class = 'gthread'
+# Long-poll and SSE change feed requests hold a thread each while open
+threads = int(os.environ.get('API_THREADS', 8))
+
+# Load the app in each worker, never before forking: SQLite connections
+# must not be shared across processes
+preload_app = False
+
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers now and then, staggered so they don't restart together
+max_requests = 10000
+max_requests_jitter = 1000
+
+accesslog = os.environ.get('API_ACCESS_LOG')  # '-' for stdout; off by default
+errorlog = '-'
+loglevel = 'info'
+
+
+def worker_exit(server, worker):
+    """Close the worker's database connections after its last request"""
+    wsgi = sys.modules.get('wsgi')
+    if wsgi is not None:
+        wsgi.shutdown()
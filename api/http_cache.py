@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Versioned response caching for the Conference Crawler API
+Strong ETags from per-conference versions, content-encoding negotiation
+(brotli when installed, else gzip), and a cache of the last serialized,
+compressed body per resource so unchanged polls cost one version lookup
+"""
+
+import gzip
+import threading
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Tracks a per-conference version, bumped by triggers on every write to
+# conference_users or conference_assignments, whoever the writer is.
+# Assignment writes also append to an append-only change log, stamped with
+# the version they produced, which backs the assignments change feed.
+VERSION_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS conference_versions (
+        conference_id TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS conference_assignment_changes (
+        change_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        conference_id TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        op TEXT NOT NULL,
+        session_id TEXT NOT NULL,
+        user_id TEXT NOT NULL,
+        changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_assignment_changes_version
+    ON conference_assignment_changes (conference_id, version)
+    ''',
+]
+
+BUMP_VERSION = '''
+        INSERT INTO conference_versions (conference_id, version) VALUES ({row}.conference_id, 1)
+        ON CONFLICT (conference_id) DO UPDATE SET version = version + 1, updated_at = CURRENT_TIMESTAMP;'''
+
+LOG_CHANGE = '''
+        INSERT INTO conference_assignment_changes (conference_id, version, op, session_id, user_id)
+        SELECT {row}.conference_id, version, '{op}', {row}.session_id, {row}.user_id
+        FROM conference_versions WHERE conference_id = {row}.conference_id AND ({when});'''
+
+PAIR_CHANGED = 'OLD.session_id IS NOT NEW.session_id OR OLD.user_id IS NOT NEW.user_id'
+
+# (table, event, body). SQLite leaves the order of several triggers on one
+# event undefined, so each event gets a single trigger that bumps the
+# version first and then logs the change stamped with it.
+VERSION_TRIGGERS = [
+    ('conference_users', 'INSERT', BUMP_VERSION.format(row='NEW')),
+    ('conference_users', 'UPDATE', BUMP_VERSION.format(row='NEW')),
+    ('conference_users', 'DELETE', BUMP_VERSION.format(row='OLD')),
+    ('conference_assignments', 'INSERT',
+     BUMP_VERSION.format(row='NEW') + LOG_CHANGE.format(row='NEW', op='add', when='1')),
+    ('conference_assignments', 'UPDATE',
+     BUMP_VERSION.format(row='NEW')
+     + LOG_CHANGE.format(row='OLD', op='remove', when=PAIR_CHANGED)
+     + LOG_CHANGE.format(row='NEW', op='add', when=PAIR_CHANGED)),
+    ('conference_assignments', 'DELETE',
+     BUMP_VERSION.format(row='OLD') + LOG_CHANGE.format(row='OLD', op='remove', when='1')),
+]
+
+
+def ensure_version_tracking(conn):
+    """Create the version and change log tables, and (re)create their triggers"""
+    for statement in VERSION_SCHEMA:
+        conn.execute(statement)
+
+    # Recreated on every start so databases set up by older code get the current bodies
+    for table, event, body in VERSION_TRIGGERS:
+        name = f'{table}_version_{event.lower()}'
+        conn.execute(f'DROP TRIGGER IF EXISTS {name}')
+        conn.execute(f'CREATE TRIGGER {name} AFTER {event} ON {table} BEGIN{body}\n    END')
+
+
+def conference_version(conn, conference_id):
+    """Current version of a conference's data (0 if it was never written)"""
+    row = conn.execute(
+        'SELECT version FROM conference_versions WHERE conference_id = ?', (conference_id,)
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def choose_encoding(accept_encodings):
+    """Pick br, gzip or identity from the request's Accept-Encoding"""
+    if brotli is not None and accept_encodings['br']:
+        return 'br'
+    if accept_encodings['gzip']:
+        return 'gzip'
+    return 'identity'
+
+
+def encode_body(body, encoding):
+    """Compress a response body for the chosen content encoding"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=5)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    return body
+
+
+def make_etag(kind, version, encoding):
+    """Strong ETag for one encoding of a versioned resource"""
+    return f'{kind}-v{version}-{encoding}'
+
+
+class RepresentationCache:
+    """Latest encoded body per (resource, encoding); older versions are replaced"""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def get(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == version:
+                self.stats['hits'] += 1
+                return entry[1]
+            self.stats['misses'] += 1
+            return None
+
+    def put(self, key, version, body):
+        with self._lock:
+            current = self._entries.get(key)
+            # Never let a slow request overwrite a newer version
+            if current is None or current[0] <= version:
+                self._entries[key] = (version, body)
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats, entries=len(self._entries))
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Conference Crawler API Load Test
+Starts the API on a throwaway copy of the SQLite database and replays a mix
+of users GETs, assignment GETs and bulk assignment POSTs from concurrent
+clients, then reports p50/p95/p99 latency and requests per second per
+request type. Use it to size workers and threads before a conference.
+With --server external the bulk POSTs are skipped (each one replaces the
+conference's whole assignment set) unless --allow-writes is given.
+
+    python load_test.py --workers 4 --threads 8 --concurrency 32 --duration 30
+"""
+
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import shutil
+import signal
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import urlsplit
+
+API_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB = os.environ.get('CONFERENCE_DB_PATH', os.path.join(API_DIR, 'conference_crawler.db'))
+
+
+def parse_mix(value):
+    """Parse 'users=45,assignments=45,bulk=10' into {kind: weight}"""
+    mix = {}
+    for part in value.split(','):
+        kind, _, weight = part.partition('=')
+        if kind.strip() not in ('users', 'assignments', 'bulk'):
+            raise argparse.ArgumentTypeError(f"unknown request type '{kind}'")
+        mix[kind.strip()] = float(weight)
+    return mix
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def copy_database(source, directory):
+    """Snapshot the database (consistent even while it is in use) into directory"""
+    target = os.path.join(directory, 'load_test.db')
+    with sqlite3.connect(source) as src, sqlite3.connect(target) as dst:
+        src.backup(dst)
+    return target
+
+
+def load_fixture(db_path, conference_id, sessions):
+    """Active user IDs, session IDs and current assignment pairs from the copy"""
+    conn = sqlite3.connect(db_path)
+    try:
+        users = [str(row[0]) for row in conn.execute(
+            'SELECT user_id FROM conference_users WHERE conference_id = ? AND active = 1', (conference_id,)
+        )]
+        pairs = {(str(s), str(u)) for s, u in conn.execute(
+            'SELECT session_id, user_id FROM conference_assignments WHERE conference_id = ?', (conference_id,)
+        )}
+    finally:
+        conn.close()
+
+    session_ids = sorted({session_id for session_id, _ in pairs})
+    session_ids += [f'load-{i}' for i in range(max(0, sessions - len(session_ids)))]
+    return users, session_ids, pairs
+
+
+def start_server(args, db_path):
+    """Start the API on the database copy; returns the process"""
+    env = dict(os.environ, CONFERENCE_DB_PATH=db_path)
+    if args.server == 'gunicorn':
+        command = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+                   '--bind', f'127.0.0.1:{args.port}', '--workers', str(args.workers),
+                   '--threads', str(args.threads), 'wsgi:app']
+    else:
+        command = [sys.executable, '-c',
+                   f"from app import app; app.run(host='127.0.0.1', port={args.port}, threaded=True)"]
+    return subprocess.Popen(command, cwd=API_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=None if args.verbose else subprocess.DEVNULL)
+
+
+def wait_until_healthy(host, port, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=2)
+            conn.request('GET', '/api/health')
+            if conn.getresponse().status == 200:
+                conn.close()
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f'API did not become healthy on {host}:{port}')
+
+
+class LoadClient(threading.Thread):
+    """One simulated user: a keep-alive connection issuing the request mix until the deadline"""
+
+    def __init__(self, number, args, host, port, fixture, deadline, results):
+        super().__init__(daemon=True)
+        self.args = args
+        self.host = host
+        self.port = port
+        self.users, self.sessions, pairs = fixture
+        self.pairs = set(pairs)
+        self.deadline = deadline
+        self.results = results
+        self.rng = random.Random(args.seed + number)
+        self.etags = {}
+        self.conn = None
+
+    def request(self, method, path, body=None, headers=None):
+        """Send one request, reconnecting once if the server closed the connection"""
+        for attempt in range(2):
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection(self.host, self.port, timeout=60)
+            try:
+                self.conn.request(method, path, body=body, headers=headers or {})
+                response = self.conn.getresponse()
+                response.read()
+                return response
+            except (http.client.HTTPException, OSError):
+                self.conn.close()
+                self.conn = None
+                if attempt:
+                    raise
+
+    def get(self, path):
+        # Polling clients send back the ETag they have, like the browser cache
+        headers = {'Accept-Encoding': 'gzip'}
+        if path in self.etags and self.rng.random() < self.args.etag_ratio:
+            headers['If-None-Match'] = self.etags[path]
+        response = self.request('GET', path, headers=headers)
+        if response.status == 200 and response.getheader('ETag'):
+            self.etags[path] = response.getheader('ETag')
+        return response
+
+    def bulk_save(self, base):
+        """Toggle a few assignments and save the client's whole set, like the tool's Save button"""
+        for _ in range(self.args.changes):
+            pair = (self.rng.choice(self.sessions), self.rng.choice(self.users))
+            self.pairs.symmetric_difference_update({pair})
+        body = json.dumps({'assignments': [{'session_id': s, 'user_id': u} for s, u in self.pairs]})
+        return self.request('POST', f'{base}/assignments/bulk', body=body,
+                            headers={'Content-Type': 'application/json'})
+
+    def run(self):
+        base = f'/api/conferences/{self.args.conference}'
+        kinds = list(self.args.mix)
+        weights = [self.args.mix[kind] for kind in kinds]
+
+        while time.monotonic() < self.deadline:
+            kind = self.rng.choices(kinds, weights)[0]
+            started = time.perf_counter()
+            try:
+                if kind == 'users':
+                    response = self.get(f'{base}/users')
+                elif kind == 'assignments':
+                    response = self.get(f'{base}/assignments')
+                else:
+                    response = self.bulk_save(base)
+                ok = response.status in (200, 304)
+            except (http.client.HTTPException, OSError):
+                ok = False
+            self.results.append((kind, ok, time.perf_counter() - started))
+
+        if self.conn is not None:
+            self.conn.close()
+
+
+def report(results, elapsed):
+    """Print latency percentiles and throughput per request type"""
+    print(f"{'type':<12}{'requests':>9}{'errors':>8}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for kind in ('users', 'assignments', 'bulk', 'total'):
+        rows = [r for r in results if kind == 'total' or r[0] == kind]
+        if not rows:
+            continue
+        latencies = sorted(r[2] * 1000 for r in rows)
+        errors = sum(1 for r in rows if not r[1])
+        print(f"{kind:<12}{len(rows):>9}{errors:>8}{len(rows) / elapsed:>9.1f}"
+              f"{percentile(latencies, 50):>9.1f}{percentile(latencies, 95):>9.1f}"
+              f"{percentile(latencies, 99):>9.1f}{latencies[-1]:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the Conference Crawler API on a copy of its database')
+    parser.add_argument('--db', default=DEFAULT_DB,
+                        help='SQLite database to copy (never modified; only read for the fixture with --server external)')
+    parser.add_argument('--conference', default='idweek2025', help='Conference ID to exercise')
+    parser.add_argument('--server', choices=['gunicorn', 'dev', 'external'], default='gunicorn',
+                        help="Server to start on the copy; 'external' uses --url as is")
+    parser.add_argument('--url', default='http://127.0.0.1:5001', help='API base URL for --server external')
+    parser.add_argument('--allow-writes', action='store_true',
+                        help="Send bulk saves to an --server external API (replaces that conference's real assignments)")
+    parser.add_argument('--port', type=int, default=5055, help='Port for the started server')
+    parser.add_argument('--workers', type=int, default=4, help='Gunicorn worker processes')
+    parser.add_argument('--threads', type=int, default=8, help='Gunicorn threads per worker')
+    parser.add_argument('--concurrency', type=int, default=32, help='Simultaneous clients')
+    parser.add_argument('--duration', type=float, default=30.0, help='Seconds to run')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('users=45,assignments=45,bulk=10'),
+                        help='Request weights, e.g. users=45,assignments=45,bulk=10')
+    parser.add_argument('--etag-ratio', type=float, default=0.5,
+                        help='Share of repeat GETs sent with If-None-Match')
+    parser.add_argument('--sessions', type=int, default=300, help='Sessions to spread assignments over')
+    parser.add_argument('--changes', type=int, default=5, help='Assignments toggled per bulk save')
+    parser.add_argument('--seed', type=int, default=2025, help='Random seed')
+    parser.add_argument('--verbose', action='store_true', help='Show the server log')
+    args = parser.parse_args()
+
+    if args.server == 'external' and not args.allow_writes and args.mix.pop('bulk', 0):
+        print("External server: skipping bulk saves (they replace real assignments); pass --allow-writes to include them")
+    if not any(args.mix.values()):
+        parser.error('--mix has no request types left to send')
+
+    workdir = tempfile.mkdtemp(prefix='api_load_test_')
+    server = None
+    try:
+        if args.server == 'external':
+            url = urlsplit(args.url)
+            host, port = url.hostname, url.port or 80
+            fixture = load_fixture(args.db, args.conference, args.sessions)
+        else:
+            db_path = copy_database(args.db, workdir)
+            fixture = load_fixture(db_path, args.conference, args.sessions)
+            server = start_server(args, db_path)
+            host, port = '127.0.0.1', args.port
+        wait_until_healthy(host, port)
+
+        if not fixture[0]:
+            print(f"No active users for {args.conference}; bulk saves will store nothing")
+
+        sizing = f"{args.workers} workers x {args.threads} threads" if args.server == 'gunicorn' else args.server
+        print(f"{args.concurrency} clients for {args.duration:.0f}s against {sizing} ({host}:{port})")
+
+        results = []
+        deadline = time.monotonic() + args.duration
+        clients = [LoadClient(i, args, host, port, fixture, deadline, results) for i in range(args.concurrency)]
+        started = time.monotonic()
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+        report(results, time.monotonic() - started)
+
+    finally:
+        if server is not None:
+            # SIGTERM exercises the graceful shutdown
+            stop_started = time.monotonic()
+            server.send_signal(signal.SIGTERM)
+            try:
+                server.wait(timeout=60)
+                print(f"Server stopped in {time.monotonic() - stop_started:.1f}s (exit code {server.returncode})")
+            except subprocess.TimeoutExpired:
+                server.kill()
+                print("Server did not stop within 60s; killed")
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
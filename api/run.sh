@@ -28,6 +28,12 @@ pip install -r requirements.txt
 echo "🗄️  Initializing database..."
 python3 populate_data.py
 
+# Production: ./run.sh production serves the API with gunicorn (sizing in gunicorn.conf.py)
+if [ "$1" = "production" ]; then
+    echo "✅ Starting Conference Crawler API with gunicorn on http://localhost:5001"
+    exec gunicorn -c gunicorn.conf.py wsgi:app
+fi
+
 # Start the Flask API
 echo "✅ Starting Flask API on http://localhost:5000"
 echo "📊 Health check: http://localhost:5000/api/health"
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Full-text search for the Conference Crawler API
+SQLite FTS5 index over the sessions, presentations and posters written by
+SessionHTMLParserFixed and PosterHTMLParser (the crawlers' JSON/JSONL
+output), covering titles, tracks, speaker names, affiliations and
+disclosures, ranked by BM25 with title and speaker hits weighted highest.
+
+Index a conference (replaces what was indexed for it before):
+
+    python search_index.py idweek2025 --sessions idweek2025_sessions.jsonl --posters idweek2025_posters.jsonl
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SEARCH_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS search_documents (
+        doc_id INTEGER PRIMARY KEY,
+        conference_id TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        source_id TEXT NOT NULL,
+        parent_id TEXT,
+        title TEXT,
+        date TEXT,
+        time TEXT,
+        location TEXT,
+        url TEXT
+    )
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_search_documents_conference
+    ON search_documents (conference_id, kind)
+    ''',
+    # rowid = search_documents.doc_id; prefix indexes keep "fluco*" style queries fast
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+        title, tracks, speakers, affiliations, disclosures,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3 4'
+    )
+    ''',
+]
+
+# BM25 weight per FTS column, in column order
+COLUMN_WEIGHTS = (10.0, 3.0, 5.0, 2.0, 1.0)
+KINDS = ('session', 'presentation', 'poster')
+MAX_RESULTS = 100
+
+WORD_RE = re.compile(r'\w+')
+
+
+def ensure_search_schema(conn):
+    """Create the search tables if they are missing"""
+    for statement in SEARCH_SCHEMA:
+        conn.execute(statement)
+
+
+def fts_query(text):
+    """
+    FTS5 query for free text: every word must match, as a prefix
+
+    Words are quoted, so punctuation and FTS operators in user input are inert.
+    Single characters match whole words only; as prefixes they would expand
+    to most of the vocabulary.
+    """
+    return ' '.join(f'"{word}"*' if len(word) > 1 else f'"{word}"' for word in WORD_RE.findall(text or ''))
+
+
+def _join(values):
+    return ' | '.join(value for value in values if value)
+
+
+def _speakers_by_role(speakers):
+    """Speaker list from the parser's {role: [speakers]} (or an already flat list)"""
+    if isinstance(speakers, dict):
+        return [speaker for role_speakers in speakers.values() for speaker in role_speakers]
+    return speakers or []
+
+
+def session_documents(session):
+    """Search documents for a parsed session and each of its presentations"""
+    session_id = str(session.get('session_id', ''))
+    info = session.get('session_info', {})
+    schedule = session.get('schedule', {})
+    tracks = _join(session.get('tracks', {}).get('all_tracks', []))
+    speakers = _speakers_by_role(session.get('speakers'))
+
+    yield {
+        'kind': 'session',
+        'source_id': session_id,
+        'parent_id': None,
+        'title': info.get('full_title') or info.get('title', ''),
+        'date': schedule.get('date', ''),
+        'time': schedule.get('time', ''),
+        'location': schedule.get('location', ''),
+        'url': session.get('source_url', ''),
+        'tracks': _join([tracks, info.get('type', '')]),
+        'speakers': _join(s.get('name', '') for s in speakers),
+        'affiliations': _join(s.get('full_affiliation', '') for s in speakers),
+        'disclosures': _join(d.get('disclosure', '') for d in session.get('disclosures', [])),
+    }
+
+    for index, presentation in enumerate(session.get('presentations', [])):
+        presenters = presentation.get('speakers') or ([presentation['speaker']] if presentation.get('speaker') else [])
+        yield {
+            'kind': 'presentation',
+            'source_id': str(presentation.get('presentation_id') or f'{session_id}-{index + 1}'),
+            'parent_id': session_id,
+            'title': presentation.get('title', ''),
+            'date': schedule.get('date', ''),
+            'time': presentation.get('time', ''),
+            'location': schedule.get('location', ''),
+            'url': session.get('source_url', ''),
+            'tracks': tracks,
+            'speakers': _join(s.get('name', '') for s in presenters),
+            'affiliations': _join(s.get('affiliation', '') for s in presenters),
+            'disclosures': '',
+        }
+
+
+def poster_documents(poster):
+    """Search document for a parsed poster"""
+    details = poster.get('presentation_details', {})
+    schedule = poster.get('schedule', {})
+    authors = _speakers_by_role(poster.get('authors'))
+
+    # Titled as on the page, "(P-1533) Title", so the poster number is searchable too
+    title = details.get('title', '')
+    if details.get('id'):
+        title = f"({details['id']}) {title}"
+
+    yield {
+        'kind': 'poster',
+        'source_id': str(poster.get('poster_id') or details.get('id', '')),
+        'parent_id': None,
+        'title': title,
+        'date': schedule.get('date', ''),
+        'time': schedule.get('time', ''),
+        'location': schedule.get('location', ''),
+        'url': poster.get('source_url', ''),
+        'tracks': _join([poster.get('track_info', {}).get('full_name', ''),
+                         poster.get('session_info', {}).get('type', '')]),
+        'speakers': _join(a.get('name', '') for a in authors),
+        'affiliations': _join(a.get('affiliation_full', '') for a in authors),
+        'disclosures': '',
+    }
+
+
+def index_conference(conn, conference_id, sessions=(), posters=()):
+    """
+    Replace a conference's search documents
+
+    Args:
+        conn: Connection inside a write transaction
+        sessions: Parsed session dicts (records with an 'error' key are skipped)
+        posters: Parsed poster dicts
+
+    Returns:
+        Number of documents indexed
+    """
+    ensure_search_schema(conn)
+    conn.execute('''
+        DELETE FROM search_index WHERE rowid IN (SELECT doc_id FROM search_documents WHERE conference_id = ?)
+    ''', (conference_id,))
+    conn.execute('DELETE FROM search_documents WHERE conference_id = ?', (conference_id,))
+
+    def documents():
+        for session in sessions:
+            if 'error' not in session:
+                yield from session_documents(session)
+        for poster in posters:
+            if 'error' not in poster:
+                yield from poster_documents(poster)
+
+    count = 0
+    for document in documents():
+        cursor = conn.execute('''
+            INSERT INTO search_documents (conference_id, kind, source_id, parent_id, title, date, time, location, url)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (conference_id, document['kind'], document['source_id'], document['parent_id'], document['title'],
+              document['date'], document['time'], document['location'], document['url']))
+        conn.execute('''
+            INSERT INTO search_index (rowid, title, tracks, speakers, affiliations, disclosures)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (cursor.lastrowid, document['title'], document['tracks'], document['speakers'],
+              document['affiliations'], document['disclosures']))
+        count += 1
+
+    return count
+
+
+def search(conn, text, conference_id=None, kinds=None, limit=20, offset=0):
+    """
+    Ranked search across conferences
+
+    Args:
+        text: Free text; every word must match (as a prefix) in some indexed field
+        conference_id: Only this conference (None for all)
+        kinds: Only these kinds ('session', 'presentation', 'poster'); None for all
+        limit: Results per page, capped at MAX_RESULTS
+        offset: Results to skip
+
+    Returns:
+        {'results': [...], 'total': number of matches}; each result carries the
+        document fields, its BM25 score (lower is better) and a snippet with
+        matches wrapped in ** **
+    """
+    match = fts_query(text)
+    if not match:
+        return {'results': [], 'total': 0}
+
+    # Unary + keeps the planner from driving the query off the conference index,
+    # which would re-run the MATCH once per document of the conference
+    where = ['search_index MATCH ?']
+    params = [match]
+    if conference_id:
+        where.append('+d.conference_id = ?')
+        params.append(conference_id)
+    if kinds:
+        where.append(f'+d.kind IN ({", ".join("?" for _ in kinds)})')
+        params.extend(kinds)
+    where_sql = ' AND '.join(where)
+
+    total = conn.execute(f'''
+        SELECT COUNT(*) FROM search_index JOIN search_documents d ON d.doc_id = search_index.rowid
+        WHERE {where_sql}
+    ''', params).fetchone()[0]
+
+    rows = conn.execute(f'''
+        SELECT d.conference_id, d.kind, d.source_id, d.parent_id, d.title, d.date, d.time, d.location, d.url,
+               bm25(search_index, {", ".join(map(str, COLUMN_WEIGHTS))}) AS score,
+               snippet(search_index, -1, '**', '**', '…', 12) AS snippet
+        FROM search_index JOIN search_documents d ON d.doc_id = search_index.rowid
+        WHERE {where_sql}
+        ORDER BY score
+        LIMIT ? OFFSET ?
+    ''', params + [max(1, min(int(limit), MAX_RESULTS)), max(0, int(offset))]).fetchall()
+
+    results = []
+    for row in rows:
+        result = dict(zip(('conference_id', 'kind', 'source_id', 'parent_id', 'title', 'date', 'time',
+                           'location', 'url', 'score', 'snippet'), row))
+        result['score'] = round(result['score'], 4)
+        results.append(result)
+
+    return {'results': results, 'total': total}
+
+
+def load_records(path):
+    """Records from a crawler output file: a JSON list or JSONL"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the full-text search index for a conference')
+    parser.add_argument('conference_id', help='Conference ID the records belong to (e.g. idweek2025)')
+    parser.add_argument('--sessions', help='Session crawler output (.json or .jsonl)')
+    parser.add_argument('--posters', help='Poster crawler output (.json or .jsonl)')
+    parser.add_argument('--db', default=os.environ.get('CONFERENCE_DB_PATH', os.path.join(os.path.dirname(__file__), 'conference_crawler.db')),
+                        help='API SQLite database')
+    args = parser.parse_args()
+
+    sessions = load_records(args.sessions) if args.sessions else []
+    posters = load_records(args.posters) if args.posters else []
+
+    started = time.time()
+    conn = sqlite3.connect(args.db, timeout=30, isolation_level=None)
+    try:
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            count = index_conference(conn, args.conference_id, sessions, posters)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute("INSERT INTO search_index (search_index) VALUES ('optimize')")
+    finally:
+        conn.close()
+
+    logger.info(f"Indexed {count} documents for {args.conference_id} "
+                f"({len(sessions)} sessions, {len(posters)} posters) in {time.time() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
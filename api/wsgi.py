@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for serving the Conference Crawler API in production
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Each worker process imports this module and opens its own connection pool.
+On SIGTERM the open change feeds are ended first, so the graceful shutdown
+only waits for ordinary requests, and the pool is closed when the worker exits.
+"""
+
+import signal
+import threading
+
+from app import app, change_notifier, db_pool
+
+
+def shutdown():
+    """End open change feeds and close the worker's database connections"""
+    change_notifier.close()
+    db_pool.close_all()
+
+
+def install_sigterm_handler():
+    """Chain onto the server's SIGTERM handler to end change feeds as soon as shutdown starts"""
+    if threading.current_thread() is not threading.main_thread():
+        return
+
+    previous = signal.getsignal(signal.SIGTERM)
+
+    def handle_sigterm(signum, frame):
+        change_notifier.close()
+        if callable(previous):
+            previous(signum, frame)
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+
+install_sigterm_handler()
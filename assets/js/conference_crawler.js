@@ -183,14 +183,15 @@ function loadMSDData() {
 function loadSessionsData() {
     console.log('Loading combined sessions and posters data...');
 
-    // Load combined data file
-    fetch(dataUrl('idweek2025_combined.json'))
+    // Load combined data file (newline-delimited JSON, one item per line)
+    fetch(dataUrl('idweek2025_combined.ndjson'))
         .then(response => {
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
             }
-            return response.json();
+            return response.text();
         })
+        .then(text => text.split('\n').filter(line => line.trim()).map(line => JSON.parse(line)))
         .then(allSessions => {
             console.log(`Successfully loaded ${allSessions.length} items`);
 
@@ -247,11 +248,11 @@ function loadSessionsData() {
         })
         .catch(error => {
             console.error('Failed to load combined data:', error);
-            console.error('Make sure idweek2025_combined.json exists and is valid JSON');
+            console.error('Make sure idweek2025_combined.ndjson exists (run combine_sessions_posters.py)');
             document.getElementById('sessions-container').innerHTML = `
                 <div class="no-data">
                     <h3>Error Loading Data</h3>
-                    <p>Could not load idweek2025_combined.json</p>
+                    <p>Could not load idweek2025_combined.ndjson</p>
                     <button class="btn" onclick="document.getElementById('json-upload').click()">
                         📁 Upload Sessions File
                     </button>